@@ -0,0 +1,163 @@
+"""GUI 시작 시 import 시간 측정 스크립트
+
+`python -X importtime`으로 메인 윈도우 모듈을 import 하는 데 걸리는 시간을 측정하고,
+결과를 benchmarks/import_time_history.jsonl 에 기록한다.
+
+다음 경우 종료 코드 1을 반환하므로 빌드 전에 실행하면 시작 속도 저하를 잡을 수 있다.
+    - 로그인/실행/내보내기 시점까지 미뤄야 하는 무거운 패키지가 시작 시 import 된 경우
+    - 측정 시간이 --budget-ms 를 넘은 경우
+    - 이전 기록 중 최고 기록보다 --tolerance 이상 느려진 경우
+
+사용법:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 5 --budget-ms 1500 --top 20
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(ROOT_DIR, "benchmarks", "import_time_history.jsonl")
+
+# 시작 시 import 되면 안 되는 패키지 (사용 시점에 import)
+DEFERRED_PACKAGES = [
+    "pandas",            # 사용하지 않음 (내보내기는 utils.exporter)
+    "openpyxl",          # 엑셀 내보내기 시
+    "pyarrow",           # Parquet 내보내기 시
+    "selenium",          # 로그인 시
+    "webdriver_manager", # 로그인 시
+    "pyperclip",         # 로그인 시
+    "openai",            # 작업 실행/API 키 검증 시
+    "bs4",               # 검색 결과/게시글 파싱 시
+]
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module):
+    """모듈을 새 인터프리터에서 import 하고 -X importtime 결과를 파싱
+
+    Returns:
+        dict: {'total_us': 대상 모듈 누적 시간, 'modules': {이름: 누적 시간(us)}}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if result.returncode != 0:
+        last_line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+        raise RuntimeError(f"{module} import 실패: {last_line}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+
+    total_us = modules.get(module)
+    if total_us is None:
+        # 대상 모듈이 이미 다른 모듈에 의해 import 된 경우 최상위 항목들의 합
+        total_us = sum(us for name, us in modules.items() if "." not in name)
+    return {"total_us": total_us, "modules": modules}
+
+
+def load_history():
+    """이전 측정 기록 로드"""
+    if not os.path.exists(HISTORY_FILE):
+        return []
+    history = []
+    with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    history.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return history
+
+
+def git_revision():
+    """현재 커밋 해시 (git이 없으면 빈 문자열)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI 시작 import 시간 측정")
+    parser.add_argument("--module", default="main.gui", help="측정할 모듈 (기본값: main.gui)")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수, 최솟값을 기록 (기본값: 3)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 느린 모듈 수 (기본값: 15)")
+    parser.add_argument("--budget-ms", type=float, default=1500, help="허용 시간(ms) (기본값: 1500)")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="최고 기록 대비 허용 증가율 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--no-record", action="store_true", help="기록 파일에 저장하지 않음")
+    args = parser.parse_args()
+
+    try:
+        runs = [measure(args.module) for _ in range(max(1, args.runs))]
+    except RuntimeError as e:
+        print(str(e))
+        return 2
+
+    best = min(runs, key=lambda run: run["total_us"])
+    total_ms = best["total_us"] / 1000
+    print(f"{args.module} import 시간: {total_ms:.1f}ms (최솟값, {len(runs)}회 측정)")
+
+    print(f"\n누적 시간 상위 {args.top}개 모듈:")
+    slowest = sorted(best["modules"].items(), key=lambda item: item[1], reverse=True)
+    for name, us in slowest[:args.top]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+    failures = []
+
+    imported = sorted({name.split(".")[0] for name in best["modules"]} & set(DEFERRED_PACKAGES))
+    if imported:
+        failures.append(f"시작 시 import 되면 안 되는 패키지: {', '.join(imported)}")
+
+    if total_ms > args.budget_ms:
+        failures.append(f"허용 시간 초과: {total_ms:.1f}ms > {args.budget_ms:.0f}ms")
+
+    history = [record for record in load_history() if record.get("module") == args.module]
+    if history:
+        best_ms = min(record["total_ms"] for record in history)
+        if total_ms > best_ms * (1 + args.tolerance):
+            failures.append(f"최고 기록 대비 느려짐: {total_ms:.1f}ms (최고 {best_ms:.1f}ms)")
+
+    if not args.no_record:
+        record = {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "module": args.module,
+            "total_ms": round(total_ms, 1),
+            "deferred_imported": imported,
+        }
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    if failures:
+        print("\n[실패]")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n[통과]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""AI 분석용 본문 압축 비교 스크립트
+
+게시글 파일(JSON 배열 또는 JSONL, 각 항목에 title/content)로 기존 방식(앞 300자)과
+PromptCompressor 압축 결과의 게시글당 토큰 수를 비교한다. --ai 를 주면 두 방식으로 실제 AI 배치 분석을 돌려
+판정 일치율도 계산한다 (OPENAI_API_KEY 필요).
+
+--min-agreement 보다 일치율이 낮으면 종료 코드 1을 반환한다.
+
+사용법:
+    python benchmarks/prompt_compression.py posts.jsonl --command "교통사고 피해자가 쓴 글만 추출" --keywords 합의금,과실
+    python benchmarks/prompt_compression.py posts.jsonl --command "..." --budget 120 --ai
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from main.utils.prompt_compressor import PromptCompressor, estimate_tokens  # noqa: E402
+
+
+def load_posts(path):
+    """게시글 파일 읽기 (JSON 배열 또는 JSONL)"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read().strip()
+    if text.startswith("["):
+        posts = json.loads(text)
+    else:
+        posts = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [post for post in posts if post.get("content")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 분석용 본문 압축 비교")
+    parser.add_argument("posts", help="게시글 파일 (JSON 배열 또는 JSONL, title/content 필드)")
+    parser.add_argument("--command", required=True, help="AI 분석 명령어")
+    parser.add_argument("--keywords", default="", help="필터 키워드 (쉼표로 구분)")
+    parser.add_argument("--budget", type=int, default=150, help="게시글당 토큰 예산 (기본값: 150)")
+    parser.add_argument("--ai", action="store_true", help="두 방식으로 AI 분석을 실행해 판정 일치율 계산")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="--ai 사용 시 최소 일치율 (기본값: 0.95)")
+    args = parser.parse_args()
+
+    posts = load_posts(args.posts)
+    if not posts:
+        print(f"내용이 있는 게시글이 없습니다: {args.posts}")
+        return 2
+
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+    compressor = PromptCompressor(keywords, args.command, token_budget=args.budget)
+
+    start = time.perf_counter()
+    compressed = [compressor.compress(post["content"]) for post in posts]
+    compress_ms = (time.perf_counter() - start) * 1000 / len(posts)
+    truncated = [post["content"][:300] for post in posts]
+
+    before = [estimate_tokens(post["title"]) + estimate_tokens(text) for post, text in zip(posts, truncated)]
+    after = [estimate_tokens(post["title"]) + estimate_tokens(text) for post, text in zip(posts, compressed)]
+    kept_terms = sum(1 for text in compressed if any(term in text for term in compressor.terms))
+    had_terms = sum(1 for post in posts if any(term in post["content"] for term in compressor.terms))
+
+    print(f"게시글 {len(posts)}개, 검색 단어: {', '.join(compressor.terms) or '없음'}")
+    print(f"{'방식':<12}{'평균 토큰':>10}{'중앙값':>8}{'최대':>8}")
+    for name, tokens in (("앞 300자", before), (f"압축({args.budget})", after)):
+        print(f"{name:<12}{statistics.mean(tokens):>10.1f}{statistics.median(tokens):>8.0f}{max(tokens):>8}")
+    print(f"토큰 감소: {(1 - sum(after) / max(1, sum(before))) * 100:.1f}%, 압축 시간 {compress_ms:.2f}ms/게시글")
+    print(f"검색 단어가 본문 어딘가에 있는 게시글 {had_terms}개 중 압축 결과에 남은 게시글 {kept_terms}개")
+
+    if not args.ai:
+        return 0
+
+    from main.api.ai_generator import AIGenerator
+
+    ai_generator = AIGenerator()
+    results_before = ai_generator.analyze_posts_batch(
+        [{"title": post["title"], "content": text} for post, text in zip(posts, truncated)], args.command)
+    results_after = ai_generator.analyze_posts_batch(
+        [{"title": post["title"], "content": text} for post, text in zip(posts, compressed)], args.command,
+        content_limit=None)
+    agreement = sum(a == b for a, b in zip(results_before, results_after)) / len(posts)
+    print(f"판정 일치율: {agreement * 100:.1f}% (일치 판정 앞 300자 {sum(results_before)}개, 압축 {sum(results_after)}개)")
+    return 0 if agreement >= args.min_agreement else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
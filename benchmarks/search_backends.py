@@ -0,0 +1,180 @@
+"""검색 백엔드(HTML/JSON) 비교 스크립트
+
+같은 검색 조건으로 두 백엔드의 응답을 녹화해 두고, 녹화한 응답으로 게시글 목록이 같은지(parity)와
+페이지당 응답 크기, 파싱 시간을 비교한다. 녹화 파일은 benchmarks/fixtures/search/ 에 저장된다.
+
+게시글 목록이 다르거나 녹화한 게시글이 없으면 종료 코드 1을 반환한다.
+저장소에는 실제 응답 대신 같은 형식으로 만든 샘플(meta.json 의 source 가 synthetic)이 들어 있으므로,
+응답 크기/파싱 시간을 비교하려면 먼저 record 로 실제 응답을 녹화한다.
+
+사용법:
+    python benchmarks/search_backends.py record "검색어" --pages 3
+    python benchmarks/search_backends.py compare
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT_DIR, "benchmarks", "fixtures", "search")
+sys.path.insert(0, ROOT_DIR)
+
+from main.api.search_backends import SEARCH_BACKENDS, SearchBackend  # noqa: E402
+
+# 비교할 백엔드 (Open API는 결과 집합과 필드가 달라 parity 대상이 아님)
+BACKENDS = {name: SEARCH_BACKENDS[name] for name in ("html", "json")}
+
+# parity 비교에 사용할 필드
+COMPARE_FIELDS = ("title", "url", "cafe_id", "article_id", "cafe_name", "post_date")
+
+
+class RecordingBackend(SearchBackend):
+    """다른 백엔드의 응답 본문을 페이지별 파일로 저장하는 백엔드"""
+
+    def __init__(self, backend, directory):
+        self.backend = backend
+        self.directory = directory
+        self.name = backend.name
+
+    def request(self, session, headers, params):
+        response = self.backend.request(session, headers, params)
+        path = os.path.join(self.directory, f"{self.backend.name}_{int(params['start']):04d}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(response.text)
+        return response
+
+    def parse_response(self, text):
+        return self.backend.parse_response(text)
+
+
+def record(args):
+    from main.api.search import NaverCafeSearchAPI
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name, backend_class in BACKENDS.items():
+        api = NaverCafeSearchAPI(backend=RecordingBackend(backend_class(), FIXTURE_DIR))
+        result = api.search(args.query, max_items=args.pages * 30, cafe_where=args.cafe_where,
+                            date_option=args.date_option, sort=args.sort, page_delay=args.page_delay)
+        print(f"[{name}] {result.get('total_count', 0)}개, {result.get('bytes', 0):,} bytes "
+              f"({result.get('status')})")
+
+    meta = {"source": "recorded", "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+    meta.update({key: value for key, value in vars(args).items() if key not in ("func", "command")})
+    with open(os.path.join(FIXTURE_DIR, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=4)
+    return 0
+
+
+def load_meta():
+    """녹화 정보 (meta.json)"""
+    path = os.path.join(FIXTURE_DIR, "meta.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_fixtures(name):
+    """백엔드별 녹화 파일 {start: 응답 본문}"""
+    fixtures = {}
+    prefix = f"{name}_"
+    for filename in sorted(os.listdir(FIXTURE_DIR)):
+        if filename.startswith(prefix) and filename.endswith(".txt"):
+            start = int(filename[len(prefix):-4])
+            with open(os.path.join(FIXTURE_DIR, filename), "r", encoding="utf-8") as f:
+                fixtures[start] = f.read()
+    return fixtures
+
+
+def measure_parse(backend, text, runs):
+    """파싱 시간(ms, 최솟값)과 결과"""
+    best = None
+    items = []
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        items = backend.parse_response(text)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, items
+
+
+def compare(args):
+    if not os.path.isdir(FIXTURE_DIR):
+        print(f"녹화 파일이 없습니다: {FIXTURE_DIR} (먼저 record 실행)")
+        return 2
+
+    meta = load_meta()
+    print(f"녹화 출처: {meta.get('source', '알 수 없음')} (검색어: {meta.get('query', '-')})")
+    if meta.get("note"):
+        print(f"  {meta['note']}")
+
+    summary = {}
+    items_by_backend = {}
+    for name, backend_class in BACKENDS.items():
+        backend = backend_class()
+        fixtures = load_fixtures(name)
+        total_bytes = 0
+        total_ms = 0.0
+        items = []
+        for start, text in fixtures.items():
+            elapsed, page_items = measure_parse(backend, text, args.runs)
+            total_bytes += len(text.encode("utf-8"))
+            total_ms += elapsed
+            items.extend(page_items)
+        pages = max(1, len(fixtures))
+        summary[name] = {"pages": len(fixtures), "items": len(items),
+                         "bytes_per_page": total_bytes // pages, "parse_ms_per_page": total_ms / pages}
+        items_by_backend[name] = items
+
+    print(f"{'백엔드':<8}{'페이지':>6}{'게시글':>8}{'bytes/page':>14}{'parse ms/page':>16}")
+    for name, row in summary.items():
+        print(f"{name:<8}{row['pages']:>6}{row['items']:>8}{row['bytes_per_page']:>14,}{row['parse_ms_per_page']:>16.2f}")
+
+    # parity: 기준(HTML) 백엔드와 게시글 순서/필드 비교
+    baseline_name = "html"
+    baseline = [tuple(item.get(field) for field in COMPARE_FIELDS) for item in items_by_backend.get(baseline_name, [])]
+    failures = [f"{name}: 녹화한 게시글이 없습니다" for name, row in summary.items() if not row["items"]]
+    for name, items in items_by_backend.items():
+        if name == baseline_name:
+            continue
+        rows = [tuple(item.get(field) for field in COMPARE_FIELDS) for item in items]
+        if rows != baseline:
+            missing = len(set(baseline) - set(rows))
+            extra = len(set(rows) - set(baseline))
+            failures.append(f"{name}: 기준과 다름 (누락 {missing}개, 추가 {extra}개, 순서 포함 비교)")
+
+    if failures:
+        print("\n[실패]")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n[통과] 모든 백엔드의 게시글 목록이 같습니다.")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 백엔드 비교")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="두 백엔드의 응답 녹화")
+    record_parser.add_argument("query", help="검색어")
+    record_parser.add_argument("--pages", type=int, default=3, help="녹화할 페이지 수 (기본값: 3)")
+    record_parser.add_argument("--cafe-where", default="articleg", help="검색 대상 (기본값: articleg)")
+    record_parser.add_argument("--date-option", type=int, default=4, help="기간 옵션 (기본값: 4 = 1개월)")
+    record_parser.add_argument("--sort", default="date", help="정렬 (기본값: date, 녹화 사이 결과 변동을 줄이기 위해)")
+    record_parser.add_argument("--page-delay", type=float, default=1, help="페이지 간 딜레이(초)")
+    record_parser.set_defaults(func=record)
+
+    compare_parser = subparsers.add_parser("compare", help="녹화한 응답으로 parity/크기/파싱 시간 비교")
+    compare_parser.add_argument("--runs", type=int, default=5, help="페이지당 파싱 반복 횟수, 최솟값 사용 (기본값: 5)")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,8 @@ def main():
     
     # 메인 윈도우 생성 및 표시
     window = MainWindow()
+    if not window.licence_ok:
+        sys.exit(1)  # 라이선스 확인 실패 또는 입력 취소
     window.show()
     
     # 애플리케이션 실행
@@ -1,11 +1,55 @@
 from main.utils.openai_utils import OpenAIGenerator
 import os
-import openai
 import json
 import time
 import logging
+import threading
+
+# 게시글 필터 지시문
+# 프롬프트는 [system: 지시문 + 추출 조건] + [user: 게시글 목록] 순서로 구성한다. system 메시지는 같은 명령어라면
+# 요청마다 바이트 단위로 같아야 제공자 측 프롬프트 캐시가 적용되므로 게시글마다 달라지는 값을 넣지 않는다.
+# (OpenAI는 앞부분이 1024토큰 이상인 요청부터 캐시하므로 명령어가 길수록 효과가 크다)
+SINGLE_FILTER_INSTRUCTIONS = """당신은 엄격한 게시글 필터입니다. 아래 기준에 따라 게시글이 추출 조건에 정확히 부합하는지 판단하세요:
+
+1. 추출 조건을 매우 엄격하게 해석하세요.
+2. 모호하거나 간접적인 관련성만 있는 글은 반드시 False로 처리하세요.
+3. 관련 키워드가 단순히 언급되었다고 해서 True가 아닙니다.
+4. 게시글 내용이 추출 조건과 "100% 명확하게" 일치해야만 True입니다.
+5. 조금이라도 관련이 없거나 의심스러운 경우 반드시 False 처리하세요.
+
+최종 판단 과정:
+1. 게시글의 내용이 추출 조건에서 요구하는 정확한 주제/상황/조건과 완벽히 일치하는가?
+2. 게시글 내용이 조건에서 요구하는 모든 요소를 포함하고 있는가?
+3. 조금이라도 불일치하거나 불확실한 부분이 있다면 False 처리하세요.
+
+다음 형식으로 응답해주세요:
+1. 관련성: [True/False]
+2. 매칭된 키워드: [매칭된 핵심 개념들]
+3. 분석: [판단 근거에 대한 간략한 설명]"""
+
+BATCH_FILTER_INSTRUCTIONS = """당신은 엄격한 게시글 필터입니다. 사용자가 보내는 게시글 목록의 각 게시글이 아래 추출 조건에 맞는지 판단하세요.
+
+- 각 게시글마다 한 줄에 True 또는 False로만 답변하세요. 이유나 설명은 쓰지 마세요.
+- 게시글 순서대로, 게시글 수와 같은 줄 수로 답하세요.
+- 조건과 정확히 일치하는 경우만 True, 불확실하면 False로 응답하세요."""
+
+TRIAGE_INSTRUCTIONS = """사용자가 보내는 게시글 목록의 각 게시글이 아래 추출 조건에 맞는지 제목과 미리보기만 보고 판단하세요.
+
+- 각 게시글마다 한 줄에 하나씩 Y, N, ? 중 하나만 답하세요.
+- Y: 미리보기만으로 조건에 확실히 맞음 / N: 확실히 맞지 않음 / ?: 본문을 봐야 알 수 있음
+- 조금이라도 불확실하면 ?로 답하세요."""
+
+MULTI_FILTER_INSTRUCTIONS = """당신은 엄격한 게시글 필터입니다. 사용자가 보내는 게시글 목록의 각 게시글이 아래 추출 조건들에 각각 맞는지 판단하세요.
+
+- 게시글마다 한 줄에 "게시글 번호: 판정" 형식으로 답하세요. 판정은 조건 순서대로 T 또는 F를 공백으로 구분해 적습니다.
+  예) 조건이 3개일 때 "1: T F F"
+- 이유나 설명은 쓰지 마세요. 게시글 순서대로, 게시글 수와 같은 줄 수로 답하세요.
+- 각 조건과 정확히 일치하는 경우만 T, 불확실하면 F로 응답하세요."""
+
 
 class AIGenerator:
+    FILTER_MODEL = "gpt-4o-mini"  # 게시글 필터/분류에 사용하는 모델
+
     def __init__(self, api_key=None):
         """AI 생성기 초기화
         
@@ -16,6 +60,89 @@ class AIGenerator:
         self.generator = OpenAIGenerator(api_key=self.api_key)
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger("AIGenerator")
+        # 토큰 사용량 (cached_tokens: 제공자 측 프롬프트 캐시로 처리된 입력 토큰)
+        self._usage_lock = threading.Lock()
+        self.usage = {'requests': 0, 'prompt_tokens': 0, 'cached_tokens': 0, 'completion_tokens': 0}
+        # 스레드별 분석 실패 횟수 (실패한 배치는 모두 False 로 채워지므로 판정 캐시에 넣지 않도록 확인용)
+        self._thread_state = threading.local()
+    
+    @staticmethod
+    def build_system_prompt(instructions, command):
+        """지시문과 추출 조건으로 system 메시지 구성 (같은 명령어면 항상 같은 문자열)"""
+        return f"{instructions}\n\n추출 조건: {command.strip()}"
+    
+    @staticmethod
+    def build_multi_system_prompt(commands):
+        """여러 추출 조건용 system 메시지 구성 (조건 목록과 순서가 같으면 항상 같은 문자열)"""
+        conditions = "\n".join(f"조건 {idx+1}: {command.strip()}" for idx, command in enumerate(commands))
+        return f"{MULTI_FILTER_INSTRUCTIONS}\n\n추출 조건:\n{conditions}"
+    
+    @classmethod
+    def batch_system_prompt(cls, commands):
+        """명령어 목록을 배치 분석할 때 보내는 system 메시지 (1개면 analyze_posts_batch, 여러 개면 analyze_posts_multi)"""
+        if len(commands) == 1:
+            return cls.build_system_prompt(BATCH_FILTER_INSTRUCTIONS, commands[0])
+        return cls.build_multi_system_prompt(commands)
+    
+    @staticmethod
+    def parse_verdict_vectors(text, post_count, command_count):
+        """여러 조건 배치 응답 파싱
+
+        Returns:
+            list or None: 게시글별 [조건별 True/False], 줄 수나 판정 수가 맞지 않으면 None
+        """
+        vectors = []
+        for line in text.strip().split('\n'):
+            if ':' in line:
+                line = line.split(':', 1)[1]
+            verdicts = [token.strip('.,[]') for token in line.upper().split()]
+            verdicts = [token in ('T', 'TRUE') for token in verdicts if token in ('T', 'F', 'TRUE', 'FALSE')]
+            if verdicts:
+                vectors.append(verdicts)
+        if len(vectors) != post_count or any(len(vector) != command_count for vector in vectors):
+            return None
+        return vectors
+    
+    @staticmethod
+    def build_post_list(posts, content_label="내용", content_limit=None):
+        """게시글 목록 user 메시지 구성"""
+        lines = []
+        for idx, post in enumerate(posts):
+            content = post.get('content', '') or ''
+            if content_limit:
+                content = content[:content_limit]
+            lines.append(f"게시글 {idx+1}:\n제목: {post.get('title', '')}\n{content_label}: {content}")
+        return "\n\n".join(lines)
+    
+    def _record_usage(self, response):
+        """응답의 usage 필드로 토큰 사용량 누적"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached_tokens = (getattr(details, 'cached_tokens', 0) or 0) if details else 0
+        with self._usage_lock:
+            self.usage['requests'] += 1
+            self.usage['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+            self.usage['cached_tokens'] += cached_tokens
+            self.usage['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+    
+    def _record_failure(self):
+        """현재 스레드의 분석 실패 기록 (결과를 False 로 채운 배치)"""
+        self._thread_state.failures = getattr(self._thread_state, 'failures', 0) + 1
+    
+    def pop_failures(self):
+        """현재 스레드에서 마지막 호출 이후 실패한 배치 수 (호출하면 0으로 초기화)"""
+        failures = getattr(self._thread_state, 'failures', 0)
+        self._thread_state.failures = 0
+        return failures
+    
+    def usage_summary(self):
+        """토큰 사용량 요약 (캐시 적중률 포함)"""
+        with self._usage_lock:
+            summary = dict(self.usage)
+        summary['cached_ratio'] = round(summary['cached_tokens'] / summary['prompt_tokens'], 3) if summary['prompt_tokens'] else 0.0
+        return summary
     
     def validate_api_key(self):
         """API 키 유효성 검사
@@ -28,6 +155,7 @@ class AIGenerator:
         if not self.api_key:
             return False, "API 키가 입력되지 않았습니다."
             
+        import openai  # 프로그램 시작 속도를 위해 사용 시점에 import
         try:
             # OpenAI 클라이언트 설정
             self.logger.info("API 키 검증 중...")
@@ -70,6 +198,7 @@ class AIGenerator:
                 - matched_keywords (list): 매칭된 키워드 목록
                 - analysis (str): 분석 내용 요약
         """
+        import openai
         try:
             # 로깅 시작
             self.logger.info(f"게시글 분석 시작: 제목=\"{title}\"")
@@ -82,41 +211,22 @@ class AIGenerator:
             # OpenAI 클라이언트 설정
             openai.api_key = self.api_key
             
-            # 분석 프롬프트 구성
-            prompt = f"""
-            제목: {title}
-            내용: {content}
-            
-            추출 조건: {command}
-            
-            당신은 엄격한 게시글 필터입니다. 아래 기준에 따라 게시글이 추출 조건에 정확히 부합하는지 판단하세요:
-            
-            1. 추출 조건을 매우 엄격하게 해석하세요.
-            2. 모호하거나 간접적인 관련성만 있는 글은 반드시 False로 처리하세요.
-            3. 관련 키워드가 단순히 언급되었다고 해서 True가 아닙니다.
-            4. 게시글 내용이 추출 조건과 "100% 명확하게" 일치해야만 True입니다.
-            5. 조금이라도 관련이 없거나 의심스러운 경우 반드시 False 처리하세요.
-            
-            최종 판단 과정:
-            1. 게시글의 내용이 추출 조건에서 요구하는 정확한 주제/상황/조건과 완벽히 일치하는가?
-            2. 게시글 내용이 조건에서 요구하는 모든 요소를 포함하고 있는가?
-            3. 조금이라도 불일치하거나 불확실한 부분이 있다면 False 처리하세요.
-            
-            다음 형식으로 응답해주세요:
-            1. 관련성: [True/False]
-            2. 매칭된 키워드: [매칭된 핵심 개념들]
-            3. 분석: [판단 근거에 대한 간략한 설명]
-            """
+            # 분석 프롬프트 구성 (고정된 지시문 + 추출 조건을 앞에, 게시글을 뒤에)
+            messages = [
+                {"role": "system", "content": self.build_system_prompt(SINGLE_FILTER_INSTRUCTIONS, command)},
+                {"role": "user", "content": f"제목: {title}\n내용: {content}"}
+            ]
             
             # OpenAI API 호출
             self.logger.info("OpenAI API 호출 중...")
             start_time = time.time()
             response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
+                model=self.FILTER_MODEL,
+                messages=messages,
                 temperature=0.1,  # 더 결정적인 응답을 위해 temperature 낮춤
                 max_tokens=500
             )
+            self._record_usage(response)
             elapsed_time = time.time() - start_time
             self.logger.info(f"API 응답 완료 (소요 시간: {elapsed_time:.2f}초)")
             
@@ -169,7 +279,7 @@ class AIGenerator:
                 "analysis": f"분석 중 오류 발생: {str(e)}"
             }
 
-    def analyze_posts_batch(self, posts, command, batch_size=20, progress_callback=None):
+    def analyze_posts_batch(self, posts, command, batch_size=20, progress_callback=None, content_limit=300):
         """여러 게시글을 배치로 처리하여 분석
         
         Args:
@@ -178,15 +288,18 @@ class AIGenerator:
             batch_size (int): 한 번에 처리할 게시글 수 (기본값: 20)
             progress_callback (callable, optional): 진행 상황 콜백 함수
                 - 호출 시 (batch_index, batch_count, is_processing) 전달
+            content_limit (int, optional): 게시글 내용 최대 글자 수 (None이면 자르지 않음, 미리 압축한 경우)
             
         Returns:
             list: 각 게시글의 분석 결과 (True/False)
         """
+        import openai
         try:
             self.logger.info(f"배치 분석 시작: {len(posts)}개 게시글, 배치 크기: {batch_size}")
             
             # 결과 저장용 리스트
             results = []
+            system_prompt = self.build_system_prompt(BATCH_FILTER_INSTRUCTIONS, command)
             
             # 전체 배치 수 계산
             batch_count = (len(posts) + batch_size - 1) // batch_size
@@ -201,45 +314,28 @@ class AIGenerator:
                 if progress_callback:
                     progress_callback(batch_index, batch_count, True)
                 
-                # 배치 내 각 게시글 정보 구성
-                batch_texts = []
-                for post in batch:
-                    title = post.get('title', '')
-                    content = post.get('content', '')
-                    # 내용은 300자로 제한하여 분석 속도 향상
-                    content_preview = content[:300] if content else ""
-                    post_text = f"제목: {title}\n내용: {content_preview}"
-                    batch_texts.append(post_text)
-                
                 # OpenAI API 설정
                 openai.api_key = self.api_key
                 
-                # 배치 분석 프롬프트 구성
-                batch_prompt = f"""
-                다음 게시글들이 "{command}" 조건에 맞는지 판단하세요.
-                
-                각 게시글마다 True 또는 False로만 답변하세요. 이유나 설명은 쓰지 마세요.
-                조건과 정확히 일치하는 경우만 True, 불확실하면 False로 응답하세요.
-                
-                게시글:
-                """
-                
-                for idx, text in enumerate(batch_texts):
-                    batch_prompt += f"\n게시글 {idx+1}:\n{text}\n"
-                
-                batch_prompt += "\n결과 (True 또는 False만 입력):\n"
+                # 배치 분석 프롬프트 구성 (system 메시지는 모든 배치에서 같고 게시글 목록만 달라짐)
+                # 내용은 content_limit 글자로 제한하여 분석 속도 향상
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": self.build_post_list(batch, content_limit=content_limit)}
+                ]
                 
                 # OpenAI API 호출
                 self.logger.info("배치 분석 API 호출 중...")
                 start_time = time.time()
                 try:
                     response = openai.chat.completions.create(
-                        model="gpt-4o-mini",
-                        messages=[{"role": "user", "content": batch_prompt}],
+                        model=self.FILTER_MODEL,
+                        messages=messages,
                         temperature=0.1,
                         max_tokens=200,
                         timeout=10  # 10초 타임아웃 설정
                     )
+                    self._record_usage(response)
                     elapsed_time = time.time() - start_time
                     self.logger.info(f"배치 분석 API 응답 완료 (소요 시간: {elapsed_time:.2f}초)")
                 
@@ -249,6 +345,7 @@ class AIGenerator:
                 except (openai.Timeout, TimeoutError) as e:
                     self.logger.error(f"배치 분석 API 호출 타임아웃: {str(e)}")
                     # 타임아웃 발생 시 모든 게시글에 대해 False 반환
+                    self._record_failure()
                     batch_false_values = [False] * len(batch)
                     results.extend(batch_false_values)
                     
@@ -272,11 +369,13 @@ class AIGenerator:
                 except Exception as e:
                     self.logger.error(f"응답 파싱 중 오류 발생: {str(e)}")
                     # 파싱 오류 시 모든 게시글을 False로 처리
+                    self._record_failure()
                     true_false_values = [False] * len(batch)
                 
                 # 결과 개수가 일치하지 않을 경우 처리
                 if len(true_false_values) != len(batch):
                     self.logger.error(f"배치 분석 결과 개수 불일치: 요청={len(batch)}, 응답={len(true_false_values)}")
+                    self._record_failure()
                     # 부족한 결과는 기본값 False로 채움
                     while len(true_false_values) < len(batch):
                         true_false_values.append(False)
@@ -300,8 +399,145 @@ class AIGenerator:
         except Exception as e:
             self.logger.error(f"배치 분석 중 오류 발생: {str(e)}")
             # 오류 발생 시 모든 게시글에 대해 False 반환
+            self._record_failure()
             return [False] * len(posts)
 
+    def analyze_posts_multi(self, posts, commands, batch_size=20, progress_callback=None, content_limit=300):
+        """여러 필터링 명령을 한 번의 요청으로 배치 분석
+
+        게시글 목록은 한 번만 보내고 조건별 판정을 벡터로 받으므로, 명령이 늘어도 입력 토큰은
+        조건 문장만큼만 늘어난다.
+        
+        Args:
+            posts (list): 분석할 게시글 목록 (각 항목은 {'title': '제목', 'content': '내용'} 형태)
+            commands (list): 필터링 명령 목록
+            batch_size (int): 한 번에 처리할 게시글 수 (기본값: 20)
+            progress_callback (callable, optional): 진행 상황 콜백 함수
+                - 호출 시 (batch_index, batch_count, is_processing) 전달
+            content_limit (int, optional): 게시글 내용 최대 글자 수 (None이면 자르지 않음)
+            
+        Returns:
+            list: 게시글별 [명령별 True/False] (응답을 해석할 수 없는 배치는 모두 False)
+        """
+        import openai
+        openai.api_key = self.api_key
+        system_prompt = self.build_multi_system_prompt(commands)
+        results = []
+        batch_count = (len(posts) + batch_size - 1) // batch_size
+        self.logger.info(f"다중 조건 배치 분석 시작: {len(posts)}개 게시글, 조건 {len(commands)}개")
+        
+        for i in range(0, len(posts), batch_size):
+            batch_index = i // batch_size + 1
+            batch = posts[i:i+batch_size]
+            if progress_callback:
+                progress_callback(batch_index, batch_count, True)
+                
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": self.build_post_list(batch, content_limit=content_limit)}
+            ]
+            vectors = None
+            try:
+                start_time = time.time()
+                response = openai.chat.completions.create(
+                    model=self.FILTER_MODEL,
+                    messages=messages,
+                    temperature=0.1,
+                    max_tokens=20 + len(batch) * (6 + 2 * len(commands)),
+                    timeout=15
+                )
+                self._record_usage(response)
+                self.logger.info(f"다중 조건 배치 분석 API 응답 완료 (소요 시간: {time.time() - start_time:.2f}초)")
+                vectors = self.parse_verdict_vectors(response.choices[0].message.content, len(batch), len(commands))
+            except Exception as e:
+                self.logger.error(f"다중 조건 배치 분석 중 오류 발생: {str(e)}")
+                
+            if vectors is None:
+                self.logger.error(f"다중 조건 배치 분석 결과를 해석할 수 없어 모두 False 처리: 요청={len(batch)}")
+                self._record_failure()
+                vectors = [[False] * len(commands) for _ in batch]
+            results.extend(vectors)
+            
+            if progress_callback:
+                progress_callback(batch_index, batch_count, False)
+                
+        return results
+
+    # 스니펫 분류 결과
+    TRIAGE_YES = "yes"        # 제목/미리보기만으로 조건에 맞음
+    TRIAGE_NO = "no"          # 제목/미리보기만으로 조건에 맞지 않음
+    TRIAGE_UNSURE = "unsure"  # 본문을 확인해야 판단 가능
+
+    def triage_posts_batch(self, posts, command, batch_size=30, progress_callback=None):
+        """제목과 검색 결과 미리보기(스니펫)만으로 게시글을 1차 분류
+
+        본문을 가져오기 전에 확실히 맞거나 확실히 아닌 게시글을 걸러서, 판단이 애매한 게시글만
+        본문 수집과 본 분석을 거치게 한다. 응답을 해석할 수 없는 게시글은 '애매함'으로 처리한다.
+        
+        Args:
+            posts (list): 분류할 게시글 목록 (각 항목은 {'title': '제목', 'content': '미리보기'} 형태)
+            command (str): 필터링 명령
+            batch_size (int): 한 번에 처리할 게시글 수 (기본값: 30)
+            progress_callback (callable, optional): 진행 상황 콜백 함수
+                - 호출 시 (batch_index, batch_count, is_processing) 전달
+            
+        Returns:
+            list: 각 게시글의 분류 결과 (TRIAGE_YES / TRIAGE_NO / TRIAGE_UNSURE)
+        """
+        import openai
+        results = [self.TRIAGE_UNSURE] * len(posts)
+        # 미리보기가 없는 게시글은 제목만으로 판단하지 않고 바로 본문 확인 대상으로 둔다
+        targets = [idx for idx, post in enumerate(posts) if post.get('content', '').strip()]
+        batch_count = (len(targets) + batch_size - 1) // batch_size
+        self.logger.info(f"스니펫 분류 시작: {len(targets)}/{len(posts)}개 게시글, 배치 크기: {batch_size}")
+        
+        openai.api_key = self.api_key
+        system_prompt = self.build_system_prompt(TRIAGE_INSTRUCTIONS, command)
+        for i in range(0, len(targets), batch_size):
+            batch_index = i // batch_size + 1
+            batch = targets[i:i+batch_size]
+            if progress_callback:
+                progress_callback(batch_index, batch_count, True)
+                
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": self.build_post_list([posts[post_idx] for post_idx in batch],
+                                                                 content_label="미리보기", content_limit=200)}
+            ]
+            
+            try:
+                start_time = time.time()
+                response = openai.chat.completions.create(
+                    model=self.FILTER_MODEL,
+                    messages=messages,
+                    temperature=0.1,
+                    max_tokens=10 + len(batch) * 4,
+                    timeout=10
+                )
+                self._record_usage(response)
+                self.logger.info(f"스니펫 분류 API 응답 완료 (소요 시간: {time.time() - start_time:.2f}초)")
+                answers = []
+                for line in response.choices[0].message.content.strip().split('\n'):
+                    token = line.strip().split(' ')[-1].strip('.:').upper() if line.strip() else ''
+                    if token in ('Y', 'N', '?'):
+                        answers.append(token)
+            except Exception as e:
+                self.logger.error(f"스니펫 분류 중 오류 발생: {str(e)}")
+                answers = []
+                
+            # 결과 개수가 맞지 않으면 순서를 믿을 수 없으므로 배치 전체를 애매함으로 둔다
+            if len(answers) == len(batch):
+                verdicts = {'Y': self.TRIAGE_YES, 'N': self.TRIAGE_NO, '?': self.TRIAGE_UNSURE}
+                for post_idx, answer in zip(batch, answers):
+                    results[post_idx] = verdicts[answer]
+            else:
+                self.logger.error(f"스니펫 분류 결과 개수 불일치: 요청={len(batch)}, 응답={len(answers)}")
+                
+            if progress_callback:
+                progress_callback(batch_index, batch_count, False)
+                
+        return results
+
 if __name__ == "__main__":
     ai_generator = AIGenerator()
     result = ai_generator.analyze_post_with_command("테스트 제목", "테스트 내용", "테스트 명령")
@@ -1,31 +1,66 @@
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.service import Service
+# selenium, webdriver_manager, pyperclip은 프로그램 시작 속도를 위해 로그인 시점에 import 한다.
 import platform
-import pyperclip
 import logging
 import requests
+import json
 import os
 import time
+from ..utils.session_store import SessionStore
 
 class NaverAuth:
-    def __init__(self):
+    # 세션 유효성 확인용 페이지 (로그아웃 상태면 로그인 페이지로 리다이렉트됨)
+    SESSION_CHECK_URL = 'https://nid.naver.com/user2/help/myInfo.nhn'
+    # chromedriver 경로/버전 캐시
+    DRIVER_CACHE_FILE = os.path.join("data", "chromedriver.json")
+    DRIVER_CACHE_MAX_AGE = 24 * 60 * 60  # 크롬 버전을 확인할 수 없을 때 캐시 유효 시간(초)
+
+    def __init__(self, session_store=None):
+        """
+        Args:
+            session_store (SessionStore, optional): 로그인 세션 저장소. 기본값은 account/sessions
+        """
         self.session = requests.Session()
         self.headers = None
         self.username = None
         self.password = None
+        self.session_store = session_store or SessionStore()
+        self.restored = False  # 마지막 로그인이 저장된 세션으로 처리되었는지 여부
         
     def set_credentials(self, username, password):
         """로그인 자격 증명 설정"""
         self.username = username
         self.password = password
         
-    def _open_web_mode(self):
+    def _open_web_mode(self, headless=False):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1280,900")
+
+        self.driver = webdriver.Chrome(service=Service(executable_path=self._resolve_chromedriver()),
+                                       options=options)
+        self.driver.set_page_load_timeout(120)
+
+    def _resolve_chromedriver(self):
+        """chromedriver 경로 반환 (설치된 크롬 버전과 함께 캐시)
+
+        캐시된 드라이버가 존재하고 크롬 메이저 버전이 같으면 ChromeDriverManager의
+        버전 확인/다운로드를 생략한다. 크롬 버전을 확인할 수 없으면 하루 동안 캐시를 사용한다.
+        """
+        browser_version = self._detect_chrome_version()
+        cache = self._load_driver_cache()
+        if cache and os.path.exists(cache.get('path', '')):
+            cached_major = str(cache.get('browser_version') or '').split('.')[0]
+            if browser_version:
+                if cached_major == browser_version.split('.')[0]:
+                    return cache['path']
+            elif time.time() - cache.get('resolved_at', 0) < self.DRIVER_CACHE_MAX_AGE:
+                return cache['path']
+
+        from webdriver_manager.chrome import ChromeDriverManager
         driver_path = ChromeDriverManager().install()
 
         # OS에 따라 다른 드라이버 경로 설정
@@ -34,8 +69,42 @@ class NaverAuth:
         else:
             correct_driver_path = os.path.join(os.path.dirname(driver_path), "chromedriver")
 
-        self.driver = webdriver.Chrome(service=Service(executable_path=correct_driver_path))
-        self.driver.set_page_load_timeout(120)
+        # 드라이버 버전은 webdriver_manager 설치 경로(.../<버전>/...)에서 추출
+        driver_version = next((part for part in reversed(correct_driver_path.replace('\\', '/').split('/'))
+                               if part.replace('.', '').isdigit()), '')
+        self._save_driver_cache({
+            'path': correct_driver_path,
+            'browser_version': browser_version or '',
+            'driver_version': driver_version,
+            'resolved_at': time.time()
+        })
+        return correct_driver_path
+
+    def _detect_chrome_version(self):
+        """설치된 크롬 버전 확인 (확인할 수 없으면 None)"""
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception as e:
+            logging.info(f"크롬 버전 확인 실패: {str(e)}")
+            return None
+
+    def _load_driver_cache(self):
+        try:
+            if os.path.exists(self.DRIVER_CACHE_FILE):
+                with open(self.DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logging.info(f"chromedriver 캐시 로드 실패: {str(e)}")
+        return None
+
+    def _save_driver_cache(self, cache):
+        try:
+            os.makedirs(os.path.dirname(self.DRIVER_CACHE_FILE), exist_ok=True)
+            with open(self.DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=4, ensure_ascii=False)
+        except Exception as e:
+            logging.info(f"chromedriver 캐시 저장 실패: {str(e)}")
 
     def login(self, username=None, password=None):
         """네이버 로그인 (자격 증명 사용)"""
@@ -46,11 +115,17 @@ class NaverAuth:
         if not self.username or not self.password:
             return False, None
             
+        # 저장된 세션이 아직 유효하면 브라우저 로그인 생략
+        self.restored = self.restore_session(self.username)
+        if self.restored:
+            return True, self.get_headers()
+            
         # 기존 로그인 로직 사용
         success = self._login_with_credentials(self.username, self.password)
         
         if success:
             try:
+                self.session_store.save(self.username, self.headers)
                 return True, self.get_headers()
             except Exception as e:
                 print(f"폴더 생성 중 오류 발생: {str(e)}")
@@ -60,30 +135,33 @@ class NaverAuth:
     def _login_with_credentials(self, username, password):
         """실제 로그인 처리 (기존 login 메서드 내용)"""
         self._open_web_mode()
+        try:
+            headers = self._login_in_current_tab(username, password)
+        finally:
+            self.driver.quit()
+            
+        if headers:
+            self.headers = headers
+            return True
+        return False
+
+    def _login_in_current_tab(self, username, password, headless=False):
+        """현재 탭에서 로그인 후 헤더 반환 (실패 시 None, 브라우저는 닫지 않음)"""
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.common.by import By
+
         self.driver.get("https://nid.naver.com/nidlogin.login?mode=form")
 
         # 아이디 입력
         id_input = WebDriverWait(self.driver, 10).until(
             EC.element_to_be_clickable((By.ID, "id"))
         )
-        id_input.click()
-        pyperclip.copy(username)
-        
-        actions = ActionChains(self.driver)
-        if platform.system() == 'Darwin':  # macOS
-            actions.key_down(Keys.COMMAND).send_keys('v').key_up(Keys.COMMAND).perform()
-        else:  # Windows and others
-            actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+        self._paste_into(id_input, username, headless)
 
         # 패스워드 입력
         pw_input = self.driver.find_element(By.ID, "pw")
-        pw_input.click()
-        pyperclip.copy(password)
-        
-        if platform.system() == 'Darwin':  # macOS
-            actions.key_down(Keys.COMMAND).send_keys('v').key_up(Keys.COMMAND).perform()
-        else:  # Windows and others
-            actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+        self._paste_into(pw_input, password, headless)
 
         # 로그인 버튼 클릭
         login_btn = self.driver.find_element(By.ID, "log.login")
@@ -96,8 +174,7 @@ class NaverAuth:
             error_msg = err_common.find_element(By.CSS_SELECTOR ,".error_message")
             if error_msg.text:
                 logging.info("로그인 실패")
-                self.driver.quit()
-                return False
+                return None
         except:
             logging.info("로그인 실패메세지 pass")
 
@@ -126,7 +203,7 @@ class NaverAuth:
             )
         except:
             logging.info("메인 페이지 접근 실패")
-            return False
+            return None
 
         cookies = self.driver.get_cookies()
         result_cookie_str = ""
@@ -137,17 +214,108 @@ class NaverAuth:
         
         if cookies:
             user_agent = self.driver.execute_script("return navigator.userAgent;")
-            self.headers = {
+            return {
                 "x-cafe-product": "pc",
                 'Cookie': result_cookie_str.strip(),
                 'Referer': 'https://cafe.naver.com/',
                 'User-Agent': user_agent
             }
+        return None
+
+    def _paste_into(self, element, text, headless=False):
+        """입력창에 값 입력 (클립보드 붙여넣기, 헤드리스 모드에서는 스크립트로 입력)"""
+        element.click()
+        if headless:
+            # 헤드리스 브라우저는 시스템 클립보드를 사용할 수 없음
+            self.driver.execute_script(
+                "arguments[0].value = arguments[1];"
+                "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+                element, text
+            )
+            return
+
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.common.action_chains import ActionChains
+        import pyperclip
+
+        pyperclip.copy(text)
+        actions = ActionChains(self.driver)
+        if platform.system() == 'Darwin':  # macOS
+            actions.key_down(Keys.COMMAND).send_keys('v').key_up(Keys.COMMAND).perform()
+        else:  # Windows and others
+            actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+
+    def login_many(self, accounts, headless=False, progress_callback=None):
+        """여러 계정을 하나의 브라우저로 로그인
+
+        저장된 세션이 유효한 계정은 브라우저 없이 처리하고, 나머지 계정은
+        브라우저를 한 번만 띄운 뒤 계정마다 독립된 브라우저 컨텍스트(쿠키 분리)에서 로그인한다.
+
+        Args:
+            accounts (list): (아이디, 비밀번호) 목록
+            headless (bool): 헤드리스 브라우저 사용 여부 (2차 인증이 필요한 계정은 사용 불가)
+            progress_callback (callable, optional): (아이디, 성공 여부, 메시지)를 받는 콜백
+
+        Returns:
+            dict: {아이디: 헤더 또는 실패 시 None}
+        """
+        def report(username, success, message):
+            if progress_callback:
+                progress_callback(username, success, message)
+
+        results = {}
+        pending = []
+        for username, password in accounts:
+            if self.restore_session(username):
+                results[username] = self.get_headers()
+                report(username, True, "저장된 세션으로 로그인")
+            else:
+                pending.append((username, password))
+
+        if not pending:
+            return results
+
+        self._open_web_mode(headless=headless)
+        try:
+            main_handle = self.driver.current_window_handle
+            for username, password in pending:
+                context_id = None
+                try:
+                    # 계정마다 쿠키가 분리된 새 컨텍스트와 탭 생성
+                    context_id = self.driver.execute_cdp_cmd(
+                        "Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+                    target_id = self.driver.execute_cdp_cmd(
+                        "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+                    self.driver.switch_to.window(target_id)
+
+                    headers = self._login_in_current_tab(username, password, headless)
+                    if headers:
+                        self.session_store.save(username, headers)
+                        self.headers = headers
+                        results[username] = self.get_headers()
+                        report(username, True, "로그인 성공")
+                    else:
+                        results[username] = None
+                        report(username, False, "로그인 실패")
+                except Exception as e:
+                    logging.error(f"{username} 로그인 오류: {str(e)}")
+                    results[username] = None
+                    report(username, False, f"로그인 오류: {str(e)}")
+                finally:
+                    # 탭과 컨텍스트 정리 후 기본 탭으로 복귀
+                    try:
+                        if self.driver.current_window_handle != main_handle:
+                            self.driver.close()
+                        self.driver.switch_to.window(main_handle)
+                        if context_id:
+                            self.driver.execute_cdp_cmd(
+                                "Target.disposeBrowserContext", {"browserContextId": context_id})
+                    except Exception as e:
+                        logging.info(f"브라우저 컨텍스트 정리 실패: {str(e)}")
+        finally:
             self.driver.quit()
-            return True
-        
-        self.driver.quit()
-        return False
+
+        return results
 
     def get_headers(self):
         """로그인 후 헤더 정보 반환 (타임스탬프 추가)"""
@@ -165,6 +333,49 @@ class NaverAuth:
         
         return result
 
+    def restore_session(self, username):
+        """저장된 세션을 불러와 유효하면 헤더로 설정
+
+        Returns:
+            bool: 저장된 세션으로 로그인 처리되었는지 여부
+        """
+        session = self.session_store.load(username)
+        if not session:
+            return False
+            
+        headers = {
+            "x-cafe-product": "pc",
+            'Cookie': session['cookie'],
+            'Referer': 'https://cafe.naver.com/',
+            'User-Agent': session.get('user_agent', '')
+        }
+        if not self.is_session_valid(headers):
+            logging.info(f"{username} 저장된 세션 만료")
+            self.session_store.forget(username)
+            return False
+            
+        self.headers = headers
+        return True
+
+    def is_session_valid(self, headers, timeout=10):
+        """쿠키가 아직 로그인 상태인지 가벼운 요청 한 번으로 확인"""
+        try:
+            response = requests.get(
+                self.SESSION_CHECK_URL,
+                headers={'Cookie': headers['Cookie'], 'User-Agent': headers.get('User-Agent', '')},
+                timeout=timeout
+            )
+            return response.status_code == 200 and 'nidlogin' not in response.url.lower()
+        except requests.RequestException as e:
+            logging.info(f"세션 확인 요청 실패: {str(e)}")
+            return False
+
+    def forget_session(self, username=None):
+        """저장된 세션 삭제"""
+        username = username or self.username
+        if username:
+            self.session_store.forget(username)
+
     def check_login(self):
         """로그인 상태 확인"""
         # 프로필 페이지로 요청을 보내 로그인 상태 확인
@@ -176,4 +387,5 @@ class NaverAuth:
         """로그아웃"""
         logout_url = 'https://nid.naver.com/nidlogin.logout'
         self.session.get(logout_url)
-        self.session = requests.Session() 
\ No newline at end of file
+        self.session = requests.Session()
+        self.forget_session() 
\ No newline at end of file
@@ -0,0 +1,198 @@
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from .cafe import CafeAPI
+from ..utils.rate_limiter import RateLimiter
+
+
+class BoardCrawler:
+    """가입 카페 게시판 직접 수집기
+
+    검색을 거치지 않고 선택한 카페의 모든 게시판을 최신글부터 페이지 단위(최대 perPage)로 읽는다.
+    카페마다 스레드 하나를 쓰고(카페 안의 게시판은 순서대로), 모든 요청은 하나의 속도 제한기를 공유한다.
+    게시판별 마지막으로 본 articleId(워터마크)보다 새 글만 수집한다.
+    """
+
+    CRAWL_RATE = 2.0  # 전체 초당 게시글 목록 요청 수
+    CRAWL_BURST = 2
+
+    def __init__(self, headers, max_workers=4, rate=CRAWL_RATE, burst=CRAWL_BURST):
+        """
+        Args:
+            headers (dict): 로그인된 계정의 헤더 정보 (가입 카페만 조회 가능)
+            max_workers (int): 동시에 수집할 카페 수
+            rate (float): 전체 초당 요청 수
+            burst (int): 연속 허용 요청 수
+        """
+        self.cafe_api = CafeAPI(headers)
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = RateLimiter(rate, burst)
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """수집 중지 (진행 중인 요청이 끝나면 종료)"""
+        self._stop_event.set()
+
+    @staticmethod
+    def board_key(club_id, menu_id):
+        """게시판 워터마크 키 (club_id/menu_id)"""
+        return f"{club_id}/{menu_id}"
+
+    @staticmethod
+    def to_post(cafe, board, article):
+        """게시글 목록 항목을 검색 결과와 같은 형태로 변환
+
+        cafe_id 는 검색 결과와 같이 카페 주소를 쓰고, 본문 요청에 필요한 숫자 카페 ID는 club_id 로 둔다.
+        """
+        article_id = str(article['articleId'])
+        timestamp = article.get('writeDateTimestamp')
+        post_date = datetime.fromtimestamp(timestamp / 1000).strftime("%Y.%m.%d.") if timestamp else ''
+        return {
+            'title': article.get('subject', ''),
+            'url': f"https://cafe.naver.com/{cafe['cafe_url']}/{article_id}",
+            'cafe_id': cafe['cafe_url'],
+            'article_id': article_id,
+            'club_id': str(cafe['cafe_id']),
+            'content': article.get('summary', '') or '',
+            'cafe_name': cafe.get('cafe_name', ''),
+            'cafe_url': f"https://cafe.naver.com/{cafe['cafe_url']}",
+            'board_name': board.get('board_name', ''),
+            'post_date': post_date,
+            'writer': article.get('writerNickname', ''),
+            'comments': []
+        }
+
+    def crawl_board(self, cafe, board, watermark=None, max_pages=10):
+        """게시판 하나를 최신글부터 워터마크까지 수집
+
+        페이지의 가장 오래된 글이 워터마크 이하이면 그 페이지에서 멈춘다
+        (상단 고정 공지처럼 오래된 글이 앞에 있어도 일찍 멈추지 않도록).
+        워터마크가 있으면 max_pages 와 상관없이 워터마크까지 읽는다. 중간에 멈추면 워터마크를 옮길 수 없어
+        다음 실행이 같은 최신 페이지를 다시 읽게 되므로, 새 글이 많은 게시판도 한 번에 따라잡는다.
+
+        Returns:
+            dict: {'items': 새 게시글 목록 (최신순), 'newest': 가장 큰 articleId,
+                   'pages': 요청한 페이지 수, 'reached_watermark': 워터마크 도달 여부,
+                   'complete': 워터마크 또는 게시판 끝까지 읽었는지 여부 (max_pages/중지/페이지 요청 실패면 False),
+                   'failed': 페이지 요청 실패 여부}
+        """
+        watermark = int(watermark or 0)
+        items = []
+        seen = set()
+        newest = watermark
+        reached = False
+        complete = False
+        failed = False
+        pages = 0
+        page = 0
+        while watermark or page < max_pages:
+            page += 1
+            if self._stop_event.is_set():
+                break
+            self.rate_limiter.acquire()
+            articles = self.cafe_api.fetch_board_page(cafe['cafe_id'], board['board_id'], page)
+            pages = page
+            if articles is None:
+                failed = True  # 요청 실패는 게시판 끝이 아님
+                break
+            if not articles:
+                complete = True
+                break
+
+            for article in articles:
+                article_id = int(article['articleId'])
+                if article_id <= watermark or article_id in seen:
+                    continue
+                seen.add(article_id)
+                newest = max(newest, article_id)
+                items.append(self.to_post(cafe, board, article))
+
+            if watermark and int(articles[-1]['articleId']) <= watermark:
+                reached = complete = True
+                break
+            if len(articles) < CafeAPI.MAX_PER_PAGE:
+                complete = True
+                break
+
+        items.sort(key=lambda item: int(item['article_id']), reverse=True)
+        return {'items': items, 'newest': newest, 'pages': pages, 'reached_watermark': reached,
+                'complete': complete, 'failed': failed}
+
+    def crawl_cafe(self, cafe, watermarks, max_pages):
+        """카페 하나의 모든 게시판 수집
+
+        Returns:
+            list: 게시판별 결과 (crawl_board 결과 + cafe/board/key)
+        """
+        results = []
+        for board in self.cafe_api.get_board_list(cafe['cafe_id']):
+            if self._stop_event.is_set():
+                break
+            key = self.board_key(cafe['cafe_id'], board['board_id'])
+            result = self.crawl_board(cafe, board, watermarks.get(key), max_pages)
+            result.update({'cafe': cafe, 'board': board, 'key': key})
+            results.append(result)
+        return results
+
+    def crawl(self, cafes, watermarks=None, max_pages=10, progress_callback=None):
+        """선택한 카페들의 게시판을 카페별로 동시에 수집
+
+        Args:
+            cafes (list): 카페 목록 [{'cafe_id', 'cafe_url', 'cafe_name'}] (CafeAPI.get_cafe_list 형식)
+            watermarks (dict): {게시판 키: 마지막으로 본 articleId}
+            max_pages (int): 워터마크가 없는 게시판의 최대 페이지 수 (워터마크가 있으면 워터마크까지 읽음)
+            progress_callback (callable): 카페 하나를 마칠 때마다 (완료 카페 수, 수집 게시글 수, 진행 중 여부) 호출
+
+        Returns:
+            dict: {'status', 'items' (최신순), 'total_count',
+                   'boards': 게시판별 [{'cafe_name', 'board_name', 'count', 'pages', 'reached_watermark', 'complete', 'failed',
+                                        'kept_watermark': 새 글을 읽었지만 워터마크를 옮기지 않음}],
+                   'watermarks': {게시판 키: 새 articleId} (작업이 끝난 뒤 저장)}
+
+            워터마크는 이전 워터마크나 게시판 끝까지 읽은 게시판만 옮긴다 (중간에 멈추면 사이의 글을 놓치므로).
+            워터마크가 없던 게시판은 읽은 곳까지를 첫 기준점으로 저장한다.
+        """
+        watermarks = watermarks or {}
+        self._stop_event.clear()
+        items = []
+        boards = []
+        new_watermarks = {}
+        failed = 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(cafes)))) as executor:
+            futures = {executor.submit(self.crawl_cafe, cafe, watermarks, max_pages): cafe for cafe in cafes}
+            for done, future in enumerate(as_completed(futures), start=1):
+                cafe = futures[future]
+                try:
+                    for result in future.result():
+                        items.extend(result['items'])
+                        previous = int(watermarks.get(result['key']) or 0)
+                        advanced = result['newest'] > previous
+                        if advanced and (result['complete'] or not previous):
+                            new_watermarks[result['key']] = result['newest']
+                        boards.append({
+                            'cafe_name': cafe.get('cafe_name', ''),
+                            'board_name': result['board'].get('board_name', ''),
+                            'count': len(result['items']),
+                            'pages': result['pages'],
+                            'reached_watermark': result['reached_watermark'],
+                            'complete': result['complete'],
+                            'failed': result['failed'],
+                            'kept_watermark': advanced and result['key'] not in new_watermarks
+                        })
+                except Exception:
+                    failed += 1
+                    logging.error(f"게시판 수집 Error ({cafe.get('cafe_name', '')}) :: {traceback.format_exc()}")
+                if progress_callback:
+                    progress_callback(done, len(items), done < len(futures))
+
+        items.sort(key=lambda item: item['post_date'], reverse=True)
+        return {
+            'status': 'success' if failed < len(cafes) or not cafes else 'error',
+            'items': items,
+            'total_count': len(items),
+            'boards': boards,
+            'watermarks': new_watermarks
+        }
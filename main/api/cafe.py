@@ -2,7 +2,6 @@ import requests
 import html
 import logging
 import traceback
-from bs4 import BeautifulSoup
 import random
 import re  # 정규표현식 모듈 추가
 
@@ -37,6 +36,7 @@ class CafeAPI:
                 url = "https://" + url
 
             response = requests.get(url, headers=self.headers)
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             
             input_tag = soup.find('input', {'name': 'clubid'})
@@ -73,6 +73,7 @@ class CafeAPI:
         url = f'https://cafe.naver.com/{cafe_id}'
         response = requests.get(url, headers=self.headers)
         
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(response.text, 'html.parser')
         info = {
             'id': cafe_id,
@@ -151,28 +152,50 @@ class CafeAPI:
             print(traceback.format_exc())
             return False
         
-    # 게시글 수집
-    # menu_id를 비우고 요청할 경우 전체 글 조회
-    # 제목뿐만 아니라 내용도 가져와야함
-    def call_board_list(self, cafe_id, menu_id, per_page=20):
-        result = []
+    # 게시글 목록 한 페이지에 요청할 수 있는 최대 게시글 수
+    MAX_PER_PAGE = 50
+
+    def fetch_board_page(self, cafe_id, menu_id, page=1, per_page=MAX_PER_PAGE):
+        """게시판 게시글 목록 한 페이지 조회 (최신글 순)
 
-        url = f"https://apis.naver.com/cafe-web/cafe2/ArticleListV2dot1.json?search.clubid={cafe_id}&search.queryType=lastArticle&search.menuid={menu_id}&search.page={1}&search.perPage={per_page}&adUnit=MW_CAFE_ARTICLE_LIST_RS"
+        Args:
+            cafe_id (str): 카페 ID (숫자 clubid)
+            menu_id (str): 게시판 ID (비우면 전체 글)
+            page (int): 페이지 번호 (1부터)
+            per_page (int): 페이지당 게시글 수 (최대 MAX_PER_PAGE)
+
+        Returns:
+            list or None: 게시글 목록 (articleList 원본), 요청 실패 시 None
+        """
+        url = "https://apis.naver.com/cafe-web/cafe2/ArticleListV2dot1.json"
+        params = {
+            'search.clubid': cafe_id,
+            'search.queryType': 'lastArticle',
+            'search.menuid': menu_id,
+            'search.page': page,
+            'search.perPage': min(per_page, self.MAX_PER_PAGE),
+            'adUnit': 'MW_CAFE_ARTICLE_LIST_RS',
+        }
         try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                response_json = response.json()
-                article_list = response_json['message']['result']['articleList']
-                article_list = sorted(article_list, key=lambda x:x['articleId'])
-                for article in article_list:
-                    article_id = article['articleId']
-                    subject = article['subject']
-                    writer = article['writerNickname']
-                    result.append({"article_id": article_id, "subject": subject, "writer": writer})
+            response = requests.get(url, params=params, headers=self.headers, timeout=15)
+            if response.status_code != 200:
+                logging.error(f"게시글 목록 조회 실패 - 상태 코드: {response.status_code} (카페: {cafe_id}, 게시판: {menu_id})")
+                return None
+            return response.json()['message']['result'].get('articleList', [])
+        except Exception:
+            logging.error(f"게시글 목록 조회 Error :: {traceback.format_exc()}")
+            return None
 
-            return result
-        except:
-            logging.error("게시글 수집 실패: ", response_json['message'])
+    # 게시글 수집
+    # menu_id를 비우고 요청할 경우 전체 글 조회
+    # 제목뿐만 아니라 내용도 가져와야함
+    def call_board_list(self, cafe_id, menu_id, per_page=20, page=1):
+        article_list = self.fetch_board_page(cafe_id, menu_id, page, per_page) or []
+        article_list = sorted(article_list, key=lambda x: x['articleId'])
+        return [
+            {"article_id": article['articleId'], "subject": article['subject'], "writer": article['writerNickname']}
+            for article in article_list
+        ]
 
     # 게시글 내용 GET
     def get_board_content(self, cafe_id, article_id, art_param=None):
@@ -186,22 +209,38 @@ class CafeAPI:
         Returns:
             str: 게시글 HTML 내용
         """
+        return self.fetch_board_content(cafe_id, article_id, art_param)[1]
+
+    def fetch_board_content(self, cafe_id, article_id, art_param=None):
+        """게시글 내용 가져오기 (응답 상태 코드 포함)
+        
+        Returns:
+            tuple: (status_code, content_html) - 요청 자체가 실패하면 status_code는 None
+
+        Raises:
+            ConnectionError: 연결 실패/시간 초과 (일시적인 오류이므로 호출한 쪽에서 재시도)
+        """
         # art 매개변수가 있으면 추가
         art_query = f"&art={art_param}" if art_param else ""
         url = f"https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{cafe_id}/articles/{article_id}?useCafeId=true&requestFrom=A{art_query}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = requests.get(url, headers=self.headers, timeout=15)
             if response.status_code == 200:
                 response_json = response.json()
-                return response_json['result']['article']['contentHtml']
+                return response.status_code, response_json['result']['article']['contentHtml']
+            return response.status_code, None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            logging.warning(f"게시글 내용 요청 연결 오류: {str(e)}")
+            raise ConnectionError(f"{type(e).__name__}: {str(e)}") from e
         except Exception as e:
             logging.error(f"게시글 내용 수집 실패: {str(e)}")
             logging.error(traceback.format_exc())
-            return None
+            return None, None
 
     # 네이버 API에서 리턴받은 html 파싱
     def get_parse_content_html(self, html_content):
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html_content, 'html.parser')
 
         # 내용 추출
@@ -1,14 +1,136 @@
 import requests
-from bs4 import BeautifulSoup
 import json
 import re
 import urllib.parse
 import time
-import openai
+import math
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from ..utils.rate_limiter import RateLimiter
+from .search_backends import HtmlSearchBackend, parse_result_items
+
+
+# 검색 결과의 상대 시간 표기 단위
+RELATIVE_DATE_UNITS = {
+    '초': timedelta(seconds=1),
+    '분': timedelta(minutes=1),
+    '시간': timedelta(hours=1),
+    '일': timedelta(days=1),
+    '주': timedelta(weeks=1),
+}
+
+
+def parse_post_date(text, now=None):
+    """검색 결과의 작성일 표기를 작성 시각 범위로 변환
+
+    '3분 전', '2시간 전', '1일 전', '어제', '2024.03.15.' 형식을 지원한다.
+    표기가 단위 단위로 잘려 있으므로 (가장 이른 시각, 가장 늦은 시각)으로 반환한다.
+
+    Returns:
+        tuple: (earliest, latest) datetime, 해석할 수 없으면 (None, None)
+    """
+    now = now or datetime.now()
+    text = (text or '').strip()
+    if not text:
+        return None, None
+
+    match = re.search(r'(\d+)\s*(초|분|시간|일|주)\s*전', text)
+    if match:
+        unit = RELATIVE_DATE_UNITS[match.group(2)]
+        amount = int(match.group(1))
+        return now - unit * (amount + 1), now - unit * amount
+
+    if '어제' in text:
+        start = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return start, start + timedelta(days=1)
+
+    match = re.search(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', text)
+    if match:
+        try:
+            start = datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            return start, start + timedelta(days=1)
+        except ValueError:
+            return None, None
+
+    return None, None
+
+
+def is_older_than_watermark(item, watermark, now=None):
+    """게시글이 워터마크(이전 실행에서 수집한 가장 최신 게시글) 이전 것인지 확인"""
+    key = f"{item.get('cafe_id', '')}/{item.get('article_id', '')}"
+    if key in watermark.get('recent_keys', ()):
+        return True
+    if not watermark.get('post_time'):
+        return False
+    _, latest = parse_post_date(item.get('post_date', ''), now)
+    if latest is None:
+        return False
+    return latest < datetime.strptime(watermark['post_time'], "%Y-%m-%d %H:%M:%S")
+
+
+def matches_trade_filter(item, trade_filter):
+    """거래 방법/상태 조건에 맞는지 확인 (거래 정보나 해당 값을 알 수 없는 항목은 통과)
+
+    Args:
+        item (dict): 검색 결과 항목 ('trade' 포함)
+        trade_filter (dict): {'method': 'all'|'safe'|'normal', 'status': 'all'|'selling'|'sold'}
+    """
+    trade = item.get('trade')
+    if not trade_filter or not trade:
+        return True
+    method = trade_filter.get('method', 'all')
+    if method != 'all' and trade.get('method') and trade.get('method') != method:
+        return False
+    status = trade_filter.get('status', 'all')
+    if status != 'all' and trade.get('status') and trade.get('status') != status:
+        return False
+    return True
+
+
+class SharedItemBudget:
+    """여러 하위 검색이 함께 채우는 수집 개수
+
+    분할 검색의 구간들이 중복을 제거한 합계로 max_items 를 채우므로, 게시글이 적은 구간이 남긴 몫은
+    다른 구간이 이어서 수집한다.
+    """
+
+    def __init__(self, max_items, key):
+        """
+        Args:
+            max_items (int): 모든 하위 검색을 합쳐 수집할 개수
+            key (callable): 중복 제거용 게시글 키 함수
+        """
+        self.max_items = max_items
+        self.key = key
+        self._lock = threading.Lock()
+        self._seen = set()
+
+    @property
+    def full(self):
+        with self._lock:
+            return len(self._seen) >= self.max_items
+
+    def add(self, items):
+        """수집한 게시글 추가
+
+        Returns:
+            bool: 합계가 max_items 에 도달했는지 여부
+        """
+        with self._lock:
+            self._seen.update(self.key(item) for item in items)
+            return len(self._seen) >= self.max_items
 
 
 class NaverCafeSearchAPI:
-    def __init__(self, openai_api_key=None):
+    def __init__(self, openai_api_key=None, backend=None):
+        """
+        params:
+            openai_api_key (str, optional): OpenAI API 키
+            backend (SearchBackend, optional): 검색 결과 페이지를 가져올 백엔드 (기본값: HtmlSearchBackend)
+        """
+        self.backend = backend or HtmlSearchBackend()
         self.session = requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
@@ -20,6 +142,7 @@ class NaverCafeSearchAPI:
         }
         # OpenAI API 설정
         if openai_api_key:
+            import openai  # 프로그램 시작 속도를 위해 사용 시점에 import
             self.openai_api_key = openai_api_key
             openai.api_key = openai_api_key
             self.openai_client = openai.OpenAI(api_key=openai_api_key)
@@ -27,30 +150,302 @@ class NaverCafeSearchAPI:
             self.openai_client = None
             
         self.is_running = True  # 검색 중지 플래그 추가
+        self._child_apis = []  # 분할/다중 검색 중인 하위 검색 인스턴스
+
+    # 분할/다중 검색에서 page_delay 가 0일 때 모든 하위 검색이 공유하는 검색 페이지 요청 속도 (초당 요청 수)
+    SEARCH_RATE = 1.0
+
+    @classmethod
+    def search_limiter(cls, page_delay):
+        """분할/다중 검색의 하위 검색이 공유할 속도 제한기
+
+        하위 검색은 page_delay 대신 이 제한기를 기다리므로, 검색 전체가 page_delay 마다 한 페이지를 넘지 않도록
+        초당 1/page_delay 건으로 만든다 (page_delay 가 0이면 SEARCH_RATE).
+        """
+        rate = 1.0 / page_delay if page_delay and page_delay > 0 else cls.SEARCH_RATE
+        return RateLimiter(rate, 1)
+
+    # 분할 검색에 사용할 기간 옵션별 전체 기간 (0=전체, 1=1시간, 2=1일은 분할하지 않음)
+    SHARD_SPANS = {
+        3: timedelta(weeks=1),
+        4: timedelta(days=30),
+        5: timedelta(days=91),
+        6: timedelta(days=182),
+        7: timedelta(days=365),
+    }
 
     def stop_search(self):
         """검색 중지"""
         self.is_running = False
+        for child_api in list(self._child_apis):
+            child_api.stop_search()
+
+    @classmethod
+    def date_windows(cls, date_option, shard_count, now=None):
+        """기간을 shard_count 개의 날짜 구간으로 분할
 
-    def search(self, query, max_items=100, cafe_where='articleg', date_option=2, sort='rel', page_delay=1, progress_callback=None):
+        Returns:
+            list: 최신 구간부터 (시작일, 종료일) date 목록. 분할할 수 없는 기간이면 빈 리스트
         """
-        네이버 카페 검색 API
-        
+        span = cls.SHARD_SPANS.get(date_option)
+        if not span or shard_count < 2:
+            return []
+
+        end = (now or datetime.now()).date()
+        start = end - span + timedelta(days=1)
+        total_days = (end - start).days + 1
+        shard_count = min(shard_count, total_days)  # 하루보다 잘게 나누지 않음
+        days_per_shard = math.ceil(total_days / shard_count)
+
+        windows = []
+        window_end = end
+        while window_end >= start:
+            window_start = max(start, window_end - timedelta(days=days_per_shard - 1))
+            windows.append((window_start, window_end))
+            window_end = window_start - timedelta(days=1)
+        return windows
+
+    def _progress_aggregator(self, progress_callback, max_items):
+        """여러 하위 검색의 진행상황을 합쳐서 progress_callback 으로 전달하는 함수 생성
+
+        Returns:
+            tuple: (report(index, current_page, total_items), totals() -> (페이지 합, 수집 개수 합))
+        """
+        lock = threading.Lock()
+        progress = {}  # {하위 검색 번호: (페이지, 수집 개수)}
+
+        def totals():
+            with lock:
+                return (sum(page for page, _ in progress.values()),
+                        sum(count for _, count in progress.values()))
+
+        def report(index, current_page, total_items):
+            with lock:
+                progress[index] = (current_page, total_items)
+            if progress_callback:
+                pages, items = totals()
+                progress_callback(pages, min(items, max_items), True)
+
+        return report, totals
+
+    def _run_children(self, jobs, max_workers):
+        """하위 검색 인스턴스로 jobs 를 동시에 실행 (stop_search() 시 함께 중지)
+
         params:
-            query (str): 검색어
-            max_items (int): 수집할 최대 항목 수 (기본값: 100)
-            cafe_where (str): 검색 대상 ('articleg'=일반글, 'articlec'=거래글, 'article'=전체글, 'cafe'=카페명)
-            date_option (int): 기간 옵션 (0=전체, 1=1시간, 2=1일, 3=1주, 4=1개월, 5=3개월, 6=6개월, 7=1년)
-            sort (str): 정렬 방식 ('rel'=관련도순, 'date'=최신순)
-            page_delay (int): 페이지 간 요청 딜레이(초) (기본값: 1초)
-            progress_callback (callable): 진행상황 콜백 함수 (추가)
-        
+            jobs (list): 하위 검색 인스턴스를 받아 검색 결과를 반환하는 함수 목록
+
         returns:
-            dict: 검색 결과
+            list: jobs 순서대로의 검색 결과
         """
-        all_results = []
+        def run(job):
+            child_api = NaverCafeSearchAPI(backend=self.backend)
+            self._child_apis.append(child_api)
+            if not self.is_running:
+                return {'status': 'success', 'items': []}
+            return job(child_api)
+
+        self.is_running = True
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+                return list(executor.map(run, jobs))
+        finally:
+            self._child_apis = []
+
+    @staticmethod
+    def item_key(item):
+        """중복 제거용 게시글 키 (article_id는 카페마다 따로 매겨지므로 cafe_id와 함께 사용)"""
+        if item.get('article_id'):
+            return (item.get('cafe_id'), item.get('article_id'))
+        return item.get('url')
+
+    def search_sharded(self, query, max_items=100, cafe_where='articleg', date_option=5, sort='rel',
+                       page_delay=1, progress_callback=None, shard_count=4, max_workers=4, rate_limiter=None,
+                       trade_filter=None):
+        """기간을 날짜 구간으로 나누어 구간별로 동시에 검색한 뒤 병합
+
+        검색 결과는 한 번에 볼 수 있는 깊이가 제한되므로, nso의 사용자 지정 기간(p:fromYYYYMMDDtoYYYYMMDD)으로
+        구간을 나누면 구간마다 별도의 결과 목록을 탐색하여 더 많은 게시글에 도달할 수 있다.
+        중복은 (cafe_id, article_id)로 제거한다.
+
+        params:
+            shard_count (int): 구간 수
+            max_workers (int): 동시에 검색할 구간 수
+            rate_limiter (RateLimiter, optional): 모든 구간이 공유할 속도 제한기 (없으면 page_delay 로 생성)
+            그 외는 search()와 동일
+
+        returns:
+            dict: 검색 결과 ('shards' 에 구간별 수집 개수 포함)
+        """
+        # 기간을 지원하지 않는 백엔드는 구간마다 같은 검색을 반복하게 되므로 분할하지 않음
+        windows = self.date_windows(date_option, shard_count) if self.backend.supports_period else []
+        if not windows:
+            return self.search(query, max_items, cafe_where, date_option, sort, page_delay, progress_callback,
+                               rate_limiter=rate_limiter, trade_filter=trade_filter)
+
+        # 구간들이 중복 제거 후 합계로 max_items 를 함께 채움 (게시글이 적은 구간의 몫은 다른 구간이 수집)
+        print(f"검색어 '{query}'를 {len(windows)}개 기간으로 나누어 합계 최대 {max_items}개를 수집합니다...")
+
+        rate_limiter = rate_limiter or self.search_limiter(page_delay)
+        report, totals = self._progress_aggregator(progress_callback, max_items)
+        item_budget = SharedItemBudget(max_items, self.item_key)
+
+        def shard_job(index, window):
+            period = f"from{window[0].strftime('%Y%m%d')}to{window[1].strftime('%Y%m%d')}"
+
+            def job(child_api):
+                if item_budget.full:
+                    return {'status': 'success', 'items': []}
+                return child_api.search(
+                    query, max_items, cafe_where, date_option, sort, page_delay,
+                    progress_callback=lambda page, count, searching: report(index, page, count),
+                    period=period, rate_limiter=rate_limiter, trade_filter=trade_filter,
+                    item_budget=item_budget
+                )
+            return job
+
+        shard_results = self._run_children(
+            [shard_job(index, window) for index, window in enumerate(windows)], max_workers)
+
+        shard_counts = []
+        errors = []
+        for window, result in zip(windows, shard_results):
+            shard_counts.append({'from': window[0].isoformat(), 'to': window[1].isoformat(),
+                                 'count': len(result.get('items', []))})
+            if result.get('status') != 'success':
+                errors.append(result.get('error', ''))
+
+        # 구간을 번갈아 가며 병합하면서 중복 제거 (max_items 로 자를 때 오래된 구간만 잘리지 않도록)
+        merged = []
+        seen = set()
+        for items in itertools.zip_longest(*(result.get('items', []) for result in shard_results)):
+            for item in items:
+                if item is None:
+                    continue
+                key = self.item_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(item)
+
+        merged = merged[:max_items]
+        if progress_callback:
+            progress_callback(totals()[0], len(merged), False)
+
+        # 모든 구간이 실패한 경우에만 오류로 처리
+        if errors and len(errors) == len(windows):
+            return {'error': errors[0], 'status': 'error', 'items': merged}
+
+        return {
+            'status': 'success',
+            'total_count': len(merged),
+            'items': merged,
+            'shards': shard_counts,
+            'trade_filtered': sum(result.get('trade_filtered', 0) for result in shard_results)
+        }
+
+    def search_many(self, queries, max_items=100, cafe_where='articleg', date_option=2, sort='rel', page_delay=1,
+                    progress_callback=None, watermarks=None, shard_count=1, max_workers=4, trade_filter=None):
+        """여러 검색어를 동시에 검색한 뒤 중복을 제거하여 병합
+
+        모든 검색어가 하나의 속도 제한기를 공유하므로 검색어 수가 늘어도 전체 요청 속도는 page_delay 마다 한 페이지를 넘지 않는다.
+        여러 검색어에 걸린 게시글은 한 번만 남기고 'matched_keywords' 에 걸린 검색어를 모두 기록한다.
+
+        params:
+            queries (list): 검색어 목록
+            max_items (int): 검색어당 수집할 최대 항목 수
+            watermarks (dict, optional): {검색어: 증분 수집 기준점}. 기준점이 있는 검색어는 분할하지 않음
+            shard_count (int): 검색어별 기간 분할 수 (search_sharded 참고)
+            max_workers (int): 동시에 검색할 검색어 수
+            그 외는 search()와 동일
+
+        returns:
+            dict: 검색 결과 ('per_query' 에 검색어별 {'items', 'reached_watermark', 'complete', 'truncated', 'pages'} 포함)
+        """
+        watermarks = watermarks or {}
+        print(f"검색어 {len(queries)}개를 동시에 검색합니다: {', '.join(queries)}")
+
+        rate_limiter = self.search_limiter(page_delay)
+        report, totals = self._progress_aggregator(progress_callback, max_items * len(queries))
+
+        def query_job(index, query):
+            callback = lambda page, count, searching: report(index, page, count)
+            watermark = watermarks.get(query)
+            if shard_count > 1 and not watermark:
+                return lambda child_api: child_api.search_sharded(
+                    query, max_items, cafe_where, date_option, sort, page_delay, callback,
+                    shard_count=shard_count, rate_limiter=rate_limiter, trade_filter=trade_filter
+                )
+            return lambda child_api: child_api.search(
+                query, max_items, cafe_where, date_option, sort, page_delay, callback,
+                watermark=watermark, rate_limiter=rate_limiter, trade_filter=trade_filter
+            )
+
+        query_results = self._run_children(
+            [query_job(index, query) for index, query in enumerate(queries)], max_workers)
+
+        # 검색어 순서대로 병합하면서 중복 제거
+        merged = []
+        merged_by_key = {}
+        per_query = {}
+        errors = []
+        for query, result in zip(queries, query_results):
+            items = result.get('items', [])
+            per_query[query] = {
+                'items': items,
+                'reached_watermark': result.get('reached_watermark', False),
+                'complete': result.get('complete', False),
+                'truncated': result.get('truncated', False),
+                'pages': result.get('pages', 0)
+            }
+            if result.get('status') != 'success':
+                errors.append(result.get('error', ''))
+            for item in items:
+                key = self.item_key(item)
+                if key in merged_by_key:
+                    merged_by_key[key]['matched_keywords'].append(query)
+                    continue
+                item['matched_keywords'] = [query]
+                merged_by_key[key] = item
+                merged.append(item)
+
+        if progress_callback:
+            progress_callback(totals()[0], len(merged), False)
+
+        # 모든 검색어가 실패한 경우에만 오류로 처리
+        if errors and len(errors) == len(queries):
+            return {'error': errors[0], 'status': 'error', 'items': merged, 'per_query': per_query}
+
+        return {
+            'status': 'success',
+            'total_count': len(merged),
+            'items': merged,
+            'per_query': per_query,
+            'trade_filtered': sum(result.get('trade_filtered', 0) for result in query_results)
+        }
+
+    def iter_pages(self, query, cafe_where='articleg', date_option=2, sort='rel', page_delay=1,
+                   watermark=None, period=None, rate_limiter=None, trade_filter=None):
+        """
+        검색 결과를 페이지 단위로 가져오는 제너레이터
+
+        다음 페이지는 호출한 쪽이 다음 값을 요청할 때 가져오므로, 원하는 만큼 모였으면
+        반복을 멈추는 것만으로 페이지 요청을 중단할 수 있다.
+
+        params:
+            search()와 동일 (max_items, progress_callback 제외)
+
+        yields:
+            dict: {'page': 페이지 번호, 'items': 조건에 맞는 게시글 목록, 'raw_count': 페이지의 전체 게시글 수, 'bytes': 응답 크기,
+                   'trade_filtered': 로컬에서 제외한 거래글 수, 'reached_watermark': 증분 수집 기준점 도달 여부,
+                   'truncated': 백엔드의 최대 시작 위치에 막혀 더 읽지 못함 (이 경우 items 가 빈 마지막 페이지)}
+
+        raises:
+            requests.RequestException: 검색 요청 실패
+        """
+        incremental = bool(watermark) and sort == 'date'
+        trade_filter = trade_filter if cafe_where == 'articlec' else None
         current_page = 1
-        items_per_page = 30  # 네이버 검색은 페이지당 30개 항목
+        items_per_page = self.backend.page_size  # 네이버 검색은 페이지당 30개 항목 (Open API는 100개)
         
         # 날짜 옵션에 따른 nso 파라미터 설정
         nso_periods = {
@@ -74,16 +469,25 @@ class NaverCafeSearchAPI:
             'date': 'dd'
         }
         
-        # 기본 URL 설정
-        url = 'https://search.naver.com/search.naver'
-        nso = f"so:{so_options.get(sort, 'r')},p:{nso_periods.get(date_option, '1d')}"
+        nso = f"so:{so_options.get(sort, 'r')},p:{period or nso_periods.get(date_option, '1d')}"
         
-        print(f"검색어 '{query}'에 대해 최대 {max_items}개 항목 수집을 시작합니다...")
         self.is_running = True  # 검색 시작
         
-        while len(all_results) < max_items and self.is_running:  # 중지 플래그 확인
+        while self.is_running:  # 중지 플래그 확인
             # 한 페이지의 시작 인덱스 계산
             start_index = (current_page - 1) * items_per_page + 1
+            if self.backend.max_start and start_index > self.backend.max_start:
+                # 결과가 끝난 것이 아니라 더 요청할 수 없는 것이므로, 호출한 쪽이 기준점을 옮기지 않도록 알림
+                yield {
+                    'page': current_page - 1,
+                    'items': [],
+                    'raw_count': 0,
+                    'bytes': 0,
+                    'trade_filtered': 0,
+                    'reached_watermark': False,
+                    'truncated': True
+                }
+                return
             
             params = {
                 'cafe_where': cafe_where,
@@ -100,47 +504,129 @@ class NaverCafeSearchAPI:
                 'start': start_index  # 페이지네이션을 위한 시작 인덱스
             }
             
-            try:
-                print(f"페이지 {current_page} 수집 중... (현재 {len(all_results)}개 항목)")
+            if rate_limiter:
+                rate_limiter.acquire()
+            page_items, page_bytes = self.backend.fetch_page(self.session, self.headers, params)
+            
+            # 결과가 없으면 종료
+            if not page_items:
+                return
+            
+            reached_watermark = False
+            # 증분 수집: 기준점 이전 게시글 제외
+            if incremental:
+                now = datetime.now()
+                new_items = [item for item in page_items if not is_older_than_watermark(item, watermark, now)]
+                # 최신순 정렬이므로 페이지 안에 기준점 이전 게시글이 있으면 다음 페이지는 모두 이전 게시글
+                reached_watermark = len(new_items) < len(page_items)
+            else:
+                new_items = page_items
+            matched_items = [item for item in new_items if matches_trade_filter(item, trade_filter)]
+            
+            yield {
+                'page': current_page,
+                'items': matched_items,
+                'raw_count': len(page_items),
+                'bytes': page_bytes,
+                'trade_filtered': len(new_items) - len(matched_items),
+                'reached_watermark': reached_watermark,
+                'truncated': False
+            }
+            if reached_watermark:
+                return
+            
+            # 다음 페이지로 이동
+            current_page += 1
+            
+            # 과도한 요청 방지를 위한 딜레이
+            if page_delay > 0 and not rate_limiter and self.is_running:  # 중지 플래그 확인
+                time.sleep(page_delay)
+
+    def search(self, query, max_items=100, cafe_where='articleg', date_option=2, sort='rel', page_delay=1, progress_callback=None,
+               watermark=None, period=None, rate_limiter=None, trade_filter=None, item_budget=None):
+        """
+        네이버 카페 검색 API
+        
+        params:
+            query (str): 검색어
+            max_items (int): 수집할 최대 항목 수 (기본값: 100)
+            cafe_where (str): 검색 대상 ('articleg'=일반글, 'articlec'=거래글, 'article'=전체글, 'cafe'=카페명)
+            date_option (int): 기간 옵션 (0=전체, 1=1시간, 2=1일, 3=1주, 4=1개월, 5=3개월, 6=6개월, 7=1년)
+            sort (str): 정렬 방식 ('rel'=관련도순, 'date'=최신순)
+            page_delay (int): 페이지 간 요청 딜레이(초) (기본값: 1초)
+            progress_callback (callable): 진행상황 콜백 함수 (추가)
+            watermark (dict, optional): 증분 수집 기준점 (WatermarkStore.get() 결과).
+                최신순(sort='date') 검색에서만 사용하며, 기준점 이전 게시글은 결과에서 제외하고
+                기준점 이전 게시글이 나온 페이지에서 수집을 멈춘다.
+            period (str, optional): nso 기간 값 직접 지정 (예: 'from20240101to20240131'). 지정하면 date_option 대신 사용
+            rate_limiter (RateLimiter, optional): 다른 검색과 공유하는 속도 제한기. 지정하면 page_delay 대신 사용
+            trade_filter (dict, optional): 거래글 검색의 {'method': 거래 방법, 'status': 거래 상태}.
+                검색 요청에는 반영하지 않고 받은 결과를 matches_trade_filter()로 거른다.
+            item_budget (SharedItemBudget, optional): 다른 검색과 함께 채우는 수집 개수. 합계가 찼으면 수집을 멈춘다
+        
+        returns:
+            dict: 검색 결과 (증분 수집 시 'reached_watermark', 거래 필터 사용 시 'trade_filtered' 포함).
+                'complete' 는 기준점에 도달했거나 결과가 끝날 때까지 읽었는지 여부 (max_items 에서 멈췄으면 False).
+                'truncated' 는 백엔드의 최대 시작 위치(Open API start 1000)에 막혀 멈췄는지 여부 (complete 는 False)
+        """
+        reached_watermark = False
+        truncated = False  # 백엔드의 최대 시작 위치에 막혀 결과 끝까지 읽지 못했는지
+        complete = False  # 증분 수집 기준점을 옮겨도 되는지 (중간에 멈추면 사이의 게시글을 놓침)
+        trade_filtered = 0  # 거래 조건에 맞지 않아 제외한 거래글 수
+        total_bytes = 0  # 받은 응답 크기 합계
+        all_results = []
+        current_page = 1
+        
+        print(f"검색어 '{query}'에 대해 최대 {max_items}개 항목 수집을 시작합니다...")
+        
+        # 진행상황 콜백 호출
+        if progress_callback:
+            progress_callback(current_page, len(all_results), True)
+        
+        pages = self.iter_pages(query, cafe_where, date_option, sort, page_delay,
+                                watermark=watermark, period=period, rate_limiter=rate_limiter, trade_filter=trade_filter)
+        try:
+            for page in pages:
+                if page['truncated']:
+                    truncated = True
+                    print(f"검색 결과를 더 요청할 수 없는 위치(start {self.backend.max_start})에 도달했습니다. "
+                          f"수집 종료 (총 {len(all_results)}개 항목)")
+                    break
+                current_page = page['page']
+                all_results.extend(page['items'])
+                trade_filtered += page['trade_filtered']
+                total_bytes += page['bytes']
+                print(f"페이지 {current_page} 수집 완료 (현재 {len(all_results)}개 항목)")
                 
-                # 진행상황 콜백 호출
                 if progress_callback:
-                    progress_callback(current_page, len(all_results), True)
-                
-                response = self.session.get(url, params=params, headers=self.headers)
-                response.raise_for_status()
+                    progress_callback(current_page, min(len(all_results), max_items), True)
                 
-                # HTML 파싱
-                page_results = self._parse_search_results(response.text)
-                
-                # 결과가 없으면 종료
-                if page_results['total_count'] == 0:
-                    print(f"더 이상 검색 결과가 없습니다. 수집 종료 (총 {len(all_results)}개 항목)")
+                if page['reached_watermark']:
+                    reached_watermark = True
+                    complete = True
+                    print(f"이전 수집 기준점에 도달했습니다. 수집 종료 (새 게시글 {min(len(all_results), max_items)}개)")
                     break
                 
-                # 결과 추가
-                all_results.extend(page_results['items'])
+                if item_budget is not None and item_budget.add(page['items']):
+                    print(f"분할 검색 전체 수집 개수에 도달했습니다. 수집 종료 (총 {len(all_results)}개 항목)")
+                    break
                 
                 # 최대 수집 개수 제한
                 if len(all_results) >= max_items:
-                    all_results = all_results[:max_items]
                     break
-                
-                # 다음 페이지로 이동
-                current_page += 1
-                
-                # 과도한 요청 방지를 위한 딜레이
-                if page_delay > 0 and self.is_running:  # 중지 플래그 확인
-                    time.sleep(page_delay)
-                
-            except requests.RequestException as e:
-                print(f"요청 중 오류 발생: {e}")
-                return {'error': str(e), 'status': 'error', 'items': all_results}
-                
-            # 중지 플래그 확인
-            if not self.is_running:
-                print("검색이 중지되었습니다.")
-                break
+            else:
+                if self.is_running:
+                    complete = True
+                    print(f"더 이상 검색 결과가 없습니다. 수집 종료 (총 {len(all_results)}개 항목)")
+                else:
+                    print("검색이 중지되었습니다.")
+        except requests.RequestException as e:
+            print(f"요청 중 오류 발생: {e}")
+            return {'error': str(e), 'status': 'error', 'items': all_results}
+        finally:
+            pages.close()
+        
+        all_results = all_results[:max_items]
         
         # 최종 진행상황 콜백 호출
         if progress_callback:
@@ -149,71 +635,18 @@ class NaverCafeSearchAPI:
         return {
             'status': 'success',
             'total_count': len(all_results),
-            'items': all_results
+            'items': all_results,
+            'pages': current_page,
+            'reached_watermark': reached_watermark,
+            'complete': complete,
+            'truncated': truncated,
+            'trade_filtered': trade_filtered,
+            'bytes': total_bytes
         }
     
     def _parse_search_results(self, html_content):
         """HTML에서 카페 검색 결과를 파싱하는 함수"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 결과를 저장할 리스트
-        search_results = []
-        
-        # 카페 검색 결과 항목 찾기
-        cafe_posts = soup.select('ul.lst_view li.bx')
-        
-        for post in cafe_posts:
-            # 기본 데이터 구조 설정
-            post_data = {
-                'title': '',
-                'content': '',
-                'url': '',
-                'cafe_name': '',
-                'cafe_url': '',
-                'post_date': '',
-                'cafe_id': '',
-                'article_id': '',
-                'comments': []
-            }
-            
-            # 게시글 제목
-            title_element = post.select_one('.title_link')
-            if title_element:
-                post_data['title'] = title_element.get_text(strip=True)
-                post_data['url'] = title_element.get('href', '')
-                
-                # cafe_id와 article_id 추출
-                if post_data['url']:
-                    match = re.search(r'cafe\.naver\.com/([^/]+)/(\d+)', post_data['url'])
-                    if match:
-                        post_data['cafe_id'] = match.group(1)
-                        post_data['article_id'] = match.group(2)
-            
-            # 게시글 내용
-            content_element = post.select_one('.dsc_link')
-            if content_element:
-                post_data['content'] = content_element.get_text(strip=True)
-            
-            # 카페 정보
-            cafe_element = post.select_one('.user_info .name')
-            if cafe_element:
-                post_data['cafe_name'] = cafe_element.get_text(strip=True)
-                post_data['cafe_url'] = cafe_element.get('href', '')
-            
-            # 게시글 작성 날짜
-            date_element = post.select_one('.user_info .sub')
-            if date_element:
-                post_data['post_date'] = date_element.get_text(strip=True)
-            
-            # 댓글 정보
-            comments = post.select('.comment_box .flick_bx')
-            for comment in comments:
-                comment_text = comment.select_one('.txt')
-                if comment_text:
-                    post_data['comments'].append(comment_text.get_text(strip=True))
-            
-            search_results.append(post_data)
-        
+        search_results = parse_result_items(html_content)
         return {
             'status': 'success',
             'total_count': len(search_results),
@@ -0,0 +1,410 @@
+import html
+import json
+import os
+import re
+import requests
+
+
+# 검색 결과 항목의 거래 상태 표기 (앞쪽이 우선)
+TRADE_STATUS_KEYWORDS = [
+    ('sold', ('판매완료', '거래완료', '판매 완료')),
+    ('reserved', ('예약중', '예약 중')),
+    ('selling', ('판매중', '판매 중')),
+]
+
+# 검색 결과 항목의 거래 방법 표기 (앞쪽이 우선, 표기가 없으면 알 수 없음)
+TRADE_METHOD_KEYWORDS = [
+    ('safe', ('안전결제', '안전거래')),
+    ('normal', ('직거래', '일반거래', '일반결제', '택배거래')),
+]
+
+
+def parse_trade_info(text):
+    """검색 결과 항목의 텍스트에서 거래 정보 추출
+
+    Returns:
+        dict: {'method': 'safe'|'normal'|None, 'status': 'selling'|'reserved'|'sold'|None, 'price': int|None}
+            (표기가 없어 알 수 없는 값은 None)
+    """
+    text = text or ''
+    method = None
+    for method_value, keywords in TRADE_METHOD_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            method = method_value
+            break
+
+    status = None
+    for status_value, keywords in TRADE_STATUS_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            status = status_value
+            break
+
+    price = None
+    match = re.search(r'(\d{1,3}(?:,\d{3})+|\d+)\s*원', text)
+    if match:
+        price = int(match.group(1).replace(',', ''))
+
+    return {
+        'method': method,
+        'status': status,
+        'price': price
+    }
+
+
+def parse_result_items(html_content):
+    """카페 검색 결과 HTML(전체 페이지 또는 결과 목록 조각)에서 게시글 목록 추출
+
+    Returns:
+        list: post_data 목록
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser')
+    
+    # 결과를 저장할 리스트
+    search_results = []
+
+    # 카페 검색 결과 항목 찾기 (JSON 응답의 조각에는 ul 없이 li만 있을 수 있음)
+    cafe_posts = soup.select('ul.lst_view li.bx') or soup.select('li.bx')
+
+    for post in cafe_posts:
+        # 기본 데이터 구조 설정
+        post_data = {
+            'title': '',
+            'content': '',
+            'url': '',
+            'cafe_name': '',
+            'cafe_url': '',
+            'post_date': '',
+            'cafe_id': '',
+            'article_id': '',
+            'comments': []
+        }
+
+        # 게시글 제목
+        title_element = post.select_one('.title_link')
+        if title_element:
+            post_data['title'] = title_element.get_text(strip=True)
+            post_data['url'] = title_element.get('href', '')
+
+            # cafe_id와 article_id 추출
+            if post_data['url']:
+                match = re.search(r'cafe\.naver\.com/([^/]+)/(\d+)', post_data['url'])
+                if match:
+                    post_data['cafe_id'] = match.group(1)
+                    post_data['article_id'] = match.group(2)
+
+        # 게시글 내용
+        content_element = post.select_one('.dsc_link')
+        if content_element:
+            post_data['content'] = content_element.get_text(strip=True)
+
+        # 카페 정보
+        cafe_element = post.select_one('.user_info .name')
+        if cafe_element:
+            post_data['cafe_name'] = cafe_element.get_text(strip=True)
+            post_data['cafe_url'] = cafe_element.get('href', '')
+
+        # 게시글 작성 날짜
+        date_element = post.select_one('.user_info .sub')
+        if date_element:
+            post_data['post_date'] = date_element.get_text(strip=True)
+
+        # 거래 정보 (거래글 검색 결과에서 거래 방법/상태/가격 표기)
+        post_data['trade'] = parse_trade_info(post.get_text(' ', strip=True))
+
+        # 댓글 정보
+        comments = post.select('.comment_box .flick_bx')
+        for comment in comments:
+            comment_text = comment.select_one('.txt')
+            if comment_text:
+                post_data['comments'].append(comment_text.get_text(strip=True))
+
+        search_results.append(post_data)
+    
+    return search_results
+
+
+class SearchBackend:
+    """검색 결과 한 페이지를 가져오는 방식
+
+    NaverCafeSearchAPI.iter_pages()가 검색 조건을 공통 파라미터로 만들어 넘기면,
+    백엔드는 요청을 보내고 post_data 형식의 게시글 목록을 돌려준다.
+    """
+
+    name = ""
+    label = ""
+    page_size = 30     # 페이지당 게시글 수
+    max_start = None   # 요청할 수 있는 최대 시작 위치 (None이면 제한 없음)
+    supports_period = True  # 기간(nso) 조건 지원 여부 (지원하지 않으면 기간 분할 검색 불가)
+
+    def request(self, session, headers, params):
+        """검색 요청 보내기
+
+        Args:
+            session (requests.Session): 요청에 사용할 세션
+            headers (dict): 요청 헤더
+            params (dict): 검색 파라미터 (query, start, nso 등)
+
+        Returns:
+            requests.Response: 응답
+
+        Raises:
+            requests.RequestException: 요청 실패
+        """
+        raise NotImplementedError
+
+    def parse_response(self, text):
+        """응답 본문에서 게시글 목록 추출 (녹화한 응답으로 백엔드를 비교할 때도 사용)"""
+        return parse_result_items(text)
+
+    def fetch_page(self, session, headers, params):
+        """검색 결과 한 페이지 가져오기
+
+        Returns:
+            tuple: (게시글 목록, 응답 크기(bytes))
+        """
+        response = self.request(session, headers, params)
+        return self.parse_response(response.text), len(response.content)
+
+
+class HtmlSearchBackend(SearchBackend):
+    """search.naver.com 검색 결과 페이지 전체를 받아서 파싱"""
+
+    name = "html"
+    label = "HTML"
+    URL = 'https://search.naver.com/search.naver'
+
+    def request(self, session, headers, params):
+        response = session.get(self.URL, params=params, headers=headers, timeout=15)
+        response.raise_for_status()
+        return response
+
+
+class UnexpectedResponseError(requests.RequestException):
+    """검색 응답이 예상한 형식이 아님 (엔드포인트나 응답 구조 변경)"""
+
+
+class JsonSearchBackend(SearchBackend):
+    """카페 탭의 스크롤 페이지 요청(s.search.naver.com)으로 결과 목록 조각만 받아서 파싱
+
+    응답은 스크립트/스타일 없이 결과 목록 HTML 조각을 JSON(또는 JSONP)으로 감싼 형태이므로
+    페이지 전체를 받는 것보다 전송량과 파싱 시간이 훨씬 적다.
+    JSON이 아닌 응답은 HTML로 보고 파싱하지만, JSON인데 조각이 없으면 결과가 끝난 것으로 오인하지 않도록
+    UnexpectedResponseError 를 발생시킨다.
+    """
+
+    name = "json"
+    label = "JSON"
+    URL = 'https://s.search.naver.com/p/cafe/search.naver'
+    FRAGMENT_KEYS = ('html', 'contents', 'content')  # 결과 목록 조각이 들어 있는 키
+
+    def request(self, session, headers, params):
+        request_params = dict(params, where='article', prmore=1, _callback='')
+        request_headers = dict(headers, Accept='application/json, text/javascript, */*; q=0.01',
+                               Referer='https://search.naver.com/search.naver')
+        response = session.get(self.URL, params=request_params, headers=request_headers, timeout=15)
+        response.raise_for_status()
+        return response
+
+    def parse_response(self, text):
+        return parse_result_items(self.extract_fragment(text))
+
+    @classmethod
+    def extract_fragment(cls, text):
+        """JSON/JSONP 응답에서 결과 목록 HTML 조각 추출
+
+        Raises:
+            UnexpectedResponseError: JSON 응답에 FRAGMENT_KEYS 중 어떤 키도 없음
+        """
+        body = text.strip()
+        # JSONP: callback({...}); 형식이면 괄호 안만 사용
+        match = re.match(r'^[\w$.]*\((.*)\)\s*;?\s*$', body, re.S)
+        if match:
+            body = match.group(1)
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return text
+
+        fragments = []
+
+        def collect(node):
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in cls.FRAGMENT_KEYS and isinstance(value, str):
+                        fragments.append(value)
+                    else:
+                        collect(value)
+            elif isinstance(node, list):
+                for value in node:
+                    collect(value)
+
+        collect(data)
+        if not fragments:
+            keys = ", ".join(data.keys()) if isinstance(data, dict) else type(data).__name__
+            raise UnexpectedResponseError(f"JSON 검색 응답에 결과 목록 조각이 없습니다 (키: {keys})")
+        return "".join(fragments)
+
+
+class QuotaExceededError(requests.RequestException):
+    """Open API 일일 호출 한도 초과"""
+
+
+def strip_tags(text):
+    """Open API 응답의 강조 태그(<b>)와 HTML 엔티티 제거"""
+    return html.unescape(re.sub(r'<[^>]+>', '', text or '')).strip()
+
+
+class OpenApiSearchBackend(SearchBackend):
+    """네이버 검색 Open API (v1/search/cafearticle.json) 사용
+
+    네이버 개발자 센터에서 발급받은 Client ID/Secret이 필요하다.
+    한 번에 최대 100개를 구조화된 JSON으로 받으며, 일일 호출 한도는 DailyQuota로 로컬에서 센다.
+    Open API는 기간/검색 대상/거래 조건을 지원하지 않고 작성일도 주지 않으므로 해당 옵션은 적용되지 않는다.
+    """
+
+    name = "openapi"
+    label = "Open API"
+    page_size = 100    # display 최댓값
+    max_start = 1000   # start 최댓값
+    supports_period = False
+    DAILY_LIMIT = 25000
+    QUOTA_FILE = os.path.join("data", "openapi_quota.json")
+    # 로컬 대체 서버로 시험할 때 NAVER_OPENAPI_URL 환경 변수로 주소 변경
+    URL = os.environ.get("NAVER_OPENAPI_URL", "https://openapi.naver.com/v1/search/cafearticle.json")
+    SORT_OPTIONS = {'rel': 'sim', 'date': 'date'}
+
+    def __init__(self, client_id, client_secret, quota=None, url=None):
+        """
+        Args:
+            client_id (str): 네이버 Open API Client ID
+            client_secret (str): 네이버 Open API Client Secret
+            quota (DailyQuota, optional): 일일 호출 한도 카운터 (기본값: data/openapi_quota.json)
+            url (str, optional): API 주소 (기본값: URL)
+        """
+        from ..utils.quota_counter import DailyQuota
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.quota = quota or DailyQuota(self.QUOTA_FILE, self.DAILY_LIMIT)
+        self.url = url or self.URL
+
+    def request(self, session, headers, params):
+        if not self.quota.acquire():
+            raise QuotaExceededError(f"Open API 일일 호출 한도({self.quota.daily_limit}회)를 모두 사용했습니다.")
+        request_params = {
+            'query': params['query'],
+            'display': self.page_size,
+            'start': params['start'],
+            'sort': self.SORT_OPTIONS.get(params.get('st'), 'sim'),
+        }
+        request_headers = {
+            'X-Naver-Client-Id': self.client_id,
+            'X-Naver-Client-Secret': self.client_secret,
+        }
+        response = session.get(self.url, params=request_params, headers=request_headers, timeout=15)
+        response.raise_for_status()
+        return response
+
+    def parse_response(self, text):
+        search_results = []
+        for item in json.loads(text).get('items', []):
+            title = strip_tags(item.get('title'))
+            description = strip_tags(item.get('description'))
+            post_data = {
+                'title': title,
+                'content': description,
+                'url': item.get('link', ''),
+                'cafe_name': item.get('cafename', ''),
+                'cafe_url': item.get('cafeurl', ''),
+                'post_date': '',  # Open API는 작성일을 제공하지 않음
+                'cafe_id': '',
+                'article_id': '',
+                'comments': [],
+                'trade': parse_trade_info(f"{title} {description}")
+            }
+            match = re.search(r'cafe\.naver\.com/([^/]+)/(\d+)', post_data['url'])
+            if match:
+                post_data['cafe_id'] = match.group(1)
+                post_data['article_id'] = match.group(2)
+            search_results.append(post_data)
+        return search_results
+
+
+SEARCH_BACKENDS = {
+    HtmlSearchBackend.name: HtmlSearchBackend,
+    JsonSearchBackend.name: JsonSearchBackend,
+    OpenApiSearchBackend.name: OpenApiSearchBackend,
+}
+
+
+def get_search_backend(name=None, client_id=None, client_secret=None):
+    """이름으로 검색 백엔드 생성 (알 수 없는 이름이면 HTML 백엔드)
+
+    Args:
+        name (str): 백엔드 이름 ('html', 'json', 'openapi')
+        client_id (str, optional): Open API Client ID ('openapi' 에서만 사용)
+        client_secret (str, optional): Open API Client Secret ('openapi' 에서만 사용)
+    """
+    if name == OpenApiSearchBackend.name:
+        return OpenApiSearchBackend(client_id, client_secret)
+    return SEARCH_BACKENDS.get(name or HtmlSearchBackend.name, HtmlSearchBackend)()
+
+
+if __name__ == "__main__":
+    # 로컬 대체 서버로 Open API 백엔드 확인
+    #   python -m main.api.search_backends
+    import tempfile
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib.parse import urlparse, parse_qs
+    from ..utils.quota_counter import DailyQuota
+
+    TOTAL_ITEMS = 250
+
+    class StandInOpenApiHandler(BaseHTTPRequestHandler):
+        """cafearticle.json 대체 엔드포인트 (전체 TOTAL_ITEMS 개, 인증 헤더가 없으면 401)"""
+
+        def do_GET(self):
+            if not self.headers.get("X-Naver-Client-Id") or not self.headers.get("X-Naver-Client-Secret"):
+                self.send_response(401)
+                self.end_headers()
+                return
+            query = parse_qs(urlparse(self.path).query)
+            start = int(query.get("start", ["1"])[0])
+            display = int(query.get("display", ["10"])[0])
+            keyword = query.get("query", [""])[0]
+            items = [{
+                "title": f"<b>{keyword}</b> 게시글 {number} &amp; 판매중",
+                "link": f"http://cafe.naver.com/standin/{number}",
+                "description": f"{keyword} 본문 미리보기 {number * 1000:,}원",
+                "cafename": "대체 카페",
+                "cafeurl": "http://cafe.naver.com/standin",
+            } for number in range(start, min(start + display, TOTAL_ITEMS + 1))]
+            body = {"lastBuildDate": "", "total": TOTAL_ITEMS, "start": start, "display": len(items), "items": items}
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    from .search import NaverCafeSearchAPI
+
+    server = HTTPServer(("127.0.0.1", 0), StandInOpenApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v1/search/cafearticle.json"
+    quota = DailyQuota(os.path.join(tempfile.mkdtemp(), "openapi_quota.json"), daily_limit=4)
+
+    backend = OpenApiSearchBackend("standin-id", "standin-secret", quota=quota, url=url)
+    api = NaverCafeSearchAPI(backend=backend)
+    result = api.search("자전거", max_items=1000, page_delay=0)
+    print(f"수집: {result['total_count']}개, 페이지: {result['pages']}, 남은 호출: {quota.remaining}")
+    print("첫 게시글:", result['items'][0])
+
+    result = api.search("자전거", max_items=1000, page_delay=0)
+    print(f"한도 초과 후: {result.get('status')} - {result.get('error')}")
+
+    server.shutdown()
@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+from .cafe import CafeAPI
+from ..utils.rate_limiter import RateLimiter
+
+
+class AccountSession:
+    """세션 풀에 속한 계정 하나 (CafeAPI, 속도 제한기, 처리량 통계)"""
+
+    def __init__(self, account_id, headers, rate, burst):
+        self.account_id = account_id
+        self.api = CafeAPI(headers)
+        self.limiter = RateLimiter(rate, burst)
+        self.healthy = True
+        self.in_flight = 0
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.auth_failed_cafes = set()  # 마지막 성공 이후 401/403 을 받은 카페
+        self.total_latency = 0.0
+        self.created_at = time.monotonic()
+
+    def metrics(self):
+        """계정별 처리량 통계"""
+        elapsed = max(time.monotonic() - self.created_at, 1e-6)
+        return {
+            'account_id': self.account_id,
+            'healthy': self.healthy,
+            'requests': self.requests,
+            'successes': self.successes,
+            'failures': self.failures,
+            'throughput': round(self.successes / elapsed, 2),  # 초당 성공 요청 수
+            'avg_latency': round(self.total_latency / self.requests, 3) if self.requests else 0.0
+        }
+
+
+class SessionPool:
+    """로그인된 여러 계정에 게시글 내용 요청을 분산하는 세션 풀
+
+    계정마다 속도 제한기를 두고, 가장 빨리 요청할 수 있는 계정에 요청을 배정한다.
+    401/403 은 가입하지 않은 카페의 멤버 전용 글에서도 오므로, 서로 다른 카페의 글에서 연속으로
+    max_auth_failures 번 받았을 때만 로그인 만료로 보고 계정을 제외한다. 연결 오류/429/5xx 가
+    연속 max_failures 번 이상이어도 제외한다. 401/403 을 받은 글은 다른 계정 하나로만 다시 요청하고,
+    연결 오류는 다른 계정으로 다시 요청한다.
+    """
+
+    AUTH_ERROR_CODES = (401, 403)
+    AUTH_RETRY_ACCOUNTS = 1  # 401/403 을 받은 글을 다시 요청할 다른 계정 수
+
+    def __init__(self, accounts, rate=2.0, burst=2, max_failures=5, max_auth_failures=3):
+        """
+        Args:
+            accounts (dict): {계정 ID: 로그인 헤더}
+            rate (float): 계정당 초당 요청 수
+            burst (int): 계정당 연속 허용 요청 수
+            max_failures (int): 계정을 제외하기 전까지 허용할 연속 실패 횟수
+            max_auth_failures (int): 계정을 제외하기 전까지 허용할 서로 다른 카페의 연속 401/403 횟수
+        """
+        self.max_failures = max_failures
+        self.max_auth_failures = max_auth_failures
+        self._lock = threading.Lock()
+        self.sessions = [
+            AccountSession(account_id, headers, rate, burst)
+            for account_id, headers in accounts.items() if headers
+        ]
+
+    def healthy_sessions(self):
+        """사용 가능한 계정 목록"""
+        with self._lock:
+            return [session for session in self.sessions if session.healthy]
+
+    def __len__(self):
+        return len(self.healthy_sessions())
+
+    def _acquire(self, exclude=()):
+        """요청을 보낼 계정 선택 (대기 시간이 가장 짧고 진행 중인 요청이 적은 계정)"""
+        with self._lock:
+            candidates = [s for s in self.sessions if s.healthy and s not in exclude]
+            if not candidates:
+                return None
+            session = min(candidates, key=lambda s: (s.limiter.wait_time(), s.in_flight))
+            session.in_flight += 1
+            return session
+
+    def _release(self, session, success, status_code, latency, cafe_id=None):
+        with self._lock:
+            session.in_flight -= 1
+            session.requests += 1
+            session.total_latency += latency
+            if success:
+                session.successes += 1
+                session.consecutive_failures = 0
+                session.auth_failed_cafes.clear()
+                return
+            session.failures += 1
+            # 삭제/비공개 글(4xx)은 계정 문제가 아니므로 연속 실패로 세지 않음
+            if status_code is None or status_code == 429 or status_code >= 500:
+                session.consecutive_failures += 1
+            # 401/403 은 카페 권한 문제일 수 있으므로 서로 다른 카페에서 반복될 때만 계정 문제로 봄
+            if status_code in self.AUTH_ERROR_CODES:
+                session.auth_failed_cafes.add(cafe_id)
+            if (len(session.auth_failed_cafes) >= self.max_auth_failures
+                    or session.consecutive_failures >= self.max_failures):
+                if session.healthy:
+                    session.healthy = False
+                    logging.warning(f"세션 풀에서 계정 제외: {session.account_id} "
+                                    f"(상태 코드: {status_code}, 연속 실패: {session.consecutive_failures}, "
+                                f"권한 오류 카페: {len(session.auth_failed_cafes)}개)")
+
+    def fetch_board_content(self, cafe_id, article_id, art_param=None):
+        """게시글 내용 HTML 가져오기 (사용 가능한 계정에 분산)
+
+        Returns:
+            str or None: 게시글 HTML (실패하면 None)
+
+        Raises:
+            ConnectionError: 사용 가능한 모든 계정에서 연결 오류가 난 경우
+        """
+        tried = []
+        auth_retries = 0
+        connection_error = None
+        while True:
+            session = self._acquire(exclude=tried)
+            if session is None:
+                if connection_error:
+                    raise connection_error
+                return None
+            tried.append(session)
+
+            session.limiter.acquire()
+            start = time.monotonic()
+            status_code = None
+            content_html = None
+            try:
+                status_code, content_html = session.api.fetch_board_content(cafe_id, article_id, art_param)
+            except ConnectionError as e:
+                connection_error = e
+                continue  # 다른 계정으로 재시도 (finally 에서 연속 실패로 기록)
+            finally:
+                self._release(session, content_html is not None, status_code, time.monotonic() - start, cafe_id)
+
+            if content_html is not None or status_code not in self.AUTH_ERROR_CODES:
+                return content_html
+            # 인증 오류는 다른 계정 하나로만 재시도 (멤버 전용 글이면 모든 계정이 실패하므로)
+            if auth_retries >= self.AUTH_RETRY_ACCOUNTS:
+                return None
+            auth_retries += 1
+
+    def max_concurrency(self, per_account=2):
+        """동시에 요청할 스레드 수 (사용 가능한 계정 수 × 계정당 동시 요청 수)"""
+        return max(1, len(self) * per_account)
+
+    def metrics(self):
+        """계정별 처리량 통계 목록"""
+        with self._lock:
+            return [session.metrics() for session in self.sessions]
@@ -2,9 +2,46 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                            QLineEdit, QPushButton, QMessageBox)
 from PyQt5.QtCore import pyqtSignal, QThread, Qt
 from ..api.auth import NaverAuth
+from ..utils.session_store import SessionStore
 import traceback
 import os
 
+class BatchLoginWorker(QThread):
+    """여러 계정을 하나의 브라우저로 로그인하는 클래스"""
+    account_result = pyqtSignal(str, bool, str, dict)  # 아이디, 성공 여부, 메시지, 헤더 정보
+    finished = pyqtSignal(int, int)  # 성공 수, 전체 수
+
+    def __init__(self, accounts, headless=False):
+        """
+        Args:
+            accounts (list): (아이디, 비밀번호) 목록
+            headless (bool): 헤드리스 브라우저 사용 여부
+        """
+        super().__init__()
+        self.accounts = accounts
+        self.headless = headless
+        self.auth = NaverAuth()
+        self._headers = {}
+
+    def run(self):
+        success_count = 0
+        try:
+            results = self.auth.login_many(self.accounts, headless=self.headless,
+                                           progress_callback=self.on_progress)
+            success_count = sum(1 for headers in results.values() if headers)
+        except Exception as e:
+            print(traceback.format_exc())
+            for username, _ in self.accounts:
+                if username not in self._headers:
+                    self.account_result.emit(username, False, f"로그인 오류: {str(e)}", {})
+        self.finished.emit(success_count, len(self.accounts))
+
+    def on_progress(self, username, success, message):
+        headers = self.auth.get_headers() if success else {}
+        self._headers[username] = headers
+        self.account_result.emit(username, success, message, headers)
+
+
 class LoginWorker(QThread):
     finished = pyqtSignal(bool, dict)  # 성공 여부, 헤더 정보
     progress = pyqtSignal(str, str)  # 메시지, 색상
@@ -26,6 +63,8 @@ class LoginWorker(QThread):
             success, headers = self.auth.login()
             
             if success:
+                if self.auth.restored:
+                    self.progress.emit(f"계정 {self.username} 저장된 세션으로 로그인했습니다.", "blue")
                 self.progress.emit(f"계정 {self.username} 로그인 성공!", "green")
                 self.finished.emit(True, headers)
             else:
@@ -244,6 +283,9 @@ class AccountWidget(QWidget):
         # 로그아웃 메시지
         self.log.info(f"계정 '{self.current_account}'에서 로그아웃합니다.")
         
+        # 저장된 로그인 세션 삭제
+        SessionStore().forget(self.current_account)
+        
         # 현재 계정 초기화
         self.current_account = None
         
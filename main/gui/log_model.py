@@ -0,0 +1,134 @@
+from collections import deque
+from datetime import datetime
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+
+
+class LogTableModel(QAbstractTableModel):
+    """로그 모니터용 고정 용량 링버퍼 테이블 모델
+
+    최근 capacity 개의 로그만 메모리에 유지하고, 그보다 오래된 로그는 파일 로그에만 남긴다.
+    append()로 들어온 로그는 대기열에 쌓였다가 한 프레임(약 16ms)마다 한 번에 반영된다.
+    """
+
+    COLUMNS = ["시간", "메시지"]
+    COL_TIME, COL_MESSAGE = range(2)
+
+    DEFAULT_CAPACITY = 2000
+    FLUSH_INTERVAL_MS = 16
+
+    COLORS = {
+        "red": Qt.red,
+        "blue": Qt.blue,
+        "green": Qt.green,
+    }
+
+    # 대기열이 반영된 뒤 발생 (뷰 자동 스크롤용)
+    rows_flushed = pyqtSignal()
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, parent=None):
+        """
+        Args:
+            capacity (int): 메모리에 유지할 최대 로그 수
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.capacity = max(1, int(capacity))
+        self._rows = deque()  # (시간, 메시지, 색상)
+        self._pending = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    # ------------------------------------------------
+    # QAbstractTableModel 인터페이스
+    # ------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        timestamp, message, color = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            return timestamp if index.column() == self.COL_TIME else message
+        if role == Qt.ForegroundRole:
+            if index.column() == self.COL_TIME:
+                return Qt.gray
+            return self.COLORS.get(color, Qt.white)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return str(section + 1)
+
+    # ------------------------------------------------
+    # 로그 추가
+    # ------------------------------------------------
+    def append(self, log_entries):
+        """로그 여러 개를 대기열에 추가 (다음 프레임에 반영)
+
+        Args:
+            log_entries (list): 로그 목록 (각 항목은 {'message', 'color'} 형태)
+        """
+        if not log_entries:
+            return
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for log_entry in log_entries:
+            self._pending.append((
+                log_entry.get('timestamp', timestamp),
+                str(log_entry.get('message', '')),
+                log_entry.get('color', 'white'),
+            ))
+
+        # 대기열이 용량을 넘으면 어차피 보이지 않을 앞부분은 버림
+        if len(self._pending) > self.capacity:
+            del self._pending[:-self.capacity]
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """대기 중인 로그를 한 번의 행 삽입으로 반영"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        entries = self._pending
+        self._pending = []
+
+        # 용량 초과분은 가장 오래된 행부터 제거
+        overflow = len(self._rows) + len(entries) - self.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self._rows.extend(entries)
+        self.endInsertRows()
+
+        self.rows_flushed.emit()
+
+    def clear(self):
+        """모든 로그 초기화"""
+        self._flush_timer.stop()
+        self.beginResetModel()
+        self._rows.clear()
+        self._pending = []
+        self.endResetModel()
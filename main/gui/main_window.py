@@ -1,19 +1,22 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QGroupBox, QPushButton, QLabel, QLineEdit, QComboBox, 
                            QAction, QFileDialog, QMenu, QMenuBar, QMessageBox, 
-                           QSystemTrayIcon, QToolBar, QInputDialog, QDialog, QProgressDialog, QFormLayout, QListWidget, QScrollArea, QSpinBox, QTableWidgetItem, QApplication, QTabWidget)
+                           QSystemTrayIcon, QToolBar, QInputDialog, QDialog, QProgressDialog, QFormLayout, QListWidget, QScrollArea, QSpinBox, QApplication, QTabWidget)
 from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings, QSize, QUrl, QRect, QPoint
 from PyQt5.QtGui import QIcon, QPixmap, QDesktopServices, QFont, QColor
 
 from .routine_tab import RoutineTab
-from .account_widget import AccountWidget
+from .account_widget import AccountWidget, BatchLoginWorker
 
 from ..utils.log import Log
 from ..utils.licence import Licence
 from ..api.auth import NaverAuth
 from ..api.ai_generator import AIGenerator
+from ..api.session_pool import SessionPool
 from .styles import DARK_STYLE
-from ..worker import Worker
+from ..worker import Worker, ReanalysisWorker
+from ..utils.run_store import RunStore
+from ..utils.dedup_index import DedupIndex
 import time
 import os
 from datetime import datetime
@@ -560,6 +563,20 @@ class TaskListItem(QWidget):
         """위젯 크기 힌트"""
         return QSize(0, 60)  # 이전보다 더 높게 설정 (두 줄 정보를 표시하므로)
 
+class LicenceWorker(QThread):
+    """라이선스를 백그라운드에서 재검증하는 클래스"""
+    verified = pyqtSignal(str, str)  # 검증 상태(Licence.VALID/INVALID/UNREACHABLE), 만료일 또는 사유 (QThread.finished 와 구분)
+
+    def __init__(self, licence, licence_key):
+        super().__init__()
+        self.licence = licence
+        self.licence_key = licence_key
+
+    def run(self):
+        status, message = self.licence.verify(self.licence_key)
+        self.verified.emit(status, message)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -581,6 +598,7 @@ class MainWindow(QMainWindow):
         # 작업 실행 상태
         self.is_running = False
         self.workers = []  # 워커 목록
+        self.pending_reanalysis_run = None  # 실행 버튼 상태 변경 후 시작할 재분석 실행 ID
         
         # 시그널 연결 상태 추적
         self.task_list_click_connected = False
@@ -591,19 +609,52 @@ class MainWindow(QMainWindow):
         # 모니터링 위젯 시그널 연결
         self.monitor_widget.execute_tasks_clicked.connect(self.run_tasks)
         
-        # 라이선스 확인
-        # if not self.check_and_create_license():
-        #     self.handle_missing_license()
-        #     return
+        # 라이선스 확인 (저장된 검증 결과가 유효하면 바로 시작하고 서버 재검증은 백그라운드에서 진행)
+        self.licence_worker = None
+        self.licence_ok = self.start_license_check()
+        if not self.licence_ok:
+            return  # 호출한 쪽(main.py)에서 종료
             
         # UI 초기화
         self.init_ui()
 
+    def start_license_check(self):
+        """시작 시 라이선스 확인
+
+        캐시된 검증 결과(만료일)가 유효하면 바로 시작하고 서버 재검증은 백그라운드에서 진행한다.
+        캐시가 없거나 만료된 경우에만 기존처럼 서버 확인이 끝날 때까지 기다린다.
+        """
+        if not self.licence.has_cached_verdict():
+            return self.check_and_create_license()
+            
+        self.log.add_log(f"저장된 라이선스로 시작합니다. (만료일: {self.licence.get_expiry_date()})", "blue")
+        self.licence_worker = LicenceWorker(self.licence, self.licence.get_licence_key())
+        self.licence_worker.verified.connect(self.on_license_verified)
+        self.licence_worker.start()
+        return True
+
+    def on_license_verified(self, status, message):
+        """백그라운드 라이선스 재검증 결과 처리"""
+        if status == Licence.VALID:
+            self.log.add_log(f"라이선스 확인 완료 (만료일: {message})", "green")
+            return
+            
+        if status == Licence.UNREACHABLE:
+            # 서버 응답이 없으면 캐시된 검증 결과로 계속 사용
+            self.log.add_log(f"라이선스 서버 확인 실패, 저장된 라이선스로 계속합니다: {message}", "orange")
+            return
+            
+        # 서버가 라이선스를 거부한 경우
+        QMessageBox.warning(self, '라이선스 오류', f'라이선스가 유효하지 않습니다.\n{message}')
+        self.licence.remove_licence()
+        if not self.handle_missing_license():
+            self.close()
+
     def check_and_create_license(self):
         """라이선스 파일을 체크하고 없으면 생성하는 함수"""
         try:
             # 라이선스 파일이 없는 경우
-            if not os.path.exists('licence.json'):
+            if not os.path.exists(self.licence.path):
                 return self.handle_missing_license()
 
             # 라이선스 파일이 있는 경우 유효성 검사
@@ -615,8 +666,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, '라이선스 오류', f'라이선스가 유효하지 않습니다.\n{message}')
                 
                 # 라이선스 파일 삭제
-                if os.path.exists('licence.json'):
-                    os.remove('licence.json')
+                self.licence.remove_licence()
                 
                 # 다시 라이선스 입력 처리
                 return self.handle_missing_license()
@@ -796,8 +846,35 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        # 검색 방식 (검색 결과를 가져오는 백엔드)
+        backend_label = QLabel("검색 방식:")
+        backend_label.setStyleSheet("color: white;")
+        self.search_backend_combo = QComboBox()
+        self.search_backend_combo.addItem("HTML", "html")
+        self.search_backend_combo.addItem("JSON (경량)", "json")
+        self.search_backend_combo.addItem("Open API", "openapi")
+        self.search_backend_combo.setToolTip("JSON은 검색 결과 목록만 받아 전송량과 파싱 시간이 적습니다.\n"
+                                             "Open API는 네이버 개발자 Client ID/Secret이 필요하며 기간/대상/거래 조건은 적용되지 않습니다.")
+        self.search_backend_combo.setStyleSheet(self.target_combo.styleSheet())
+        
         target_layout.addWidget(target_label)
         target_layout.addWidget(self.target_combo)
+        target_layout.addWidget(backend_label)
+        target_layout.addWidget(self.search_backend_combo)
+        
+        # 게시판 직접 수집 (검색 대신 선택한 가입 카페의 게시판을 읽음)
+        from PyQt5.QtWidgets import QCheckBox
+        self.board_cafes = []  # 게시판 직접 수집할 카페 목록
+        self.board_mode_check = QCheckBox("게시판 직접 수집")
+        self.board_mode_check.setStyleSheet("color: white;")
+        self.board_mode_check.setToolTip("검색 대신 선택한 가입 카페의 모든 게시판을 최신글부터 읽습니다.\n"
+                                         "'새 글만'을 선택하면 게시판별로 마지막에 본 글 이후만 수집합니다.")
+        self.board_cafe_btn = QPushButton("카페 선택")
+        self.board_cafe_btn.clicked.connect(self.show_board_cafe_dialog)
+        self.board_mode_check.toggled.connect(self.board_cafe_btn.setEnabled)
+        self.board_cafe_btn.setEnabled(False)
+        target_layout.addWidget(self.board_mode_check)
+        target_layout.addWidget(self.board_cafe_btn)
         target_widget.setLayout(target_layout)
         
         # 정렬 설정
@@ -812,8 +889,20 @@ class MainWindow(QMainWindow):
         self.search_sort_combo.addItem("최신순", "date")
         self.search_sort_combo.setStyleSheet(self.target_combo.styleSheet())
         
+        # 증분 수집 (최신순 정렬 또는 게시판 직접 수집에서 사용)
+        self.incremental_check = QCheckBox("새 글만")
+        self.incremental_check.setToolTip("최신순 정렬에서 이전 실행 이후 올라온 게시글까지만 수집합니다.")
+        self.incremental_check.setStyleSheet("color: white;")
+        self.incremental_check.setEnabled(False)
+        self.search_sort_combo.currentIndexChanged.connect(
+            lambda: self.incremental_check.setEnabled(self.search_sort_combo.currentData() == "date"
+                                                      or self.board_mode_check.isChecked()))
+        self.board_mode_check.toggled.connect(
+            lambda checked: self.incremental_check.setEnabled(checked or self.search_sort_combo.currentData() == "date"))
+        
         sort_layout.addWidget(sort_label)
         sort_layout.addWidget(self.search_sort_combo)
+        sort_layout.addWidget(self.incremental_check)
         sort_widget.setLayout(sort_layout)
         
         # 기간 설정
@@ -835,8 +924,18 @@ class MainWindow(QMainWindow):
         self.search_date_combo.setStyleSheet(self.target_combo.styleSheet())
         self.search_date_combo.setMinimumWidth(100)  # 최소 너비 설정
         
+        # 기간 분할 수 (1주 이상 기간에서 구간별 동시 검색)
+        shard_label = QLabel("분할:")
+        shard_label.setStyleSheet("color: white;")
+        self.search_shard_input = QSpinBox()
+        self.search_shard_input.setRange(1, 12)
+        self.search_shard_input.setValue(1)
+        self.search_shard_input.setToolTip("1주 이상 기간을 여러 구간으로 나누어 동시에 검색합니다. (새 글만 수집과는 함께 쓰지 않음)")
+        
         date_layout.addWidget(date_label)
         date_layout.addWidget(self.search_date_combo)
+        date_layout.addWidget(shard_label)
+        date_layout.addWidget(self.search_shard_input)
         date_widget.setLayout(date_layout)
         date_widget.setVisible(True)  # 명시적으로 보이게 설정
         
@@ -878,8 +977,23 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        self.search_shard_input.setStyleSheet(self.search_max_items_input.styleSheet())
+        
+        # 목표 일치 개수 (0이면 사용하지 않음, 지정하면 수집 개수는 검색 결과 상한)
+        target_label = QLabel("목표 일치:")
+        target_label.setStyleSheet("color: white;")
+        self.search_target_input = QSpinBox()
+        self.search_target_input.setRange(0, 1000)
+        self.search_target_input.setValue(0)
+        self.search_target_input.setSpecialValueText("사용 안 함")
+        self.search_target_input.setToolTip("필터 키워드와 AI 분석을 모두 통과한 게시글이 이 개수만큼 모이면 검색을 멈춥니다.\n"
+                                            "사용하면 수집 개수는 확인할 검색 결과의 최대 개수가 됩니다.")
+        self.search_target_input.setStyleSheet(self.search_max_items_input.styleSheet())
+        
         max_items_layout.addWidget(max_items_label)
         max_items_layout.addWidget(self.search_max_items_input)
+        max_items_layout.addWidget(target_label)
+        max_items_layout.addWidget(self.search_target_input)
         max_items_widget.setLayout(max_items_layout)
         
         trade_widget = QWidget()
@@ -1001,6 +1115,34 @@ class MainWindow(QMainWindow):
         api_key_layout.addWidget(self.api_key_status)
         api_key_widget.setLayout(api_key_layout)
         
+        # 네이버 Open API 인증 정보 (검색 방식이 Open API인 경우에만 사용)
+        naver_api_widget = QWidget()
+        naver_api_layout = QHBoxLayout()
+        naver_api_layout.setContentsMargins(0, 0, 0, 0)
+        naver_api_layout.setSpacing(5)
+        
+        naver_api_label = QLabel("Naver Open API:")
+        naver_api_label.setStyleSheet("color: white;")
+        self.naver_client_id_input = QLineEdit()
+        self.naver_client_id_input.setPlaceholderText("Client ID")
+        self.naver_client_id_input.setStyleSheet(self.api_key_input.styleSheet())
+        self.naver_client_secret_input = QLineEdit()
+        self.naver_client_secret_input.setPlaceholderText("Client Secret")
+        self.naver_client_secret_input.setEchoMode(QLineEdit.Password)
+        self.naver_client_secret_input.setStyleSheet(self.api_key_input.styleSheet())
+        
+        def update_naver_api_inputs():
+            enabled = self.search_backend_combo.currentData() == "openapi"
+            self.naver_client_id_input.setEnabled(enabled)
+            self.naver_client_secret_input.setEnabled(enabled)
+        self.search_backend_combo.currentIndexChanged.connect(update_naver_api_inputs)
+        update_naver_api_inputs()
+        
+        naver_api_layout.addWidget(naver_api_label)
+        naver_api_layout.addWidget(self.naver_client_id_input)
+        naver_api_layout.addWidget(self.naver_client_secret_input)
+        naver_api_widget.setLayout(naver_api_layout)
+        
         # AI 분석 키워드 설정
         ai_keyword_widget = QWidget()
         ai_keyword_layout = QHBoxLayout()
@@ -1010,15 +1152,26 @@ class MainWindow(QMainWindow):
         ai_keyword_label.setStyleSheet("color: white;")
         self.ai_keyword_input = QLineEdit()
         self.ai_keyword_input.setPlaceholderText("분석할 키워드를 입력하세요")
+        self.ai_keyword_input.setToolTip("여러 명령어를 '|'로 구분하면 한 번의 요청으로 함께 분석하고,\n"
+                                         "일치한 명령어를 결과의 태그 컬럼에 표시합니다.")
         self.ai_keyword_input.setStyleSheet(self.api_key_input.styleSheet())
         
+        # 미리보기 우선 분류 (애매한 게시글만 본문을 가져와 분석)
+        self.snippet_triage_check = QCheckBox("미리보기 우선 분류")
+        self.snippet_triage_check.setToolTip("제목과 검색 결과 미리보기만으로 먼저 판단하고,\n"
+                                             "판단이 애매한 게시글만 본문을 가져와 AI로 분석합니다.")
+        self.snippet_triage_check.setStyleSheet("color: white;")
+        self.snippet_triage_check.setChecked(True)
+        
         ai_keyword_layout.addWidget(ai_keyword_label)
         ai_keyword_layout.addWidget(self.ai_keyword_input)
+        ai_keyword_layout.addWidget(self.snippet_triage_check)
         ai_keyword_widget.setLayout(ai_keyword_layout)
         
         # AI 설정 추가
         ai_layout.addWidget(filter_keyword_widget)  # 필터 키워드 추가
         ai_layout.addWidget(api_key_widget)
+        ai_layout.addWidget(naver_api_widget)
         ai_layout.addWidget(ai_keyword_widget)
         ai_settings.setLayout(ai_layout)
         
@@ -1106,6 +1259,16 @@ class MainWindow(QMainWindow):
         task_settings_action.triggered.connect(self.show_task_settings_dialog)
         file_menu.addAction(task_settings_action)
         
+        # 계정 일괄 로그인 메뉴
+        batch_login_action = QAction('계정 일괄 로그인', self)
+        batch_login_action.triggered.connect(self.show_batch_login_dialog)
+        file_menu.addAction(batch_login_action)
+        
+        # 저장된 실행 결과 재분석 메뉴
+        reanalysis_action = QAction('결과 재분석', self)
+        reanalysis_action.triggered.connect(self.show_reanalysis_dialog)
+        file_menu.addAction(reanalysis_action)
+        
         # 구분선
         file_menu.addSeparator()
         
@@ -1132,6 +1295,191 @@ class MainWindow(QMainWindow):
         contact_action.triggered.connect(self.show_contact_info)
         help_menu.addAction(contact_action)
 
+    def show_reanalysis_dialog(self):
+        """저장된 실행 결과를 선택해 현재 필터 키워드/AI 분석 명령어로 재분석"""
+        if self.routine_tab.is_running:
+            QMessageBox.information(self, '알림', '작업이 실행 중입니다. 작업이 끝난 뒤 다시 시도해주세요.')
+            return
+            
+        runs = RunStore().list_runs()
+        if not runs:
+            QMessageBox.information(self, '알림', '저장된 실행 결과가 없습니다.\n작업을 한 번 실행하면 검색 결과와 본문이 저장됩니다.')
+            return
+            
+        labels = [
+            f"{run.get('created_at', '')} | {', '.join(run.get('keywords', [])) or '게시판 직접 수집'} | "
+            f"게시글 {run.get('item_count', 0)}개 (본문 {run.get('content_count', 0)}개)"
+            for run in runs
+        ]
+        label, ok = QInputDialog.getItem(
+            self, '결과 재분석',
+            '재분석할 실행 결과를 선택해주세요.\n현재 입력된 필터 키워드와 AI 분석 명령어를 적용하며, 네이버에는 요청하지 않습니다.',
+            labels, 0, False
+        )
+        if not ok:
+            return
+            
+        # 재분석 결과만 보이도록 모니터를 비움 (이전 명령어의 판정과 섞이지 않게)
+        if self.routine_tab.result_model.rowCount() > 0:
+            reply = QMessageBox.question(
+                self, '결과 재분석',
+                '재분석 결과만 표시하기 위해 작업 모니터의 현재 수집 결과를 비웁니다.\n계속하시겠습니까?',
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+            self.routine_tab.result_model.clear()
+            
+        # 실행 버튼 상태를 바꾸면 run_tasks 에서 재분석을 시작 (중지 버튼도 그대로 사용)
+        self.pending_reanalysis_run = runs[labels.index(label)]['run_id']
+        self.routine_tab.toggle_execution()
+
+    def start_reanalysis(self, run_id):
+        """저장된 실행 결과 재분석 Worker 시작"""
+        filter_keywords = [k.strip() for k in self.filter_keyword_input.text().split(',') if k.strip()]
+        ai_filter_command = self.ai_keyword_input.text().strip()
+        api_key = self.api_key_input.text().strip()
+        if ai_filter_command and not api_key:
+            self.log.error("OpenAI API 키가 입력되지 않았습니다.")
+            QMessageBox.warning(self, "API 키 필요", "OpenAI API 키를 입력해주세요.\n이 키는 AI 분석에 필요합니다.")
+            self.routine_tab.toggle_execution()  # 상태 되돌림
+            return
+            
+        # 기존 Worker 종료
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            self.worker.stop()
+            self.worker.wait(1000)  # 최대 1초 대기
+            
+        # 중복 체크는 이번 재분석 결과 안에서만 (모니터의 이전 결과와 비교하면 여전히 일치하는 글이 빠짐)
+        self.worker = ReanalysisWorker(
+            run_id,
+            api_key=api_key,
+            options={"filter_keywords": filter_keywords, "ai_filter_command": ai_filter_command},
+            dedup_index=DedupIndex()
+        )
+        self.worker.log_messages.connect(self.on_log_messages)
+        self.worker.posts_found.connect(self.on_posts_found)
+        self.worker.tasks_completed.connect(self.on_all_tasks_completed)
+        self.worker.progress_updated.connect(self.routine_tab.update_progress)
+        self.worker.start()
+        self.log.info(f"저장된 실행 결과 재분석을 시작했습니다: {run_id}")
+
+    def show_batch_login_dialog(self):
+        """계정 일괄 로그인 대화상자 표시"""
+        from PyQt5.QtWidgets import QCheckBox, QDialogButtonBox, QListWidgetItem
+        
+        if getattr(self, 'batch_login_worker', None) and self.batch_login_worker.isRunning():
+            QMessageBox.information(self, '알림', '일괄 로그인이 진행 중입니다.')
+            return
+            
+        if not self.accounts:
+            QMessageBox.warning(self, '경고', '등록된 계정이 없습니다.\n설정을 불러오거나 계정을 먼저 추가해주세요.')
+            return
+            
+        dialog = QDialog(self)
+        dialog.setWindowTitle('계정 일괄 로그인')
+        dialog.setMinimumWidth(350)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel('로그인할 계정을 선택해주세요.'))
+        
+        account_list = QListWidget()
+        for account_id, account_info in self.accounts.items():
+            item = QListWidgetItem(account_id)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            # 아직 로그인되지 않은 계정만 기본 선택
+            item.setCheckState(Qt.Checked if account_info.get('headers') is None else Qt.Unchecked)
+            account_list.addItem(item)
+        layout.addWidget(account_list)
+        
+        headless_check = QCheckBox('브라우저 창 없이 로그인 (2차 인증 계정 제외)')
+        layout.addWidget(headless_check)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return
+            
+        selected = []
+        for row in range(account_list.count()):
+            item = account_list.item(row)
+            if item.checkState() == Qt.Checked:
+                account_id = item.text()
+                selected.append((account_id, self.accounts[account_id]['pw']))
+                
+        if not selected:
+            return
+            
+        self.log.info(f"{len(selected)}개 계정 일괄 로그인을 시작합니다.")
+        self.batch_login_worker = BatchLoginWorker(selected, headless=headless_check.isChecked())
+        self.batch_login_worker.account_result.connect(self.on_batch_login_result)
+        self.batch_login_worker.finished.connect(self.on_batch_login_finished)
+        self.batch_login_worker.start()
+
+    def on_batch_login_result(self, account_id, success, message, headers):
+        """일괄 로그인 계정별 결과 처리"""
+        if success:
+            self.accounts.setdefault(account_id, {'pw': '', 'headers': None})['headers'] = headers
+            if self.account_headers is None:
+                self.account_headers = headers
+            self.on_login_progress(f"계정 {account_id}: {message}", "green")
+        else:
+            self.on_login_progress(f"계정 {account_id}: {message}", "red")
+
+    def on_batch_login_finished(self, success_count, total_count):
+        """일괄 로그인 완료 처리"""
+        color = "green" if success_count == total_count else "orange"
+        self.on_login_progress(f"일괄 로그인 완료: {success_count}/{total_count}개 계정 성공", color)
+
+    def show_board_cafe_dialog(self):
+        """게시판 직접 수집할 가입 카페 선택 대화상자 표시"""
+        from PyQt5.QtWidgets import QDialogButtonBox, QListWidgetItem
+        from ..api.cafe import CafeAPI
+        
+        if not self.account_headers:
+            QMessageBox.warning(self, '경고', '가입 카페 목록을 불러오려면 계정으로 로그인해야 합니다.')
+            return
+            
+        try:
+            cafes = CafeAPI(self.account_headers).get_cafe_list()
+        except Exception as e:
+            self.log.error(f"가입 카페 목록 조회 실패: {str(e)}")
+            QMessageBox.warning(self, '오류', '가입 카페 목록을 불러오지 못했습니다.')
+            return
+            
+        dialog = QDialog(self)
+        dialog.setWindowTitle('게시판 직접 수집 카페 선택')
+        dialog.setMinimumWidth(350)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel('모든 게시판을 수집할 카페를 선택해주세요.'))
+        
+        selected_ids = {str(cafe['cafe_id']) for cafe in self.board_cafes}
+        cafe_list = QListWidget()
+        for cafe in cafes:
+            item = QListWidgetItem(f"{cafe['cafe_name']} ({cafe['cafe_url']})")
+            item.setData(Qt.UserRole, cafe)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if str(cafe['cafe_id']) in selected_ids else Qt.Unchecked)
+            cafe_list.addItem(item)
+        layout.addWidget(cafe_list)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return
+            
+        self.board_cafes = [
+            cafe_list.item(row).data(Qt.UserRole) for row in range(cafe_list.count())
+            if cafe_list.item(row).checkState() == Qt.Checked
+        ]
+        self.board_cafe_btn.setText(f"카페 선택 ({len(self.board_cafes)})" if self.board_cafes else "카페 선택")
+        self.log.info(f"게시판 직접 수집 카페 {len(self.board_cafes)}개를 선택했습니다.")
+
     def show_task_settings_dialog(self):
         """설정 관리 대화상자 표시"""
         from main.gui.task_settings_dialog import SettingsDialog
@@ -1238,15 +1586,22 @@ class MainWindow(QMainWindow):
                 'keywords': search_keywords,
                 'target': target_text,
                 'target_value': target_data,
+                'search_backend': self.search_backend_combo.currentData(),
+                'source': 'boards' if self.board_mode_check.isChecked() else 'search',
+                'board_cafes': self.board_cafes,
                 'sort_option': sort_text,
                 'sort_value': sort_data,
+                'incremental': self.incremental_check.isChecked(),
                 'date_option': date_option,
+                'shards': self.search_shard_input.value(),
                 'max_items': max_items,  # 수집 개수 설정 추가
+                'target_matches': self.search_target_input.value(),
                 'trade_method': trade_method_text,
                 'trade_method_value': trade_method,
                 'trade_status': status_text,
                 'trade_status_value': status,
                 'ai_keywords': ai_keywords,
+                'snippet_triage': self.snippet_triage_check.isChecked(),
                 'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
             
@@ -1258,6 +1613,8 @@ class MainWindow(QMainWindow):
             # 전역 설정 (작업 외 설정)
             settings['task_settings'] = {
                 'api_key': self.api_key_input.text().strip(),
+                'naver_client_id': self.naver_client_id_input.text().strip(),
+                'naver_client_secret': self.naver_client_secret_input.text().strip(),
                 'search_keywords': self.keyword_input.text().strip(),
                 'ai_keywords': ai_keywords_text,
             }
@@ -1297,6 +1654,11 @@ class MainWindow(QMainWindow):
             # 1. API 키 및 기타 설정 적용
             task_settings = settings_data.get('task_settings', {})
             
+            # 네이버 Open API 인증 정보 적용
+            if hasattr(self, 'naver_client_id_input'):
+                self.naver_client_id_input.setText(task_settings.get('naver_client_id', ''))
+                self.naver_client_secret_input.setText(task_settings.get('naver_client_secret', ''))
+            
             # API 키 적용
             if hasattr(self, 'api_key_input') and 'api_key' in task_settings:
                 self.api_key_input.setText(task_settings['api_key'])
@@ -1332,6 +1694,12 @@ class MainWindow(QMainWindow):
                         self.target_combo.setCurrentIndex(index)
                         print(f"검색 대상 적용됨: {first_task.get('target', '')}")
                 
+                # 검색 방식 적용
+                if hasattr(self, 'search_backend_combo'):
+                    index = self.search_backend_combo.findData(first_task.get('search_backend', 'html'))
+                    if index >= 0:
+                        self.search_backend_combo.setCurrentIndex(index)
+                
                 # 정렬 설정 적용
                 if hasattr(self, 'search_sort_combo') and 'sort_value' in first_task:
                     sort_value = first_task['sort_value']
@@ -1340,6 +1708,10 @@ class MainWindow(QMainWindow):
                         self.search_sort_combo.setCurrentIndex(index)
                         print(f"정렬 방식 적용됨: {first_task.get('sort_option', '')}")
                 
+                # 증분 수집 설정 적용
+                if hasattr(self, 'incremental_check'):
+                    self.incremental_check.setChecked(first_task.get('incremental', False))
+                
                 # 기간 설정 적용
                 if hasattr(self, 'search_date_combo') and 'date_option' in first_task:
                     date_option = first_task['date_option']
@@ -1348,12 +1720,30 @@ class MainWindow(QMainWindow):
                         self.search_date_combo.setCurrentIndex(index)
                         print(f"기간 옵션 적용됨: {date_option}")
                 
+                # 기간 분할 수 적용
+                if hasattr(self, 'search_shard_input'):
+                    self.search_shard_input.setValue(first_task.get('shards', 1))
+                
                 # 수집 개수 설정 적용
                 if hasattr(self, 'search_max_items_input') and 'max_items' in first_task:
                     max_items = first_task['max_items']
                     self.search_max_items_input.setValue(max_items)
                     print(f"수집 개수 적용됨: {max_items}개")
                 
+                # 게시판 직접 수집 설정 적용
+                if hasattr(self, 'board_mode_check'):
+                    self.board_cafes = first_task.get('board_cafes', [])
+                    self.board_cafe_btn.setText(f"카페 선택 ({len(self.board_cafes)})" if self.board_cafes else "카페 선택")
+                    self.board_mode_check.setChecked(first_task.get('source', 'search') == 'boards')
+                
+                # 미리보기 우선 분류 적용
+                if hasattr(self, 'snippet_triage_check'):
+                    self.snippet_triage_check.setChecked(first_task.get('snippet_triage', True))
+                
+                # 목표 일치 개수 적용
+                if hasattr(self, 'search_target_input'):
+                    self.search_target_input.setValue(first_task.get('target_matches', 0))
+                
                 # 거래 방법 설정 적용
                 if hasattr(self, 'trade_combo') and 'trade_method_value' in first_task:
                     trade_method = first_task['trade_method_value']
@@ -1374,6 +1764,11 @@ class MainWindow(QMainWindow):
             accounts = settings_data.get('accounts', {})
             
             if accounts:
+                # 일괄 로그인에서 사용할 수 있도록 계정 목록 등록 (로그인 정보는 유지)
+                for saved_id, saved_data in accounts.items():
+                    if saved_id not in self.accounts:
+                        self.accounts[saved_id] = {'pw': saved_data.get('pw', ''), 'headers': None}
+                
                 # account_widget에 계정 목록 설정
                 if hasattr(self, 'account_widget'):
                     account_id = next(iter(accounts.keys()), '')
@@ -1425,6 +1820,10 @@ class MainWindow(QMainWindow):
         """Worker에서 전송한 로그 메시지 처리"""
         self.routine_tab.add_log_message(message_data)
         
+    def on_log_messages(self, messages):
+        """Worker에서 묶음으로 전송한 로그 메시지 처리"""
+        self.routine_tab.add_log_messages(messages)
+        
     def on_post_found(self, post_info):
         """Worker에서 게시글 발견 시 호출되는 메서드
         
@@ -1435,36 +1834,28 @@ class MainWindow(QMainWindow):
                 - content (str): 게시글 제목/내용
                 - url (str): 게시글 URL
         """
-        # 게시글 발견 로그 추가
-        self.log_message(f"🔍 게시글 발견: {post_info.get('content', '')[:30]}...", "green")
+        self.on_posts_found([post_info])
         
-        # 모니터 위젯에 게시글 정보 추가
-        try:
-            # 현재 테이블에 행 추가
-            row = self.routine_tab.task_monitor.rowCount()
-            self.routine_tab.task_monitor.insertRow(row)
-            
-            # 아이템 생성
-            no_item = QTableWidgetItem(str(post_info.get('no', row + 1)))
-            id_item = QTableWidgetItem(post_info.get('id', ''))
-            content_item = QTableWidgetItem(post_info.get('content', ''))
-            url_item = QTableWidgetItem(post_info.get('url', ''))
-            
-            # 아이템 설정
-            self.routine_tab.task_monitor.setItem(row, 0, no_item)
-            self.routine_tab.task_monitor.setItem(row, 1, id_item)
-            self.routine_tab.task_monitor.setItem(row, 2, content_item)
-            self.routine_tab.task_monitor.setItem(row, 3, url_item)
-            
-            # URL 스타일 적용
-            self.routine_tab.on_post_added(row)
-            
-        except Exception as e:
-            self.log.error(f"게시글 정보 추가 중 오류 발생: {str(e)}")
-            print(f"게시글 정보 추가 오류: {str(e)}")
+    def on_posts_found(self, posts):
+        """Worker에서 묶음으로 전송한 발견 게시글을 한 번에 모니터에 추가
+        
+        Args:
+            posts (list): 게시글 정보 목록 (각 항목은 on_post_found의 post_info 형태)
+        """
+        if not posts:
+            return
             
-            # 새로 추가된 행으로 스크롤
-            self.routine_tab.task_monitor.scrollToBottom()
+        # 게시글 발견 로그 추가 (파일 로그 + 모니터 한 번에 반영)
+        log_entries = []
+        for post_info in posts:
+            message = f"🔍 게시글 발견: {post_info.get('content', '')[:30]}..."
+            self.log.add_log(message, "green")
+            log_entries.append({'message': message, 'color': 'green'})
+        self.routine_tab.add_log_messages(log_entries)
+        
+        # 모니터 위젯에 게시글 정보 추가 (결과 모델에 한 번에 추가, 중복 체크 인덱스도 함께 갱신)
+        try:
+            self.routine_tab.add_results(posts)
         except Exception as e:
             self.log_message(f"모니터 위젯에 게시글 정보 추가 중 오류 발생: {str(e)}", "red")
             
@@ -1495,29 +1886,12 @@ class MainWindow(QMainWindow):
         
         # 모니터 위젯에 댓글 정보 추가
         try:
-            # 현재 테이블에 행 추가
-            row = self.routine_tab.task_monitor.rowCount()
-            self.routine_tab.task_monitor.insertRow(row)
-            
-            # 아이템 생성
-            no_item = QTableWidgetItem(str(row + 1))
-            id_item = QTableWidgetItem(post_info.get('account_id', ''))
-            content_item = QTableWidgetItem(post_info.get('content', ''))
-            url_item = QTableWidgetItem(post_info.get('url', ''))
-            
-            # 아이템 설정
-            self.routine_tab.task_monitor.setItem(row, 0, no_item)
-            self.routine_tab.task_monitor.setItem(row, 1, id_item)
-            self.routine_tab.task_monitor.setItem(row, 2, content_item)
-            self.routine_tab.task_monitor.setItem(row, 3, url_item)
-            
-            # URL 스타일 적용
-            if hasattr(self.routine_tab, 'create_url_widget') and post_info.get('url'):
-                url_widget = self.routine_tab.create_url_widget(post_info.get('url'))
-                self.routine_tab.task_monitor.setCellWidget(row, 3, url_widget)
-            
-            # 새로 추가된 행으로 스크롤
-            self.routine_tab.task_monitor.scrollToBottom()
+            self.routine_tab.add_results([{
+                'no': self.routine_tab.result_model.rowCount() + 1,
+                'id': post_info.get('account_id', ''),
+                'content': post_info.get('content', ''),
+                'url': post_info.get('url', '')
+            }])
         except Exception as e:
             self.log_message(f"모니터 위젯에 댓글 정보 추가 중 오류 발생: {str(e)}", "red")
 
@@ -1850,6 +2224,12 @@ class MainWindow(QMainWindow):
             if is_running:
                 self.log.info("작업을 시작합니다.")
                 
+                # 저장된 실행 결과 재분석 (네이버에 요청하지 않으므로 로그인 불필요)
+                if self.pending_reanalysis_run:
+                    run_id, self.pending_reanalysis_run = self.pending_reanalysis_run, None
+                    self.start_reanalysis(run_id)
+                    return
+                
                 # 필수 값 검증
                 if not hasattr(self, 'account_headers') or not self.account_headers:
                     self.log.error("로그인된 계정 정보가 없습니다. 계정을 로그인해주세요.")
@@ -1858,8 +2238,15 @@ class MainWindow(QMainWindow):
                     return
                 
                 # 현재 UI에서 직접 값을 가져옴
-                search_keyword = self.keyword_input.text().strip()
-                if not search_keyword:
+                # 쉼표로 구분된 검색어는 Worker에서 검색어별로 동시에 검색 후 병합
+                search_keywords = [k.strip() for k in self.keyword_input.text().split(',') if k.strip()]
+                board_mode = self.board_mode_check.isChecked()
+                if board_mode and not self.board_cafes:
+                    self.log.error("게시판 직접 수집할 카페가 선택되지 않았습니다.")
+                    QMessageBox.warning(self, "카페 선택 필요", "게시판 직접 수집할 카페를 선택해주세요.")
+                    self.routine_tab.toggle_execution()  # 상태 되돌림
+                    return
+                if not search_keywords and not board_mode:
                     self.log.error("검색 키워드가 입력되지 않았습니다.")
                     QMessageBox.warning(self, "검색 키워드 필요", "검색할 키워드를 입력해주세요.")
                     self.routine_tab.toggle_execution()  # 상태 되돌림
@@ -1914,28 +2301,38 @@ class MainWindow(QMainWindow):
                 
                 options = {
                     "cafe_where": target_combo_data,
+                    "search_backend": self.search_backend_combo.currentData(),
+                    "naver_client_id": self.naver_client_id_input.text().strip(),
+                    "naver_client_secret": self.naver_client_secret_input.text().strip(),
                     "sort": sort_option,
                     "date_option": date_option,
                     "max_items": max_items,
                     "page_delay": 1,
+                    "incremental": self.incremental_check.isChecked() and (sort_option == "date" or board_mode),
+                    "source": "boards" if board_mode else "search",
+                    "board_cafes": self.board_cafes,
+                    "shards": self.search_shard_input.value(),
+                    "target_matches": self.search_target_input.value(),
+                    "trade_method": self.trade_combo.currentData(),
+                    "trade_status": self.status_combo.currentData(),
                     "ai_filter_command": ai_filter_command,
+                    "snippet_triage": self.snippet_triage_check.isChecked(),
                     "filter_keywords": filter_keywords  # 필터 키워드 추가
                 }
                 
-                # Worker 생성 및 시작
+                # Worker 생성 및 시작 (중복 검사는 모니터와 공유하는 인덱스로 처리)
                 self.worker = Worker(
                     headers=self.account_headers,
-                    search_keyword=search_keyword,
+                    search_keyword=search_keywords,
                     api_key=api_key,
-                    options=options
+                    options=options,
+                    dedup_index=self.routine_tab.dedup_index,
+                    session_pool=self.build_session_pool()
                 )
                 
-                # Worker의 routine_tab 설정 (중복 검사를 위해)
-                self.worker.routine_tab = self.routine_tab
-                
                 # 시그널 연결
-                self.worker.log_message.connect(self.on_log_message)
-                self.worker.post_found.connect(self.on_post_found)
+                self.worker.log_messages.connect(self.on_log_messages)
+                self.worker.posts_found.connect(self.on_posts_found)
                 self.worker.next_task_info.connect(self.on_next_task_info)
                 self.worker.tasks_completed.connect(self.on_all_tasks_completed)
                 self.worker.progress_updated.connect(self.routine_tab.update_progress)  # 진행상황 시그널 연결
@@ -2028,8 +2425,21 @@ class MainWindow(QMainWindow):
         """로그인 성공 시 호출되는 메서드"""
         # Worker에서 사용할 account_headers 설정
         self.account_headers = headers
+        
+        # 세션 풀에서 사용할 수 있도록 계정별 헤더 저장
+        account_id = self.account_widget.current_account
+        if account_id in self.accounts:
+            self.accounts[account_id]['headers'] = headers
         self.log.info("로그인 성공: 작업용 계정 헤더가 설정되었습니다.")
         
+    def build_session_pool(self):
+        """로그인된 모든 계정으로 게시글 내용 요청용 세션 풀 생성"""
+        accounts = {account_id: info['headers'] for account_id, info in self.accounts.items()
+                    if info.get('headers')}
+        if not accounts and self.account_headers:
+            accounts = {self.account_widget.current_account or 'default': self.account_headers}
+        return SessionPool(accounts)
+        
     def add_account_to_list(self, account_id, password):
         """계정 목록에 계정 추가"""
         # 계정 정보 설정
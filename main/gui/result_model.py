@@ -0,0 +1,134 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtWidgets import QStyledItemDelegate
+from ..utils.dedup_index import DedupIndex
+
+
+class ResultTableModel(QAbstractTableModel):
+    """수집 결과 모니터용 테이블 모델
+
+    행마다 위젯 아이템을 만들지 않고 컬럼별 리스트(column store)에 값만 저장한다.
+    뷰는 화면에 보이는 행만 data()로 요청하므로 결과가 많아져도 UI가 느려지지 않는다.
+    """
+
+    COLUMNS = ["NO", "아이디", "내용", "URL", "태그"]
+    COL_NO, COL_ID, COL_CONTENT, COL_URL, COL_TAGS = range(5)
+
+    def __init__(self, dedup_index=None, parent=None):
+        """
+        Args:
+            dedup_index (DedupIndex): 행 추가 시 함께 갱신할 중복 체크 인덱스
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.dedup_index = dedup_index or DedupIndex()
+        self._columns = [[] for _ in self.COLUMNS]
+
+    # ------------------------------------------------
+    # QAbstractTableModel 인터페이스
+    # ------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._columns[self.COL_NO])
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._columns[index.column()][index.row()]
+
+        if role == Qt.DisplayRole:
+            return str(value)
+        if role == Qt.UserRole:
+            return value
+        if role == Qt.ToolTipRole and index.column() == self.COL_URL and value:
+            return "클릭하여 브라우저에서 열기"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """컬럼 기준 정렬 (헤더 클릭 시 호출)"""
+        if column < 0 or column >= len(self.COLUMNS) or self.rowCount() == 0:
+            return
+
+        key_column = self._columns[column]
+        if column == self.COL_NO:
+            sort_key = lambda i: key_column[i]
+        else:
+            sort_key = lambda i: str(key_column[i])
+        order_index = sorted(range(len(key_column)), key=sort_key,
+                             reverse=(order == Qt.DescendingOrder))
+
+        self.layoutAboutToBeChanged.emit()
+        self._columns = [[col[i] for i in order_index] for col in self._columns]
+        self.layoutChanged.emit()
+
+    # ------------------------------------------------
+    # 결과 저장소 인터페이스
+    # ------------------------------------------------
+    def append_rows(self, rows):
+        """여러 행을 한 번에 추가
+
+        Args:
+            rows (list): 행 목록 (각 항목은 {'no', 'id', 'content', 'url', 'tags'} 형태, tags 는 선택)
+        """
+        if not rows:
+            return
+
+        start = self.rowCount()
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        for offset, row in enumerate(rows):
+            no = row.get('no', start + offset + 1)
+            item_id = row.get('id', '')
+            content = row.get('content', '')
+            self._columns[self.COL_NO].append(int(no) if str(no).isdigit() else no)
+            self._columns[self.COL_ID].append(item_id)
+            self._columns[self.COL_CONTENT].append(content)
+            self._columns[self.COL_URL].append(row.get('url', ''))
+            self._columns[self.COL_TAGS].append(row.get('tags', ''))
+            self.dedup_index.add(item_id, content)
+        self.endInsertRows()
+
+    def clear(self):
+        """모든 행 및 중복 체크 인덱스 초기화"""
+        self.beginResetModel()
+        self._columns = [[] for _ in self.COLUMNS]
+        self.dedup_index.clear()
+        self.endResetModel()
+
+    def url_at(self, row):
+        """행의 URL 반환"""
+        return self._columns[self.COL_URL][row]
+
+    def snapshot(self):
+        """현재 컬럼 데이터의 얕은 복사본 반환 (다른 스레드에서 안전하게 순회하기 위함)"""
+        return [list(col) for col in self._columns]
+
+    def iter_rows(self):
+        """현재 행을 (NO, 아이디, 내용, URL, 태그) 튜플로 순회"""
+        return zip(*self._columns)
+
+
+class UrlDelegate(QStyledItemDelegate):
+    """URL 컬럼을 링크 스타일로 그리는 델리게이트 (행마다 스타일을 지정하지 않음)"""
+
+    def __init__(self, parent=None, color="blue"):
+        super().__init__(parent)
+        self.link_color = QColor(color)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.palette.setColor(QPalette.Text, self.link_color)
+        option.palette.setColor(QPalette.HighlightedText, self.link_color)
+        option.font.setUnderline(True)
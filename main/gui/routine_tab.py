@@ -1,12 +1,16 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QGroupBox, QLabel, QTableWidget, 
-                           QHeaderView, QTableWidgetItem, QTabWidget, 
+                           QPushButton, QGroupBox, QLabel, QTableView,
+                           QHeaderView, QTabWidget, 
                            QTextEdit, QMessageBox, QFileDialog, QProgressBar)
 from PyQt5.QtCore import Qt, pyqtSignal, QUrl, QThread
-from PyQt5.QtGui import QTextOption, QDesktopServices, QColor
+from PyQt5.QtGui import QTextOption, QDesktopServices
 from datetime import datetime
 from ..utils.log import Log
-import pandas as pd
+from ..utils.dedup_index import DedupIndex
+from .result_model import ResultTableModel, UrlDelegate
+from .log_model import LogTableModel
+from ..utils.exporter import export_rows, EXPORT_FILTERS
+import os
 import threading  # 스레드 모듈 추가
 
 class UrlOpenerThread(QThread):
@@ -23,6 +27,33 @@ class UrlOpenerThread(QThread):
         except Exception as e:
             print(f"URL 열기 오류: {e}")
 
+class ExportWorker(QThread):
+    """수집 결과를 별도의 스레드에서 파일로 내보내는 클래스"""
+    progress = pyqtSignal(int, int)  # 완료 행 수, 전체 행 수
+    finished = pyqtSignal(bool, str, int)  # 성공 여부, 파일 경로 또는 오류 메시지, 행 수
+
+    def __init__(self, filename, columns, snapshot):
+        """
+        Args:
+            filename (str): 저장할 파일 경로
+            columns (list): 컬럼 이름 목록
+            snapshot (list): 결과 모델의 컬럼별 데이터 복사본 (ResultTableModel.snapshot())
+        """
+        super().__init__()
+        self.filename = filename
+        self.columns = columns
+        self.snapshot = snapshot
+
+    def run(self):
+        try:
+            total = len(self.snapshot[0]) if self.snapshot else 0
+            count = export_rows(self.filename, self.columns, zip(*self.snapshot), total,
+                                progress_callback=self.progress.emit)
+            self.finished.emit(True, self.filename, count)
+        except Exception as e:
+            self.finished.emit(False, str(e), 0)
+
+
 class RoutineTab(QWidget):
     execute_tasks_clicked = pyqtSignal(bool)  # 작업 실행/정지 시그널
     
@@ -30,6 +61,9 @@ class RoutineTab(QWidget):
         super().__init__()
         self.log = log
         self.is_running = False  # 실행 상태
+        self.dedup_index = DedupIndex()  # 수집 결과 중복 체크 인덱스 (Worker와 공유)
+        self.result_model = ResultTableModel(self.dedup_index, self)  # 수집 결과 저장소
+        self.export_worker = None  # 파일 내보내기 스레드
         self.init_ui()
 
     def init_ui(self):
@@ -92,12 +126,13 @@ class RoutineTab(QWidget):
         button_layout.addWidget(self.clear_btn)
         button_container.setLayout(button_layout)
         
-        # 작업 모니터 테이블
-        self.task_monitor = QTableWidget(0, 4)
-        self.task_monitor.setHorizontalHeaderLabels(["NO", "아이디", "내용", "URL"])
+        # 작업 모니터 테이블 (모델 기반 가상화 뷰)
+        self.task_monitor = QTableView()
+        self.task_monitor.setModel(self.result_model)
+        self.task_monitor.setItemDelegateForColumn(ResultTableModel.COL_URL, UrlDelegate(self.task_monitor))
         
         # URL 클릭 이벤트 연결
-        self.task_monitor.cellClicked.connect(self.handle_cell_click)
+        self.task_monitor.clicked.connect(self.handle_index_click)
         
         # 컬럼 너비 설정
         header = self.task_monitor.horizontalHeader()
@@ -105,10 +140,16 @@ class RoutineTab(QWidget):
         header.setSectionResizeMode(1, QHeaderView.Fixed)  # 아이디
         header.setSectionResizeMode(2, QHeaderView.Stretch)  # 내용
         header.setSectionResizeMode(3, QHeaderView.Fixed)  # URL
+        header.setSectionResizeMode(4, QHeaderView.Interactive)  # 태그
         
         self.task_monitor.setColumnWidth(0, 50)  # NO
         self.task_monitor.setColumnWidth(1, 100)  # 아이디
         self.task_monitor.setColumnWidth(3, 150)  # URL
+        self.task_monitor.setColumnWidth(4, 120)  # 태그
+        
+        # 헤더 클릭 정렬 (초기 정렬 없이 추가 순서 유지)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.task_monitor.setSortingEnabled(True)
         
         # 가로 스크롤바 숨기기
         self.task_monitor.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -118,13 +159,13 @@ class RoutineTab(QWidget):
         
         # 테이블 스타일 설정
         self.task_monitor.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 border: 1px solid #3d3d3d;
                 border-radius: 4px;
                 gridline-color: #3d3d3d;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 border: none;
             }
@@ -142,8 +183,11 @@ class RoutineTab(QWidget):
         """)
         
         # 로그 모니터 추가
-        self.log_monitor = QTableWidget(0, 2)
-        self.log_monitor.setHorizontalHeaderLabels(["시간", "메시지"])
+        self.log_model = LogTableModel(parent=self)
+        self.log_monitor = QTableView()
+        self.log_monitor.setModel(self.log_model)
+        self.log_monitor.setEditTriggers(QTableView.NoEditTriggers)
+        self.log_model.rows_flushed.connect(self.log_monitor.scrollToBottom)
         
         # 로그 모니터 코너 버튼 배경색 설정
         self.log_monitor.setCornerButtonEnabled(False)
@@ -163,13 +207,13 @@ class RoutineTab(QWidget):
         
         # 로그 모니터 스타일 설정
         self.log_monitor.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 border: 1px solid #3d3d3d;
                 border-radius: 4px;
                 gridline-color: #3d3d3d;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 border: none;
                 min-height: 25px;
@@ -335,35 +379,15 @@ class RoutineTab(QWidget):
 
     def add_log_message(self, log_entry):
         """로그 메시지 추가"""
-        message = log_entry.get('message', '')
-        color = log_entry.get('color', 'white')
-        
-        # 로그 테이블에 새 행 추가
-        row = self.log_monitor.rowCount()
-        self.log_monitor.insertRow(row)
-        
-        # 시간 아이템 생성
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        time_item = QTableWidgetItem(current_time)
-        time_item.setForeground(Qt.gray)
-        
-        # 메시지 아이템 생성
-        message_item = QTableWidgetItem(message)
-        if color == "red":
-            message_item.setForeground(Qt.red)
-        elif color == "blue":
-            message_item.setForeground(Qt.blue)
-        elif color == "green":
-            message_item.setForeground(Qt.green)
-        else:
-            message_item.setForeground(Qt.white)
-        
-        # 아이템 설정
-        self.log_monitor.setItem(row, 0, time_item)
-        self.log_monitor.setItem(row, 1, message_item)
-        
-        # 새로 추가된 행으로 스크롤
-        self.log_monitor.scrollToBottom()
+        self.add_log_messages([log_entry])
+
+    def add_log_messages(self, log_entries):
+        """로그 메시지 여러 개 추가
+
+        로그 모델의 대기열에 넣으면 다음 프레임에 한 번의 행 삽입으로 반영되고,
+        용량을 넘는 오래된 로그는 화면에서 제거된다 (파일 로그에는 그대로 남음).
+        """
+        self.log_model.append(log_entries)
 
     def update_next_task_info(self, info):
         """다음 작업 정보 업데이트
@@ -411,7 +435,11 @@ class RoutineTab(QWidget):
         self.log.info(f"다음 작업 정보가 업데이트되었습니다: {next_task_number}")
 
     def export_to_excel(self):
-        """작업 모니터 데이터를 엑셀 파일로 내보내기"""
+        """작업 모니터 데이터를 파일(엑셀/CSV/JSONL/Parquet)로 내보내기"""
+        if self.export_worker and self.export_worker.isRunning():
+            QMessageBox.information(self, '알림', '이미 파일을 저장하는 중입니다.')
+            return
+            
         reply = QMessageBox.question(
                     self, 
             '엑셀 다운로드',
@@ -424,36 +452,56 @@ class RoutineTab(QWidget):
             return
             
         try:
-            # 데이터 수집
-            data = []
-            for row in range(self.task_monitor.rowCount()):
-                row_data = []
-                for col in range(self.task_monitor.columnCount()):
-                    item = self.task_monitor.item(row, col)
-                    row_data.append(item.text() if item else '')
-                data.append(row_data)
-            
-            # DataFrame 생성
-            df = pd.DataFrame(data, columns=['NO', '아이디', '내용', 'URL'])
-            
             # 파일 저장 대화상자
             default_filename = f'작업_모니터_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-            filename, _ = QFileDialog.getSaveFileName(
+            filename, selected_filter = QFileDialog.getSaveFileName(
                 self,
-                "엑셀 파일 저장",
+                "파일 저장",
                 default_filename,
-                "Excel Files (*.xlsx)"
+                ";;".join(EXPORT_FILTERS.values())
             )
             
-            if filename:
-                # 엑셀 파일로 저장
-                df.to_excel(filename, index=False, engine='openpyxl')
-                self.log.info(f'엑셀 파일이 저장되었습니다: {filename}')
-                QMessageBox.information(self, '저장 완료', '엑셀 파일이 성공적으로 저장되었습니다.')
+            if not filename:
+                return
+                
+            # 확장자가 없으면 선택한 필터의 확장자 사용
+            if os.path.splitext(filename)[1].lower() not in EXPORT_FILTERS:
+                for ext, file_filter in EXPORT_FILTERS.items():
+                    if file_filter == selected_filter:
+                        filename += ext
+                        break
+                else:
+                    filename += '.xlsx'
+            
+            # 현재 결과의 복사본을 만들어 별도 스레드에서 기록
+            self.export_worker = ExportWorker(filename, ResultTableModel.COLUMNS,
+                                              self.result_model.snapshot())
+            self.export_worker.progress.connect(self.on_export_progress)
+            self.export_worker.finished.connect(self.on_export_finished)
+            self.excel_btn.setEnabled(False)
+            self.excel_btn.setText("저장 중... 0%")
+            self.export_worker.start()
         except Exception as e:
             self.log.error(f'엑셀 파일 저장 중 오류 발생: {str(e)}')
             QMessageBox.critical(self, '오류', f'엑셀 파일 저장 중 오류가 발생했습니다:\n{str(e)}')
 
+    def on_export_progress(self, done, total):
+        """파일 내보내기 진행상황 표시"""
+        percent = int(done / total * 100) if total else 100
+        self.excel_btn.setText(f"저장 중... {percent}%")
+
+    def on_export_finished(self, success, result, count):
+        """파일 내보내기 완료 처리"""
+        self.excel_btn.setEnabled(True)
+        self.excel_btn.setText("엑셀 다운로드")
+        
+        if success:
+            self.log.info(f'파일이 저장되었습니다: {result} ({count}행)')
+            QMessageBox.information(self, '저장 완료', '파일이 성공적으로 저장되었습니다.')
+        else:
+            self.log.error(f'파일 저장 중 오류 발생: {result}')
+            QMessageBox.critical(self, '오류', f'파일 저장 중 오류가 발생했습니다:\n{result}')
+
     def clear_monitor(self):
         """작업 모니터 데이터 초기화"""
         reply = QMessageBox.question(
@@ -466,51 +514,37 @@ class RoutineTab(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                self.task_monitor.setRowCount(0)
+                self.result_model.clear()
                 self.log.info('작업 모니터가 초기화되었습니다.')
                 QMessageBox.information(self, '초기화 완료', '작업 모니터가 초기화되었습니다.')
             except Exception as e:
                 self.log.error(f'작업 모니터 초기화 중 오류 발생: {str(e)}')
                 QMessageBox.critical(self, '오류', f'작업 모니터 초기화 중 오류가 발생했습니다:\n{str(e)}')
 
-    def handle_cell_click(self, row, column):
+    def handle_index_click(self, index):
         """테이블 셀 클릭 이벤트 처리"""
         # URL 열(3번 열)을 클릭한 경우에만 처리
-        if column == 3:
+        if index.isValid() and index.column() == ResultTableModel.COL_URL:
             try:
                 # URL 가져오기
-                url_item = self.task_monitor.item(row, column)
-                if url_item:
-                    # UserRole에서 URL 데이터 가져오기 (없으면 텍스트 사용)
-                    url = url_item.data(Qt.UserRole) or url_item.text()
-                    if url:
-                        # 브라우저에서 URL 열기
-                        print(f"URL 열기 시도: {url}")
-                        QDesktopServices.openUrl(QUrl(url))
-                        self.log.info(f"URL 열기: {url}")
+                url = self.result_model.url_at(index.row())
+                if url:
+                    # 브라우저에서 URL 열기
+                    print(f"URL 열기 시도: {url}")
+                    QDesktopServices.openUrl(QUrl(url))
+                    self.log.info(f"URL 열기: {url}")
             except Exception as e:
                 self.log.error(f"URL 열기 중 오류 발생: {str(e)}")
                 print(f"URL 열기 오류: {str(e)}")
 
-    def on_post_added(self, row):
-        """게시글이 추가되면 URL 항목에 스타일 적용"""
-        try:
-            # URL 칼럼의 아이템 가져오기
-            url_item = self.task_monitor.item(row, 3)
-            if url_item and url_item.text():
-                url = url_item.text()
-                
-                # 직접 기존 아이템을 수정
-                url_item.setData(Qt.UserRole, url)  # 실제 URL을 UserRole로 저장
-                url_item.setForeground(QColor("blue"))  # 파란색으로 표시
-                url_item.setToolTip("클릭하여 브라우저에서 열기")
-                
-                print(f"URL 스타일 적용: {url}")
-            else:
-                print(f"URL 아이템이 없거나 비어 있음: 행={row}")
-        except Exception as e:
-            self.log.error(f"URL 스타일 적용 중 오류 발생: {str(e)}")
-            print(f"URL 스타일 적용 오류: {str(e)}")
+    def add_results(self, rows):
+        """수집 결과 여러 개를 모니터에 한 번에 추가
+
+        Args:
+            rows (list): 행 목록 (각 항목은 {'no', 'id', 'content', 'url'} 형태)
+        """
+        self.result_model.append_rows(rows)
+        self.task_monitor.scrollToBottom()
 
     def update_progress(self, progress_info):
         """진행상황 업데이트
@@ -0,0 +1,45 @@
+import threading
+
+
+class DedupIndex:
+    """수집 결과 중복 체크용 인덱스
+
+    GUI 스레드에서 게시글이 추가될 때마다 갱신되고, Worker 스레드에서는 조회만 한다.
+    모든 접근은 내부 Lock으로 보호되므로 위젯을 직접 읽지 않고도 중복 여부를 확인할 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._titles = set()  # 수집된 제목
+        self._id_title_pairs = set()  # (아이디, 제목) 쌍
+
+    def add(self, item_id, title):
+        """수집된 게시글을 인덱스에 추가
+
+        Args:
+            item_id (str): 카페 ID (또는 계정 ID)
+            title (str): 게시글 제목/내용
+        """
+        with self._lock:
+            self._titles.add(title)
+            self._id_title_pairs.add((item_id, title))
+
+    def has_title(self, title):
+        """제목 중복 여부"""
+        with self._lock:
+            return title in self._titles
+
+    def has_pair(self, item_id, title):
+        """(아이디, 제목) 쌍 중복 여부"""
+        with self._lock:
+            return (item_id, title) in self._id_title_pairs
+
+    def clear(self):
+        """인덱스 초기화"""
+        with self._lock:
+            self._titles.clear()
+            self._id_title_pairs.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._id_title_pairs)
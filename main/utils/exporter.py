@@ -0,0 +1,147 @@
+import csv
+import json
+import os
+
+
+# 확장자별 파일 대화상자 필터
+EXPORT_FILTERS = {
+    ".xlsx": "Excel Files (*.xlsx)",
+    ".csv": "CSV Files (*.csv)",
+    ".jsonl": "JSON Lines (*.jsonl)",
+    ".parquet": "Parquet Files (*.parquet)",
+}
+
+# 진행상황 콜백 호출 간격 (행)
+PROGRESS_STEP = 1000
+
+
+def _report(progress_callback, done, total, force=False):
+    if progress_callback and (force or done % PROGRESS_STEP == 0):
+        progress_callback(done, total)
+
+
+def write_xlsx(path, columns, rows, total=0, progress_callback=None):
+    """openpyxl write-only 모드로 엑셀 파일 저장 (행을 메모리에 쌓지 않고 바로 기록)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+
+    count = 0
+    for row in rows:
+        sheet.append(list(row))
+        count += 1
+        _report(progress_callback, count, total)
+
+    workbook.save(path)
+    return count
+
+
+def write_csv(path, columns, rows, total=0, progress_callback=None):
+    """CSV 파일 저장 (엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8)"""
+    count = 0
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            _report(progress_callback, count, total)
+    return count
+
+
+def write_jsonl(path, columns, rows, total=0, progress_callback=None):
+    """JSON Lines 파일 저장 (한 줄에 한 행)"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+            _report(progress_callback, count, total)
+    return count
+
+
+def write_parquet(path, columns, rows, total=0, progress_callback=None, chunk_size=10000):
+    """Parquet 파일 저장 (pyarrow 필요, chunk_size 행 단위로 나눠서 기록)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet 저장에는 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+
+    schema = pa.schema([(name, pa.string()) for name in columns])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            count += 1
+            if len(chunk) >= chunk_size:
+                writer.write_table(_parquet_table(pa, schema, columns, chunk))
+                chunk = []
+            _report(progress_callback, count, total)
+        if chunk or count == 0:
+            writer.write_table(_parquet_table(pa, schema, columns, chunk))
+    return count
+
+
+def _parquet_table(pa, schema, columns, chunk):
+    arrays = [
+        pa.array([None if row[i] is None else str(row[i]) for row in chunk], type=pa.string())
+        for i in range(len(columns))
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+WRITERS = {
+    ".xlsx": write_xlsx,
+    ".csv": write_csv,
+    ".jsonl": write_jsonl,
+    ".parquet": write_parquet,
+}
+
+
+def export_rows(path, columns, rows, total=0, progress_callback=None):
+    """확장자에 맞는 형식으로 행을 순차적으로 기록
+
+    Args:
+        path (str): 저장할 파일 경로 (.xlsx, .csv, .jsonl, .parquet)
+        columns (list): 컬럼 이름 목록
+        rows (iterable): 행 이터러블 (각 행은 columns 순서의 시퀀스)
+        total (int): 전체 행 수 (진행상황 표시용)
+        progress_callback (callable, optional): (완료 행 수, 전체 행 수)를 받는 콜백
+
+    Returns:
+        int: 기록된 행 수
+    """
+    ext = os.path.splitext(path)[1].lower()
+    writer = WRITERS.get(ext)
+    if writer is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or '(확장자 없음)'}")
+
+    count = writer(path, columns, rows, total, progress_callback)
+    _report(progress_callback, count, total, force=True)
+    return count
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    columns = ["NO", "아이디", "내용", "URL"]
+    n = 100000
+    rows = [(i, f"cafe{i % 50}", f"게시글 내용 {i}", f"https://cafe.naver.com/cafe{i % 50}/{i}")
+            for i in range(1, n + 1)]
+
+    out_dir = tempfile.mkdtemp()
+    for ext in WRITERS:
+        path = os.path.join(out_dir, f"export{ext}")
+        start = time.perf_counter()
+        try:
+            count = export_rows(path, columns, iter(rows), n)
+            print(f"{ext:9s} {count}행 {time.perf_counter() - start:.2f}초 "
+                  f"{os.path.getsize(path) / 1024:.0f}KB")
+        except Exception as e:
+            print(f"{ext:9s} 실패: {e}")
@@ -5,46 +5,100 @@ import logging
 import traceback
 from datetime import datetime, timedelta
 
+# 라이선스 서버 주소 (테스트 시 환경 변수로 로컬 서버 지정 가능)
+LICENCE_URL = os.environ.get("NCAFE_LICENCE_URL", "http://jdh7693.gabia.io/license")
+LICENCE_TIMEOUT = 5  # 라이선스 서버 요청 제한 시간(초)
+
 class Licence:
-    def __init__(self):
+    # verify() 결과 상태
+    VALID = "valid"  # 유효한 라이선스 (message: 만료일)
+    INVALID = "invalid"  # 서버가 거부한 라이선스 (message: 사유)
+    UNREACHABLE = "unreachable"  # 서버 응답 없음/오류 (message: 오류 내용)
+
+    def __init__(self, path='licence.json', url=None, timeout=LICENCE_TIMEOUT):
+        """
+        Args:
+            path (str): 라이선스 파일 경로
+            url (str, optional): 라이선스 서버 주소. 기본값은 LICENCE_URL
+            timeout (float): 서버 요청 제한 시간(초)
+        """
+        self.path = path
+        self.url = url or LICENCE_URL
+        self.timeout = timeout
         self.licence_key = None
         self.expiry_date = None
+        self.checked_at = None  # 마지막으로 서버에서 확인된 시각
         self.load_licence()
 
     def load_licence(self):
-        """라이선스 파일에서 라이선스 키를 로드합니다."""
+        """라이선스 파일에서 라이선스 키와 마지막 검증 결과를 로드합니다."""
         try:
-            if os.path.exists('licence.json'):
-                with open('licence.json', 'r', encoding='utf-8') as f:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
                     licence_data = json.load(f)
                     self.licence_key = licence_data.get('licence', '')
                     self.expiry_date = licence_data.get('expires_at', None)
+                    self.checked_at = licence_data.get('checked_at', None)
         except:
             logging.error(f"load_licence Error :: {traceback.format_exc()}")
 
     def save_licence(self, licence_key, expires_at):
-        """라이선스 정보를 파일에 저장합니다."""
+        """라이선스 정보와 검증 결과(만료일, 검증 시각)를 파일에 저장합니다."""
         try:
+            checked_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             licence_data = {
-                'licence': licence_key
+                'licence': licence_key,
+                'expires_at': expires_at,
+                'checked_at': checked_at
             }
-            with open('licence.json', 'w', encoding='utf-8') as f:
+            with open(self.path, 'w', encoding='utf-8') as f:
                 json.dump(licence_data, f, indent=4, ensure_ascii=False)
             self.licence_key = licence_key
             self.expiry_date = expires_at
+            self.checked_at = checked_at
             return True
         except:
             logging.error(f"save_licence Error :: {traceback.format_exc()}")
             return False
 
+    def remove_licence(self):
+        """라이선스 파일과 캐시된 검증 결과를 삭제합니다."""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except:
+            logging.error(f"remove_licence Error :: {traceback.format_exc()}")
+        self.licence_key = None
+        self.expiry_date = None
+        self.checked_at = None
+
     def get_licence_key(self):
         """저장된 라이선스 키를 반환합니다."""
         return self.licence_key
 
-    def check_license(self, licence_key):
-        """라이선스 키의 유효성을 검증합니다."""
+    def has_cached_verdict(self):
+        """서버 확인 없이 바로 시작할 수 있는 캐시된 검증 결과가 있는지 확인합니다.
+
+        이전에 서버에서 확인된 만료일이 저장되어 있고 아직 만료되지 않았으면 True
+        """
+        return bool(self.licence_key and self.expiry_date and not self.is_expired())
+
+    def verify(self, licence_key, timeout=None):
+        """라이선스 서버에 키를 확인합니다.
+
+        서버 거부와 서버 응답 없음을 구분하여, 서버가 응답하지 않을 때는
+        캐시된 검증 결과를 유지할 수 있도록 합니다.
+
+        Args:
+            licence_key (str): 라이선스 키
+            timeout (float, optional): 요청 제한 시간(초). 기본값은 self.timeout
+
+        Returns:
+            tuple: (status, message)
+                - status (str): VALID / INVALID / UNREACHABLE
+                - message (str): 만료일(VALID) 또는 사유
+        """
         try:
-            url = "http://jdh7693.gabia.io/license"
             params = {
                 "license_key": licence_key,
                 "license_type": "N_CAFE_AI_ACTIVE"
@@ -53,10 +107,11 @@ class Licence:
                 "accept": "application/json"
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = requests.get(self.url, headers=headers, params=params,
+                                    timeout=timeout or self.timeout)
             
             if response.status_code != 200:
-                return False, "라이선스 확인 중 알수 없는 오류가 발생했습니다."
+                return self.UNREACHABLE, "라이선스 확인 중 알수 없는 오류가 발생했습니다."
 
             response_data = response.json()
 
@@ -66,15 +121,27 @@ class Licence:
                 datetime.strptime(expires_at, "%Y-%m-%d")
                 # 라이선스 정보 저장
                 if self.save_licence(licence_key, expires_at):
-                    return True, expires_at
+                    return self.VALID, expires_at
                 else:
-                    return False, "라이선스 정보 저장 중 오류가 발생했습니다."
+                    return self.UNREACHABLE, "라이선스 정보 저장 중 오류가 발생했습니다."
             else:
-                return False, response_data.get('detail', '유효하지 않은 라이선스입니다.')
+                return self.INVALID, response_data.get('detail', '유효하지 않은 라이선스입니다.')
             
+        except requests.RequestException as e:
+            logging.warning(f"check_license 서버 연결 실패 :: {str(e)}")
+            return self.UNREACHABLE, f"라이선스 서버에 연결할 수 없습니다. ({e.__class__.__name__})"
         except Exception as e:
             logging.error(f"check_license Error :: {traceback.format_exc()}")
-            return False, str(e)
+            return self.UNREACHABLE, str(e)
+
+    def check_license(self, licence_key):
+        """라이선스 키의 유효성을 검증합니다.
+
+        Returns:
+            tuple: (is_valid, message) - 유효하면 (True, 만료일), 아니면 (False, 사유)
+        """
+        status, message = self.verify(licence_key)
+        return status == self.VALID, message
 
     def get_expiry_date(self):
         """만료일을 반환합니다."""
@@ -102,4 +169,59 @@ class Licence:
             return days_left <= 0
         except:
             logging.error(f"is_expired Error :: {traceback.format_exc()}")
-            return True 
\ No newline at end of file
+            return True 
+
+
+if __name__ == "__main__":
+    # 로컬 대체 서버로 라이선스 검증 흐름 확인
+    #   python -m main.utils.licence
+    import tempfile
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    class StandInLicenceHandler(BaseHTTPRequestHandler):
+        """라이선스 서버 대체 엔드포인트
+
+        - VALID-KEY: 30일 뒤 만료일 반환
+        - SLOW-KEY: 응답을 10초 지연 (timeout 확인용)
+        - 그 외: 유효하지 않은 라이선스
+        """
+
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            key = query.get("license_key", [""])[0]
+            if key == "SLOW-KEY":
+                time.sleep(10)
+            if key in ("VALID-KEY", "SLOW-KEY"):
+                expires_at = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+                body = {"status_code": 200, "data": {"expires_at": expires_at}}
+            else:
+                body = {"status_code": 404, "detail": "유효하지 않은 라이선스입니다."}
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), StandInLicenceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/license"
+    path = os.path.join(tempfile.mkdtemp(), "licence.json")
+
+    licence = Licence(path=path, url=url, timeout=1)
+    print("유효한 키:", licence.verify("VALID-KEY"))
+    print("캐시된 결과로 시작 가능:", Licence(path=path, url=url).has_cached_verdict())
+    print("유효하지 않은 키:", licence.verify("WRONG-KEY"))
+
+    start = time.time()
+    print("응답 지연:", licence.verify("SLOW-KEY"), f"({time.time() - start:.1f}초)")
+
+    server.shutdown()
+    print("서버 종료 후:", licence.verify("VALID-KEY"))
+    print("캐시 유지:", Licence(path=path, url=url).has_cached_verdict())
@@ -1,56 +1,180 @@
+import atexit
 import logging
 import os
+import queue
+from collections import deque, OrderedDict
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+def _daily_log_path(now=None):
+    """날짜별 로그 파일 경로 반환 (logs/YYYY-MM/sys_log_YYYY-MM-DD.log)"""
+    now = now or datetime.now()
+    log_dir = os.path.join("logs", now.strftime("%Y-%m"))
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.join(log_dir, f"sys_log_{now.strftime('%Y-%m-%d')}.log")
+
+
+class _DailyRotatingFileHandler(RotatingFileHandler):
+    """크기와 날짜 기준으로 회전하는 파일 핸들러
+
+    - 파일이 max_bytes를 넘으면 sys_log_DATE.log.1, .2 ... 로 회전 (backup_count 개 유지)
+    - 날짜가 바뀌면 새 날짜의 sys_log_DATE.log 파일로 전환
+    - flush()는 바로 디스크에 쓰지 않고 flush_every 개마다 한 번만 수행하며,
+      나머지는 QueueListener가 큐를 비웠을 때 force_flush()로 한 번에 내보낸다.
+    """
+
+    def __init__(self, max_bytes, backup_count, flush_every=100):
+        self.current_date = datetime.now().strftime("%Y-%m-%d")
+        self.flush_every = flush_every
+        self._unflushed = 0
+        super().__init__(_daily_log_path(), mode='a', maxBytes=max_bytes,
+                         backupCount=backup_count, encoding='utf-8')
+
+    def shouldRollover(self, record):
+        if datetime.now().strftime("%Y-%m-%d") != self.current_date:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        today = datetime.now().strftime("%Y-%m-%d")
+        if today == self.current_date:
+            super().doRollover()
+            return
+
+        # 날짜가 바뀐 경우: 새 날짜 파일로 전환
+        if self.stream:
+            self.stream.flush()
+            self.stream.close()
+            self.stream = None
+        self.current_date = today
+        self.baseFilename = os.path.abspath(_daily_log_path())
+        self._unflushed = 0
+        self.stream = self._open()
+
+    def flush(self):
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.force_flush()
+
+    def force_flush(self):
+        """버퍼에 쌓인 로그를 디스크에 기록"""
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+            self._unflushed = 0
+        finally:
+            self.release()
+
+    def close(self):
+        self.force_flush()
+        super().close()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """용량 제한 큐에 로그 레코드를 넣는 핸들러
+
+    큐가 가득 찼을 때 policy가 "drop"이면 레코드를 버리고 개수만 센다.
+    "block"이면 block_timeout 초 동안 기다렸다가 그래도 가득 차 있으면 버린다.
+    """
+
+    def __init__(self, log_queue, policy="drop", block_timeout=1.0):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchingQueueListener(QueueListener):
+    """큐가 빌 때마다 핸들러를 flush 하는 QueueListener"""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                if hasattr(handler, "force_flush"):
+                    handler.force_flush()
+            return self.queue.get(block)
+
 
 class Log:
+    # 메모리에 유지할 최대 개수 (그 이전 기록은 파일 로그에만 남음)
+    MAX_MESSAGES = 2000
+    MAX_TASK_LOGS = 2000
+    MAX_BOARD_LOGS_PER_CAFE = 2000
+    MAX_BOARD_CAFES = 100
+
+    # 파일 로그 설정
+    LOG_QUEUE_SIZE = 10000  # 로그 큐 최대 크기
+    LOG_OVERFLOW_POLICY = "drop"  # 큐가 가득 찼을 때: "drop" 또는 "block"
+    LOG_MAX_BYTES = 10 * 1024 * 1024  # 파일당 최대 크기 (10MB)
+    LOG_BACKUP_COUNT = 5  # 날짜별 회전 파일 보관 개수
+
     def __init__(self):
-        self.messages = []
-        self.board_logs = {}  # {cafe_id: {article_id: {subject, writer}}}
-        self.task_logs = []  # [{subject, cafe_id, content, ...}]
+        self.messages = deque(maxlen=self.MAX_MESSAGES)
+        self.board_logs = OrderedDict()  # {cafe_id: OrderedDict{article_id: {subject, writer}}}
+        self.task_logs = deque(maxlen=self.MAX_TASK_LOGS)  # [{subject, cafe_id, content, ...}]
         self.row_positions = {}  # {task_id: row_position}
+        self._task_log_count = 0  # 지금까지 추가된 작업 로그 수 (task_id 발급용)
+        self.log_listener = None
+        self.queue_handler = None
         
         # 로그 파일 설정
         self.setup_file_logger()
         
     def setup_file_logger(self):
-        """파일 로깅 설정"""
+        """파일 로깅 설정
+
+        호출한 스레드에서는 레코드를 큐에 넣기만 하고,
+        포맷팅과 파일 쓰기는 QueueListener의 백그라운드 스레드에서 처리한다.
+        """
         try:
-            # 현재 날짜 가져오기
-            now = datetime.now()
-            year = now.strftime("%Y")
-            month = now.strftime("%m")
-            date = now.strftime("%Y-%m-%d")
+            # 이전 리스너 정리
+            self.stop_file_logger()
             
-            # 로그 디렉토리 생성
-            log_dir = os.path.join("logs", f"{year}-{month}")
-            os.makedirs(log_dir, exist_ok=True)
+            # 파일 핸들러 (크기/날짜 기준 회전)
+            file_handler = _DailyRotatingFileHandler(self.LOG_MAX_BYTES, self.LOG_BACKUP_COUNT)
+            file_handler.setLevel(logging.DEBUG)
             
-            # 로그 파일 경로
-            log_file = os.path.join(log_dir, f"sys_log_{date}.log")
+            # 로그 포맷 설정
+            formatter = logging.Formatter(
+                '[%(asctime)s] %(levelname)s: %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            file_handler.setFormatter(formatter)
             
             # 로거 설정
             self.file_logger = logging.getLogger('SystemLogger')
             self.file_logger.setLevel(logging.DEBUG)  # DEBUG 레벨로 설정하여 모든 로그 수집
+            self.file_logger.propagate = False
             
             # 기존 핸들러 제거 (중복 방지)
             if self.file_logger.handlers:
                 self.file_logger.handlers.clear()
             
-            # 파일 핸들러 추가 - UTF-8 인코딩 설정
-            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
+            # 큐 핸들러 + 백그라운드 리스너
+            log_queue = queue.Queue(maxsize=self.LOG_QUEUE_SIZE)
+            self.queue_handler = _BoundedQueueHandler(log_queue, policy=self.LOG_OVERFLOW_POLICY)
+            self.file_logger.addHandler(self.queue_handler)
             
-            # 로그 포맷 설정
-            formatter = logging.Formatter(
-                '[%(asctime)s] %(levelname)s: %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(formatter)
-            self.file_logger.addHandler(file_handler)
+            self.log_listener = _BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+            self.log_listener.start()
+            atexit.register(self.stop_file_logger)
             
             # 초기 로그 메시지
             self.file_logger.info("=== 로그 시스템 초기화 ===")
-            self.file_logger.info(f"로그 파일 경로: {os.path.abspath(log_file)}")
+            self.file_logger.info(f"로그 파일 경로: {file_handler.baseFilename}")
             self.file_logger.info(f"로그 레벨: DEBUG")
             
         except Exception as e:
@@ -58,6 +182,21 @@ class Log:
             print(f"로거 설정 실패: {traceback.format_exc()}")
             raise
 
+    def stop_file_logger(self):
+        """로그 리스너 종료 (큐에 남은 로그를 모두 기록한 뒤 파일을 닫음)"""
+        listener = self.log_listener
+        if listener is None:
+            return
+        self.log_listener = None
+        try:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            if self.queue_handler and self.queue_handler.dropped:
+                print(f"로그 큐가 가득 차 {self.queue_handler.dropped}개의 로그가 기록되지 않았습니다.")
+        except Exception as e:
+            print(f"로그 리스너 종료 실패: {str(e)}")
+
     def add_log(self, message, color="black"):
         """일반 로그 메시지 추가"""
         try:
@@ -114,12 +253,20 @@ class Log:
     def add_board_log(self, cafe_id, article_id, subject, writer):
         """게시판 로그 추가"""
         if cafe_id not in self.board_logs:
-            self.board_logs[cafe_id] = {}
+            self.board_logs[cafe_id] = OrderedDict()
+            # 오래된 카페부터 제거
+            while len(self.board_logs) > self.MAX_BOARD_CAFES:
+                self.board_logs.popitem(last=False)
+        else:
+            self.board_logs.move_to_end(cafe_id)
         
-        self.board_logs[cafe_id][article_id] = {
+        cafe_logs = self.board_logs[cafe_id]
+        cafe_logs[article_id] = {
             'subject': subject,
             'writer': writer
         }
+        while len(cafe_logs) > self.MAX_BOARD_LOGS_PER_CAFE:
+            cafe_logs.popitem(last=False)
         
         # 파일에 로그 기록
         try:
@@ -142,11 +289,18 @@ class Log:
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
+        task_id = self._task_log_count
+        self._task_log_count += 1
         if row_position is not None:
-            self.row_positions[len(self.task_logs)] = row_position
+            self.row_positions[task_id] = row_position
             
         self.task_logs.append(task_log)
         
+        # 버퍼에서 밀려난 작업 로그의 행 위치 정보 제거
+        expired_id = task_id - self.MAX_TASK_LOGS
+        if expired_id >= 0:
+            self.row_positions.pop(expired_id, None)
+        
         # 파일에 로그 기록
         try:
             self.file_logger.info(f"작업 로그: 제목={subject}, 카페ID={cafe_id}, URL={article_url}")
@@ -161,13 +315,13 @@ class Log:
         pass
 
     def get_messages(self):
-        """모든 로그 메시지 반환"""
-        return self.messages
+        """메모리에 남아있는 최근 로그 메시지 반환"""
+        return list(self.messages)
 
     def get_board_logs(self, cafe_id):
         """특정 카페의 게시판 로그 반환"""
         return self.board_logs.get(cafe_id, {})
 
     def get_task_logs(self):
-        """모든 작업 로그 반환"""
-        return self.task_logs 
\ No newline at end of file
+        """메모리에 남아있는 최근 작업 로그 반환"""
+        return list(self.task_logs) 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import os
-from openai import OpenAI
 import json
 import time
 
@@ -11,7 +10,8 @@ class OpenAIGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다.")
         
-        # OpenAI 클라이언트 초기화
+        # OpenAI 클라이언트 초기화 (openai 패키지는 실제 사용 시점에 import)
+        from openai import OpenAI
         self.client = OpenAI(api_key=self.api_key)
     
     def validate_api_key(self):
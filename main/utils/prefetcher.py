@@ -0,0 +1,131 @@
+import heapq
+import itertools
+import threading
+
+
+class Prefetcher:
+    """우선순위 큐 기반 선행 수집기 (스레드 안전)
+
+    등록한 항목을 우선순위가 높은 것(값이 작은 것)부터 백그라운드 스레드로 미리 가져온다.
+    가져오는 중이거나 가져왔지만 아직 꺼내 가지 않은 항목이 lookahead 개를 넘지 않도록 제한하여
+    메모리 사용량을 일정하게 유지한다. get()으로 꺼낸 결과는 내부에서 지운다.
+    """
+
+    def __init__(self, fetch, max_workers=4, lookahead=40):
+        """
+        Args:
+            fetch (callable): 항목 -> 결과 (예외가 나면 get()에서 다시 발생)
+            max_workers (int): 동시에 가져올 스레드 수
+            lookahead (int): 미리 가져와 둘 최대 항목 수 (진행 중 + 꺼내지 않은 결과)
+        """
+        self.fetch = fetch
+        self.lookahead = max(1, lookahead)
+        self._cond = threading.Condition()
+        self._heap = []
+        self._seq = itertools.count()  # 우선순위가 같으면 등록 순서
+        self._items = {}       # {키: 항목} (아직 꺼내지 않은 항목)
+        self._in_flight = set()
+        self._results = {}     # {키: (성공 여부, 결과 또는 예외)}
+        self._cancelled = set()  # 시작 전에 get()이 직접 가져간 키 (큐에서 나중에 건너뜀)
+        self._closed = False
+        self.stats = {'ready': 0, 'waited': 0, 'inline': 0}  # 꺼낼 때 이미 준비됨 / 기다림 / 직접 가져옴
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(max(1, max_workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key, item, priority=0):
+        """가져올 항목 등록
+
+        Args:
+            key: 항목 키 (get()에 사용)
+            item: fetch 에 전달할 항목
+            priority: 우선순위 (작을수록 먼저, 튜플 가능)
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._items[key] = item
+            heapq.heappush(self._heap, (priority, next(self._seq), key))
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (
+                        not self._heap or len(self._in_flight) + len(self._results) >= self.lookahead):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                _, _, key = heapq.heappop(self._heap)
+                if key in self._cancelled:
+                    self._cancelled.discard(key)
+                    continue
+                item = self._items[key]
+                self._in_flight.add(key)
+
+            try:
+                result = (True, self.fetch(item))
+            except Exception as e:
+                result = (False, e)
+
+            with self._cond:
+                self._in_flight.discard(key)
+                if not self._closed:
+                    self._results[key] = result
+                self._cond.notify_all()
+
+    def get(self, key):
+        """항목 결과 꺼내기 (가져오는 중이면 기다리고, 아직 시작하지 않았으면 호출한 스레드에서 직접 가져옴)"""
+        with self._cond:
+            waited = False
+            while key in self._in_flight:
+                waited = True
+                self._cond.wait()
+            item = self._items.pop(key)
+            if key in self._results:
+                success, value = self._results.pop(key)
+                self.stats['waited' if waited else 'ready'] += 1
+                self._cond.notify_all()  # 창에 자리가 생겼으므로 다음 항목 시작
+            else:
+                self._cancelled.add(key)
+                self.stats['inline'] += 1
+                success, value = None, None
+
+        if success is None:
+            return self.fetch(item)
+        if not success:
+            raise value
+        return value
+
+    def close(self):
+        """남은 항목을 버리고 스레드 종료 (진행 중인 요청은 끝나면 버려짐)"""
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._results.clear()
+            self._items.clear()
+            self._cond.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    def slow_fetch(n):
+        time.sleep(random.uniform(0.01, 0.05))
+        return n * n
+
+    start = time.monotonic()
+    with Prefetcher(slow_fetch, max_workers=4, lookahead=8) as prefetcher:
+        for n in range(40):
+            prefetcher.submit(n, n, priority=-n)  # 큰 수부터
+        for n in reversed(range(40)):
+            assert prefetcher.get(n) == n * n
+            time.sleep(0.02)  # 분석하는 동안에도 다음 항목을 계속 가져옴
+        print(f"{time.monotonic() - start:.2f}초, {prefetcher.stats}")
@@ -0,0 +1,167 @@
+import re
+
+# URL, 이모지, 반복 문자 패턴
+URL_RE = re.compile(r'(https?://|www\.)\S+|\S+\.(com|net|kr|co\.kr|me|ly)(/\S*)?', re.IGNORECASE)
+EMOJI_RE = re.compile('[\U0001F000-\U0001FAFF☀-➿⬀-⯿️‍]+')
+REPEAT_RE = re.compile(r'([ㅋㅎㅠㅜ~!?.^♡♥★☆])\1{2,}')  # ㅋㅋㅋㅋ, ㅠㅠㅠ, !!!! 등은 두 글자로
+WHITESPACE_RE = re.compile(r'[ \t ​]+')
+SENTENCE_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+# 카페 게시글에서 자주 보이는 판단에 불필요한 문구
+BOILERPLATE_PATTERNS = [
+    r'안녕하(세요|십니까)[.!?~^ ]*',
+    r'(읽어|봐|확인해)\s*주셔서\s*감사합니다[.!~]*',
+    r'감사합니다[.!~]*',
+    r'좋은\s*하루\s*(되세요|보내세요)[.!~]*',
+    r'(댓글|답변|연락|쪽지)\s*(부탁|주세요|바랍니다)[^.!?\n]{0,10}[.!~]*',
+    r'(문의|연락)\s*(는|은)?\s*(쪽지|채팅|카톡|댓글)[^.!?\n]{0,15}',
+    r'본\s*게시글은[^.!?\n]{0,40}',
+    r'\[?(출처|원문|사진\s*출처)\]?\s*:?[^\n]{0,40}',
+    r'카페\s*(규정|공지|규칙)[^.!?\n]{0,30}(확인|준수)[^.!?\n]{0,10}',
+]
+BOILERPLATE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in BOILERPLATE_PATTERNS))
+
+# 명령어에서 검색어로 쓰지 않을 단어와 조사
+COMMAND_STOPWORDS = {'글', '게시글', '글만', '추출', '찾기', '찾아줘', '관련', '내용', '경우', '것', '만', '해당', '조건'}
+JOSA_SUFFIXES = ('에서', '으로', '에게', '까지', '부터', '처럼', '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만')
+
+_encoding = None
+
+
+def estimate_tokens(text):
+    """텍스트 토큰 수 추정
+
+    tiktoken 이 설치되어 있으면 gpt-4o 인코딩으로 세고, 없으면 한글 1글자 ≈ 1토큰,
+    그 외 문자 4글자 ≈ 1토큰으로 어림한다.
+    """
+    global _encoding
+    if not text:
+        return 0
+    if _encoding is None:
+        try:
+            import tiktoken  # 선택 의존성 (사용 시점에 import)
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    hangul = sum(1 for ch in text if '가' <= ch <= '힣' or 'ㄱ' <= ch <= 'ㆎ')
+    others = len(text) - hangul - text.count(' ')
+    return hangul + (others + 3) // 4
+
+
+def clean_text(text):
+    """URL, 이모지 묶음, 반복 문자, 인사말 등 상투 문구와 중복 공백 제거"""
+    text = URL_RE.sub(' ', text or '')
+    text = EMOJI_RE.sub(' ', text)
+    text = REPEAT_RE.sub(r'\1\1', text)
+    text = BOILERPLATE_RE.sub(' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
+    return '\n'.join(line.strip() for line in text.split('\n') if line.strip())
+
+
+def command_terms(command):
+    """AI 분석 명령어에서 본문 검색에 쓸 단어 추출 (조사 제거)"""
+    terms = []
+    for word in re.findall(r'[\w가-힣]+', command or ''):
+        for suffix in JOSA_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                word = word[:-len(suffix)]
+                break
+        if len(word) >= 2 and word not in COMMAND_STOPWORDS and word not in terms:
+            terms.append(word)
+    return terms
+
+
+class PromptCompressor:
+    """AI 분석용 게시글 본문 압축기
+
+    상투 문구를 지운 뒤, 필터 키워드와 명령어 단어가 들어 있는 문장과 그 앞뒤 문장(창)을
+    게시글당 토큰 예산 안에서 골라 원래 순서대로 이어 붙인다. 해당 문장이 없으면 앞부분을 쓴다.
+    """
+
+    def __init__(self, keywords=(), command='', token_budget=150, window=1):
+        """
+        Args:
+            keywords (list): 필터 키워드 목록
+            command (str): AI 분석 명령어 (단어를 추출해 함께 사용)
+            token_budget (int): 게시글당 최대 토큰 수
+            window (int): 일치 문장 앞뒤로 함께 넣을 문장 수
+        """
+        self.terms = [k.strip() for k in keywords if k and k.strip()]
+        self.terms += [term for term in command_terms(command) if term not in self.terms]
+        self.token_budget = token_budget
+        self.window = window
+
+    def compress(self, text):
+        """본문 압축
+
+        Returns:
+            str: 토큰 예산 안의 본문 (생략된 부분은 ' … '로 표시)
+        """
+        text = clean_text(text)
+        if estimate_tokens(text) <= self.token_budget:
+            return text.replace('\n', ' ')
+
+        sentences = [s.strip() for s in SENTENCE_RE.split(text) if s and s.strip()]
+        costs = [estimate_tokens(s) for s in sentences]
+        scores = [sum(s.count(term) for term in self.terms) for s in sentences]
+
+        # 일치 단어가 많은 문장부터, 같으면 앞 문장부터 창 단위로 추가
+        hits = sorted((i for i, score in enumerate(scores) if score), key=lambda i: (-scores[i], i))
+        selected = set()
+        used = 0
+        for i in hits:
+            for j in range(max(0, i - self.window), min(len(sentences), i + self.window + 1)):
+                if j not in selected and used + costs[j] <= self.token_budget:
+                    selected.add(j)
+                    used += costs[j]
+        # 남은 예산은 앞부분 문장으로 채움 (글의 맥락)
+        for j in range(len(sentences)):
+            if j not in selected and used + costs[j] <= self.token_budget:
+                selected.add(j)
+                used += costs[j]
+            elif used + costs[j] > self.token_budget and not hits:
+                break
+
+        if hits and not selected.intersection(hits):
+            # 일치 문장이 예산보다 길면 (문장 부호가 없는 글 등) 가장 많이 일치한 문장에서 단어 주변만 자름
+            best = sentences[hits[0]]
+            term = max(self.terms, key=best.count)
+            return self._window(best, best.find(term), len(term))
+        if not selected:
+            # 한 문장이 예산보다 긴 경우 앞부분을 자름
+            return self._window(sentences[0], 0, 0) if sentences else ''
+
+        parts = []
+        previous = None
+        for j in sorted(selected):
+            if previous is not None and j != previous + 1:
+                parts.append('…')
+            parts.append(sentences[j])
+            previous = j
+        return ' '.join(parts)
+
+    def _window(self, text, pos, length):
+        """text[pos:pos + length] 를 가운데에 두고 토큰 예산 안에 들어가는 만큼 자름 (잘린 쪽은 '…'로 표시)"""
+        budget = max(1, self.token_budget - 2)  # 앞뒤 '…' 몫
+        chars_per_token = len(text) / max(1, estimate_tokens(text))
+        width = max(length, int(budget * chars_per_token))
+        while True:
+            start = max(0, min(pos - (width - length) // 2, len(text) - width))
+            window = text[start:start + width].strip()
+            if estimate_tokens(window) <= budget or width <= length:
+                break
+            width = max(length, int(width * 0.9))
+        return ('… ' if start > 0 else '') + window + (' …' if start + width < len(text) else '')
+
+
+if __name__ == "__main__":
+    sample = ("안녕하세요~ 오늘 처음 글 올립니다ㅠㅠㅠㅠ 😭😭\n"
+              "어제 퇴근길에 신호 대기 중이었는데 뒤에서 차가 박았어요. "
+              "상대 보험사에서는 과실 100% 인정한다고 하네요. 병원은 한방병원 다니려고 합니다. "
+              "혹시 합의금은 보통 얼마나 받으셨나요? 참고로 https://example.com/abc 링크도 봤어요. "
+              "날씨가 추워져서 다들 감기 조심하세요. 읽어주셔서 감사합니다!!")
+    compressor = PromptCompressor(keywords=["합의금"], command="교통사고 피해자가 쓴 글만 추출", token_budget=60)
+    print(f"원문 {estimate_tokens(sample)}토큰 -> 압축 {estimate_tokens(compressor.compress(sample))}토큰")
+    print(compressor.compress(sample))
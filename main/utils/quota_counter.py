@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import threading
+import traceback
+from datetime import datetime
+
+
+class DailyQuota:
+    """일일 호출 한도 카운터 (날짜가 바뀌면 0부터 다시 센다)
+
+    여러 작업/스레드가 같은 한도를 나눠 쓰므로 호출할 때마다 파일에 저장하여
+    프로그램을 다시 시작해도 그날 사용량이 유지된다.
+    """
+
+    def __init__(self, path, daily_limit):
+        """
+        Args:
+            path (str): 사용량 저장 파일 경로
+            daily_limit (int): 하루 최대 호출 수
+        """
+        self.path = path
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._date = self._today()
+        self._used = 0
+        self._load()
+
+    @staticmethod
+    def _today():
+        return datetime.now().strftime("%Y-%m-%d")
+
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('date') == self._date:
+                    self._used = int(data.get('used', 0))
+        except Exception:
+            logging.error(f"호출 한도 사용량 로드 Error :: {traceback.format_exc()}")
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'date': self._date, 'used': self._used, 'limit': self.daily_limit}, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            logging.error(f"호출 한도 사용량 저장 Error :: {traceback.format_exc()}")
+
+    def _roll_over(self):
+        today = self._today()
+        if today != self._date:
+            self._date = today
+            self._used = 0
+
+    def acquire(self, count=1):
+        """호출 count 회 사용 (한도를 넘으면 사용하지 않음)
+
+        Returns:
+            bool: 사용 가능 여부
+        """
+        with self._lock:
+            self._roll_over()
+            if self._used + count > self.daily_limit:
+                return False
+            self._used += count
+            self._save()
+            return True
+
+    @property
+    def remaining(self):
+        """오늘 남은 호출 수"""
+        with self._lock:
+            self._roll_over()
+            return max(0, self.daily_limit - self._used)
@@ -0,0 +1,53 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한기 (스레드 안전)
+
+    초당 rate 개의 토큰이 채워지고 최대 burst 개까지 쌓인다.
+    acquire()는 토큰을 예약한 뒤 필요한 만큼만 잠들기 때문에, 여러 스레드가 동시에
+    호출해도 전체 요청 속도가 rate를 넘지 않는다.
+    """
+
+    def __init__(self, rate=1.0, burst=1):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            burst (int): 연속으로 허용할 최대 요청 수
+        """
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 하나를 사용 (필요하면 대기)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def wait_time(self):
+        """지금 acquire() 하면 기다려야 하는 시간(초)"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
@@ -0,0 +1,108 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import traceback
+import uuid
+from datetime import datetime
+
+
+class RunStore:
+    """실행 결과 저장소
+
+    실행마다 검색 결과(필터 적용 전)와 그 실행에서 가져온 게시글 본문을 data/runs/{run_id}.json.gz 에,
+    목록 표시에 쓰는 요약을 {run_id}.meta.json 에 저장한다. 저장된 결과는 네이버에 다시 요청하지 않고
+    필터 키워드와 AI 분석만 다시 적용하는 재분석에 사용한다.
+    """
+
+    def __init__(self, directory=os.path.join("data", "runs"), max_runs=20):
+        """
+        Args:
+            directory (str): 저장 디렉터리
+            max_runs (int): 보관할 최대 실행 수 (넘으면 오래된 것부터 삭제)
+        """
+        self.directory = directory
+        self.max_runs = max_runs
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_run_id():
+        """실행 ID (생성 시각 + 임의 문자열, 이름순 정렬이 시간순)"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    @staticmethod
+    def content_key(item):
+        """본문 저장 키 (cafe_id/article_id, 없으면 URL)"""
+        if item.get('article_id'):
+            return f"{item.get('cafe_id')}/{item.get('article_id')}"
+        return item.get('url', '')
+
+    def _data_path(self, run_id):
+        return os.path.join(self.directory, f"{run_id}.json.gz")
+
+    def _meta_path(self, run_id):
+        return os.path.join(self.directory, f"{run_id}.meta.json")
+
+    def save(self, run_id, meta, items, contents):
+        """실행 결과 저장
+
+        Args:
+            run_id (str): 실행 ID
+            meta (dict): 실행 요약 (검색어, 옵션 등)
+            items (list): 검색 결과 게시글 목록
+            contents (dict): {게시글 키(cafe_id/article_id): 본문 텍스트}
+        """
+        meta = dict(meta, run_id=run_id, item_count=len(items), content_count=len(contents),
+                    created_at=meta.get('created_at') or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                data_path = self._data_path(run_id)
+                with gzip.open(data_path + ".tmp", 'wt', encoding='utf-8') as f:
+                    json.dump({'meta': meta, 'items': items, 'contents': contents}, f, ensure_ascii=False)
+                os.replace(data_path + ".tmp", data_path)
+                with open(self._meta_path(run_id), 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, indent=4, ensure_ascii=False)
+                self._prune()
+            except Exception:
+                logging.error(f"실행 결과 저장 Error :: {traceback.format_exc()}")
+        return meta
+
+    def _prune(self):
+        run_ids = sorted(name[:-len(".meta.json")] for name in os.listdir(self.directory) if name.endswith(".meta.json"))
+        for run_id in run_ids[:max(0, len(run_ids) - self.max_runs)]:
+            for path in (self._data_path(run_id), self._meta_path(run_id)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def list_runs(self):
+        """저장된 실행 요약 목록 (최신순)"""
+        runs = []
+        if not os.path.isdir(self.directory):
+            return runs
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not name.endswith(".meta.json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                    runs.append(json.load(f))
+            except Exception:
+                logging.error(f"실행 결과 요약 로드 Error ({name}) :: {traceback.format_exc()}")
+        return runs
+
+    def load(self, run_id):
+        """실행 결과 로드
+
+        Returns:
+            dict or None: {'meta', 'items', 'contents'} (없거나 읽을 수 없으면 None)
+        """
+        path = self._data_path(run_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            logging.error(f"실행 결과 로드 Error :: {traceback.format_exc()}")
+            return None
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+
+
+class _DpapiCipher:
+    """Windows DPAPI(CryptProtectData)로 현재 사용자 계정에 묶어서 암호화"""
+
+    name = "dpapi"
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class DataBlob(ctypes.Structure):
+            _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+        self._ctypes = ctypes
+        self._DataBlob = DataBlob
+        self._crypt32 = ctypes.windll.crypt32
+        self._kernel32 = ctypes.windll.kernel32
+
+    def _call(self, func, data):
+        ctypes = self._ctypes
+        buffer = ctypes.create_string_buffer(data, len(data))
+        blob_in = self._DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        blob_out = self._DataBlob()
+        CRYPTPROTECT_UI_FORBIDDEN = 0x01
+        if not func(ctypes.byref(blob_in), None, None, None, None,
+                    CRYPTPROTECT_UI_FORBIDDEN, ctypes.byref(blob_out)):
+            raise ctypes.WinError()
+        try:
+            return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+        finally:
+            self._kernel32.LocalFree(blob_out.pbData)
+
+    def encrypt(self, data):
+        return self._call(self._crypt32.CryptProtectData, data)
+
+    def decrypt(self, data):
+        return self._call(self._crypt32.CryptUnprotectData, data)
+
+
+class _FernetCipher:
+    """cryptography 패키지의 Fernet으로 암호화
+
+    키는 OS 키링(keyring 패키지: macOS Keychain, Linux Secret Service 등)에 저장한다.
+    키링을 사용할 수 없으면 저장 폴더의 .key 파일(권한 0600)에 저장하는데, 이 경우 키가
+    세션 파일 옆에 있으므로 다른 OS 사용자로부터만 보호되고 같은 계정 권한으로 폴더를
+    읽을 수 있으면 세션을 복호화할 수 있다.
+    """
+
+    name = "fernet"
+    KEYRING_SERVICE = "naver-cafe-monitor-sessions"
+
+    def __init__(self, directory):
+        from cryptography.fernet import Fernet
+
+        key_path = os.path.join(directory, ".key")
+        key = self._keyring_key(directory, key_path, Fernet)
+        if key is None:
+            key = self._file_key(key_path, Fernet)
+        self._fernet = Fernet(key)
+
+    def _keyring_key(self, directory, key_path, Fernet):
+        """OS 키링에서 키를 읽거나 생성 (기존 .key 파일이 있으면 키링으로 옮기고 삭제)
+
+        Returns:
+            bytes or None: 키, 키링을 사용할 수 없으면 None
+        """
+        try:
+            import keyring
+            from keyring.backends import fail
+        except ImportError:
+            return None
+        if isinstance(keyring.get_keyring(), fail.Keyring):
+            return None
+
+        username = os.path.abspath(directory)
+        try:
+            stored = keyring.get_password(self.KEYRING_SERVICE, username)
+            if stored:
+                return stored.encode("ascii")
+
+            if os.path.exists(key_path):
+                with open(key_path, "rb") as f:
+                    key = f.read().strip()
+            else:
+                key = Fernet.generate_key()
+            keyring.set_password(self.KEYRING_SERVICE, username, key.decode("ascii"))
+            if os.path.exists(key_path):
+                os.remove(key_path)
+            return key
+        except Exception:
+            logging.error(f"키링 사용 Error :: {traceback.format_exc()}")
+            return None
+
+    def _file_key(self, key_path, Fernet):
+        """저장 폴더의 .key 파일에서 키를 읽거나 소유자 전용 권한(0600)으로 생성"""
+        logging.warning("OS 키링을 사용할 수 없어 세션 암호화 키를 파일로 저장합니다. "
+                        "(다른 사용자로부터만 보호됩니다)")
+        if os.path.exists(key_path):
+            try:
+                os.chmod(key_path, 0o600)
+            except OSError:
+                pass
+            with open(key_path, "rb") as f:
+                return f.read().strip()
+
+        key = Fernet.generate_key()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+    def encrypt(self, data):
+        return self._fernet.encrypt(data)
+
+    def decrypt(self, data):
+        return self._fernet.decrypt(data)
+
+
+class SessionStore:
+    """계정별 로그인 세션(쿠키, User-Agent)을 암호화해서 저장하는 클래스
+
+    Windows에서는 DPAPI, 그 외에는 cryptography(Fernet)가 설치된 경우에만 사용한다.
+    Fernet 키는 OS 키링에 보관하며, 키링이 없으면 0600 권한의 키 파일로 대신한다.
+    사용할 수 있는 암호화 수단이 없으면 세션을 저장하지 않는다 (평문 저장하지 않음).
+    파일 이름은 계정 ID의 해시를 사용한다.
+    """
+
+    def __init__(self, directory=os.path.join("account", "sessions")):
+        """
+        Args:
+            directory (str): 세션 파일 저장 폴더
+        """
+        self.directory = directory
+        self.cipher = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self.cipher = self._create_cipher()
+        except Exception:
+            logging.error(f"SessionStore 초기화 Error :: {traceback.format_exc()}")
+
+        if self.cipher is None:
+            logging.warning("세션 암호화를 사용할 수 없어 로그인 세션을 저장하지 않습니다.")
+
+    def _create_cipher(self):
+        if sys.platform == "win32":
+            try:
+                return _DpapiCipher()
+            except Exception:
+                logging.error(f"DPAPI 초기화 Error :: {traceback.format_exc()}")
+        try:
+            return _FernetCipher(self.directory)
+        except ImportError:
+            return None
+
+    @property
+    def available(self):
+        """세션 저장 가능 여부"""
+        return self.cipher is not None
+
+    def _path(self, account_id):
+        digest = hashlib.sha256(account_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.session")
+
+    def save(self, account_id, headers):
+        """로그인 헤더에서 쿠키와 User-Agent를 암호화하여 저장
+
+        Args:
+            account_id (str): 계정 ID
+            headers (dict): 로그인 후 헤더 ('Cookie', 'User-Agent' 포함)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not self.available or not headers or not headers.get('Cookie'):
+            return False
+        try:
+            payload = json.dumps({
+                'account_id': account_id,
+                'cookie': headers['Cookie'],
+                'user_agent': headers.get('User-Agent', ''),
+                'saved_at': time.time()
+            }, ensure_ascii=False).encode("utf-8")
+            data = self.cipher.name.encode("ascii") + b":" + self.cipher.encrypt(payload)
+
+            path = self._path(account_id)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except Exception:
+            logging.error(f"세션 저장 Error :: {traceback.format_exc()}")
+            return False
+
+    def load(self, account_id):
+        """저장된 세션 로드
+
+        Returns:
+            dict or None: {'cookie', 'user_agent', 'saved_at'} 또는 없으면 None
+        """
+        if not self.available:
+            return None
+        path = self._path(account_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            scheme, _, encrypted = data.partition(b":")
+            if scheme.decode("ascii", "ignore") != self.cipher.name:
+                return None
+            session = json.loads(self.cipher.decrypt(encrypted).decode("utf-8"))
+            if session.get('account_id') != account_id:
+                return None
+            return session
+        except Exception:
+            logging.error(f"세션 로드 Error :: {traceback.format_exc()}")
+            return None
+
+    def forget(self, account_id):
+        """저장된 세션 삭제"""
+        try:
+            path = self._path(account_id)
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            logging.error(f"세션 삭제 Error :: {traceback.format_exc()}")
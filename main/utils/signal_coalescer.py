@@ -0,0 +1,117 @@
+import threading
+import time
+
+
+class SignalCoalescer:
+    """항목을 모아서 리스트 단위로 시그널을 발생시키는 클래스
+
+    Worker 스레드에서 항목마다 시그널을 보내면 GUI 이벤트 큐가 넘치므로,
+    push()로 버퍼에 쌓아두고 일정 간격(interval)마다 한 번에 emit 한다.
+    간격 안에 더 push 되지 않아도 (본문 요청, AI 분석처럼 오래 걸리는 작업 직전) 타이머 스레드가
+    간격이 지나면 남은 항목을 전송한다. (QThread.run 에는 이벤트 루프가 없어 QTimer 를 쓸 수 없음)
+    """
+
+    def __init__(self, signal, interval=0.1, max_batch=500):
+        """
+        Args:
+            signal (pyqtBoundSignal): list 인자를 받는 시그널
+            interval (float): 최소 전송 간격(초)
+            max_batch (int): 간격과 상관없이 즉시 전송할 버퍼 크기
+        """
+        self.signal = signal
+        self.interval = interval
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()  # 타이머와 호출 스레드의 전송 순서 유지
+        self._buffer = []
+        self._last_flush = 0.0
+        self._timer = None
+
+    def push(self, item):
+        """항목 추가 (간격이 지났거나 버퍼가 가득 차면 전송, 아니면 간격이 지날 때 전송 예약)"""
+        with self._lock:
+            self._buffer.append(item)
+            wait = self.interval - (time.monotonic() - self._last_flush)
+            due = wait <= 0 or len(self._buffer) >= self.max_batch
+            if not due and self._timer is None:
+                self._timer = _start_timer(wait, self._on_timer)
+        if due:
+            self.flush()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self):
+        """버퍼에 남은 항목을 즉시 전송"""
+        with self._emit_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                batch = self._buffer
+                self._buffer = []
+                self._last_flush = time.monotonic()
+            self.signal.emit(batch)
+
+
+class ProgressThrottle:
+    """진행상황 시그널을 고정 주기로 제한하는 클래스
+
+    최신 상태만 기억해두고 interval 마다 한 번만 전송한다. 주기 안에 들어온 마지막 상태는
+    타이머 스레드가 주기가 지나면 전송하며, force=True 또는 flush()로 즉시 전달할 수 있다.
+    """
+
+    def __init__(self, signal, interval=0.1):
+        """
+        Args:
+            signal (pyqtBoundSignal): dict 인자를 받는 시그널
+            interval (float): 최소 전송 간격(초), 기본 0.1초 (10Hz)
+        """
+        self.signal = signal
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._pending = None
+        self._last_emit = 0.0
+        self._timer = None
+
+    def update(self, info, force=False):
+        """진행상황 갱신
+
+        Args:
+            info (dict): 진행상황 정보
+            force (bool): 주기와 관계없이 즉시 전송 여부
+        """
+        with self._lock:
+            self._pending = info
+            wait = self.interval - (time.monotonic() - self._last_emit)
+            due = force or wait <= 0
+            if not due and self._timer is None:
+                self._timer = _start_timer(wait, self._on_timer)
+        if due:
+            self.flush()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self):
+        """대기 중인 최신 진행상황 전송"""
+        with self._emit_lock:
+            with self._lock:
+                info = self._pending
+                self._pending = None
+                if info is None:
+                    return
+                self._last_emit = time.monotonic()
+            self.signal.emit(info)
+
+
+def _start_timer(delay, callback):
+    """delay 초 뒤 callback 을 호출하는 데몬 타이머 시작"""
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
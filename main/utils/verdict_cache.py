@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import traceback
+
+
+class VerdictCache:
+    """AI 판정 캐시 (모델 + system 메시지 + 명령어 + AI에 보낸 게시글 제목/내용 -> True/False)
+
+    같은 모델, 같은 system 메시지로 같은 명령어와 내용을 다시 분석하면 저장된 판정을 사용한다.
+    모델이나 지시문이 바뀌거나 단일/여러 명령어 분석처럼 system 메시지가 달라지면 다시 분석한다.
+    내용은 프롬프트에 실제로 넣은 (압축된) 문자열 기준이므로 압축 설정이 바뀌어도 다시 분석한다.
+    data/verdict_cache.json 에 저장한다.
+    """
+
+    MAX_ENTRIES = 50000  # 넘으면 오래된 항목부터 삭제
+
+    def __init__(self, path=os.path.join("data", "verdict_cache.json")):
+        """
+        Args:
+            path (str): 캐시 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._verdicts = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    @staticmethod
+    def prompt_id(model, system_prompt):
+        """판정에 사용한 모델과 system 메시지의 해시 (make_key 에 전달)"""
+        raw = "\x1f".join((model, system_prompt))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(prompt_id, command, title, content):
+        """판정 키 (prompt_id, 명령어, 게시글 내용의 해시)
+
+        Args:
+            prompt_id (str): prompt_id() 결과
+            command (str): 판정한 명령어
+            title (str): AI에 보낸 제목
+            content (str): AI에 보낸 내용
+        """
+        raw = "\x1f".join((prompt_id, command.strip(), title or "", content or ""))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def load(self):
+        """파일에서 캐시 로드"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._verdicts = json.load(f)
+        except Exception:
+            logging.error(f"판정 캐시 로드 Error :: {traceback.format_exc()}")
+            self._verdicts = {}
+
+    def get(self, key):
+        """저장된 판정 (없으면 None)"""
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return verdict
+
+    def put(self, key, verdict):
+        """판정 저장 (save() 호출 시 파일에 기록)"""
+        with self._lock:
+            self._verdicts.pop(key, None)  # 최근 항목이 뒤에 오도록
+            self._verdicts[key] = bool(verdict)
+
+    def save(self):
+        """파일에 저장"""
+        with self._lock:
+            try:
+                overflow = len(self._verdicts) - self.MAX_ENTRIES
+                if overflow > 0:
+                    for key in list(self._verdicts)[:overflow]:
+                        del self._verdicts[key]
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._verdicts, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                logging.error(f"판정 캐시 저장 Error :: {traceback.format_exc()}")
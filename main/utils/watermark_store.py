@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import threading
+import traceback
+from datetime import datetime
+
+
+class WatermarkStore:
+    """최신순 검색의 증분 수집 기준점(워터마크) 저장소
+
+    (검색어, 검색 옵션)마다 마지막으로 수집한 가장 최신 게시글의 (cafe_id, article_id)와
+    작성 시각, 최근에 본 게시글 키 목록을 data/watermarks.json 에 저장한다.
+    """
+
+    MAX_RECENT_KEYS = 300  # 워터마크당 기억할 최근 게시글 키 수
+
+    def __init__(self, path=os.path.join("data", "watermarks.json")):
+        """
+        Args:
+            path (str): 워터마크 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._watermarks = {}
+        self.load()
+
+    @staticmethod
+    def make_key(query, options):
+        """검색어와 검색 옵션으로 워터마크 키 생성"""
+        key_options = {
+            'query': query,
+            'cafe_where': options.get('cafe_where'),
+            'date_option': options.get('date_option'),
+            'sort': options.get('sort'),
+        }
+        return json.dumps(key_options, ensure_ascii=False, sort_keys=True)
+
+    def find_legacy(self, query, options):
+        """여러 검색어를 쉼표로 이어 하나의 키로 저장하던 이전 워터마크 중 query 를 포함하는 것 찾기
+
+        검색어별 키로 바뀌기 전에는 입력한 문자열 전체("a, b")가 키였으므로, 검색어별 키가 아직 없으면
+        이 기준점을 이어서 사용한다 (다음 갱신부터 검색어별 키로 저장됨).
+
+        Returns:
+            dict or None: 워터마크 정보
+        """
+        with self._lock:
+            for key, watermark in self._watermarks.items():
+                try:
+                    key_options = json.loads(key)
+                except ValueError:
+                    continue
+                legacy_query = key_options.get('query') or ''
+                if ',' not in legacy_query:
+                    continue
+                if query not in [q.strip() for q in legacy_query.split(',')]:
+                    continue
+                if all(key_options.get(name) == options.get(name) for name in ('cafe_where', 'date_option', 'sort')):
+                    return watermark
+        return None
+
+    @staticmethod
+    def item_key(item):
+        """게시글 키 (cafe_id/article_id)"""
+        return f"{item.get('cafe_id', '')}/{item.get('article_id', '')}"
+
+    def load(self):
+        """파일에서 워터마크 로드"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._watermarks = json.load(f)
+        except Exception:
+            logging.error(f"워터마크 로드 Error :: {traceback.format_exc()}")
+            self._watermarks = {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._watermarks, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key):
+        """워터마크 조회 (없으면 None)"""
+        with self._lock:
+            watermark = self._watermarks.get(key)
+            return dict(watermark) if watermark else None
+
+    def advance(self, key, items, post_time_of):
+        """이번 실행에서 새로 수집한 게시글로 워터마크 갱신 (실행이 정상 종료된 경우에만 호출)
+
+        Args:
+            key (str): 워터마크 키
+            items (list): 이번에 새로 수집한 게시글 목록 (최신순)
+            post_time_of (callable): 게시글 -> 작성 시각 하한(datetime 또는 None)
+        """
+        if not items:
+            return
+        with self._lock:
+            previous = self._watermarks.get(key, {})
+            newest = items[0]
+            newest_time = post_time_of(newest)
+
+            recent_keys = [self.item_key(item) for item in items]
+            for old_key in previous.get('recent_keys', []):
+                if old_key not in recent_keys:
+                    recent_keys.append(old_key)
+
+            # 작성 시각을 알 수 없으면 이전 기준 시각 유지
+            post_time = newest_time.strftime("%Y-%m-%d %H:%M:%S") if newest_time else previous.get('post_time')
+            self._watermarks[key] = {
+                'cafe_id': newest.get('cafe_id', ''),
+                'article_id': newest.get('article_id', ''),
+                'post_time': post_time,
+                'recent_keys': recent_keys[:self.MAX_RECENT_KEYS],
+                'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            try:
+                self._save()
+            except Exception:
+                logging.error(f"워터마크 저장 Error :: {traceback.format_exc()}")
+
+    def reset(self, key=None):
+        """워터마크 초기화 (key가 없으면 전체)"""
+        with self._lock:
+            if key is None:
+                self._watermarks = {}
+            else:
+                self._watermarks.pop(key, None)
+            try:
+                self._save()
+            except Exception:
+                logging.error(f"워터마크 저장 Error :: {traceback.format_exc()}")
+
+
+class BoardWatermarkStore:
+    """게시판 직접 수집의 게시판별 기준점 저장소
+
+    게시판 키(club_id/menu_id)마다 마지막으로 수집한 가장 큰 articleId를 data/board_watermarks.json 에 저장한다.
+    """
+
+    def __init__(self, path=os.path.join("data", "board_watermarks.json")):
+        """
+        Args:
+            path (str): 워터마크 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._watermarks = {}
+        self.load()
+
+    def load(self):
+        """파일에서 워터마크 로드"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._watermarks = json.load(f)
+        except Exception:
+            logging.error(f"게시판 워터마크 로드 Error :: {traceback.format_exc()}")
+            self._watermarks = {}
+
+    def get_all(self):
+        """전체 워터마크 {게시판 키: articleId}"""
+        with self._lock:
+            return {key: value['article_id'] for key, value in self._watermarks.items()}
+
+    def update(self, watermarks):
+        """게시판별 기준점 갱신 (실행이 정상 종료된 경우에만 호출)
+
+        Args:
+            watermarks (dict): {게시판 키: 새 articleId}
+        """
+        if not watermarks:
+            return
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            for key, article_id in watermarks.items():
+                previous = self._watermarks.get(key, {}).get('article_id', 0)
+                if int(article_id) > int(previous):
+                    self._watermarks[key] = {'article_id': int(article_id), 'updated_at': updated_at}
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._watermarks, f, indent=4, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                logging.error(f"게시판 워터마크 저장 Error :: {traceback.format_exc()}")
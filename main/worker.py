@@ -1,35 +1,70 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 from .api.search import NaverCafeSearchAPI
 from .api.cafe import CafeAPI
+from .api.session_pool import SessionPool
+from .api.board_crawler import BoardCrawler
 from .api.ai_generator import AIGenerator
+from .utils.dedup_index import DedupIndex
+from .utils.signal_coalescer import SignalCoalescer, ProgressThrottle
+from .utils.watermark_store import WatermarkStore, BoardWatermarkStore
+from .utils.prefetcher import Prefetcher
+from .utils.prompt_compressor import PromptCompressor
+from .utils.run_store import RunStore
+from .utils.verdict_cache import VerdictCache
+from .api.search import parse_post_date
+from .api.search_backends import get_search_backend
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
 import time
 import traceback
 
 # 작업관리에서 작업 리스트를 가져오고 작업에 맞는 설정값들은 스케줄러를 만들고 별도로 관리한다.
 
 class Worker(QThread):
-    log_message = pyqtSignal(dict)  # 로그 메시지 시그널
-    post_found = pyqtSignal(dict)   # 게시글 발견 시그널
+    log_messages = pyqtSignal(list)  # 로그 메시지 묶음 시그널
+    posts_found = pyqtSignal(list)   # 발견 게시글 묶음 시그널
     next_task_info = pyqtSignal(dict)  # 다음 작업 정보 시그널
     tasks_completed = pyqtSignal(bool)  # 작업 완료 시그널 (True: 정상 완료, False: 오류/취소)
     progress_updated = pyqtSignal(dict)  # 진행상황 업데이트 시그널 (추가)
     
-    def __init__(self, headers=None, search_keyword=None, api_key=None, options=None):
+    def __init__(self, headers=None, search_keyword=None, api_key=None, options=None, dedup_index=None,
+                 session_pool=None):
         """
         Worker 클래스 초기화
         
         Args:
             headers (dict): 로그인된 계정의 헤더 정보
-            search_keyword (str): 검색 키워드
+            search_keyword (str or list): 검색 키워드 (쉼표로 구분하거나 리스트로 전달하면 검색어별로 동시에 검색)
             api_key (str): OpenAI API 키
             options (dict): 검색 옵션
                 - cafe_where (str): 검색 대상
+                - search_backend (str): 검색 방식 ('html', 'json', 'openapi')
+                - naver_client_id (str): 네이버 Open API Client ID ('openapi' 에서만 사용)
+                - naver_client_secret (str): 네이버 Open API Client Secret ('openapi' 에서만 사용)
                 - sort (str): 정렬 방식
                 - date_option (int): 기간 옵션
                 - max_items (int): 최대 수집 개수
                 - page_delay (int): 페이지 간 딜레이
-                - ai_filter_command (str): AI 분석 명령어
+                - ai_filter_command (str): AI 분석 명령어 ('|'로 구분하면 여러 명령어를 한 번의 요청으로 분석하고
+                  일치한 명령어를 결과의 태그 컬럼에 표시)
+                - ai_filter_commands (list, optional): AI 분석 명령어 목록 (지정하면 ai_filter_command 대신 사용)
                 - filter_keywords (list): 필터 키워드 목록 (추가됨)
+                - incremental (bool): 증분 수집 여부 (최신순 정렬에서만 적용)
+                - trade_method (str): 거래 방법 ('all', 'safe', 'normal', 거래글 검색에서만 적용)
+                - trade_status (str): 거래 상태 ('all', 'selling', 'sold', 거래글 검색에서만 적용)
+                - target_matches (int): 목표 일치 개수 (0이면 사용하지 않음). 지정하면 두 필터를 모두 통과한 게시글이
+                  이 개수만큼 모일 때까지 검색/본문 수집/AI 분석을 이어서 진행하고, max_items 는 검색 결과 원본의 안전 상한이 된다.
+                - shards (int): 기간 분할 수 (1주 이상 기간에서 2 이상이면 구간별 동시 검색, 증분 수집과 함께 쓰지 않음)
+                - source (str): 수집 방식 ('search': 네이버 카페 검색, 'boards': 가입 카페 게시판 직접 수집)
+                - board_cafes (list): 게시판 직접 수집할 카페 목록 [{'cafe_id', 'cafe_url', 'cafe_name'}]
+                - board_max_pages (int): 게시판당 최대 페이지 수 (게시판 직접 수집, 증분 수집은 기준점이 없는 게시판에만 적용)
+                - content_token_budget (int): AI 분석용 본문의 게시글당 토큰 예산 (기본값: 150). 필터 키워드/명령어 단어 주변 문장만 남기고,
+                  0이면 기존처럼 앞 300자를 사용
+                - snippet_triage (bool): AI 분석 전에 제목/미리보기만으로 1차 분류하고 애매한 게시글만 본문 수집 (기본값: True)
+                - save_run (bool): 검색 결과와 가져온 본문을 data/runs/ 에 저장하여 나중에 재분석할 수 있게 함 (기본값: True)
+            dedup_index (DedupIndex): 이미 수집된 게시글 중복 체크 인덱스 (GUI 모니터와 공유)
+            session_pool (SessionPool, optional): 게시글 내용 요청을 분산할 로그인 계정 풀
         """
         super().__init__()
         self.headers = headers
@@ -38,9 +73,22 @@ class Worker(QThread):
         self.options = options or {}
         self.is_running = False
         self.post_count = 0
-        self.collected_titles = []  # 중복 제거를 위한 제목 저장 리스트
+        self.dedup_index = dedup_index or DedupIndex()  # 기존 수집 게시글 중복 체크 인덱스
+        self.collected_titles = set()  # 중복 제거를 위한 제목 저장 집합
         self.collected_ids_content_pairs = set()  # 중복 제거를 위한 (아이디, 내용) 쌍 저장 집합
         self.search_api = None  # NaverCafeSearchAPI 인스턴스 저장용 (추가)
+        self.board_crawler = None  # 게시판 직접 수집기
+        self.session_pool = session_pool  # 게시글 내용 요청용 계정 풀
+        self.cafe_api = None  # 게시글 HTML 파싱용 CafeAPI
+        self.compressor = None  # AI 분석용 본문 압축기
+        self.ai_generator = None  # 토큰 사용량 기록용
+        self.run_items = []  # 재분석용 검색 결과 원본 (필터 적용 전)
+        self.fetched_contents = {}  # 재분석용 본문 {RunStore.content_key: 본문 텍스트}
+        
+        # 시그널 병합 전송기 (GUI 이벤트 큐 과부하 방지)
+        self.log_buffer = SignalCoalescer(self.log_messages, interval=0.1)
+        self.post_buffer = SignalCoalescer(self.posts_found, interval=0.2)
+        self.progress = ProgressThrottle(self.progress_updated, interval=0.1)  # 10Hz
 
     def set_headers(self, headers):
         """헤더 설정"""
@@ -50,6 +98,19 @@ class Worker(QThread):
         """검색 키워드 설정"""
         self.search_keyword = keyword
         
+    def get_search_keywords(self):
+        """검색 키워드 목록 (쉼표로 구분된 문자열 또는 리스트, 중복 제거)"""
+        if isinstance(self.search_keyword, str):
+            keywords = self.search_keyword.split(',')
+        else:
+            keywords = self.search_keyword or []
+        return list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        
+    def get_ai_commands(self):
+        """AI 분석 명령어 목록 ('|'로 구분된 문자열 또는 리스트, 중복 제거)"""
+        commands = self.options.get("ai_filter_commands") or self.options.get("ai_filter_command", "").split("|")
+        return list(dict.fromkeys(c.strip() for c in commands if c and c.strip()))
+        
     def set_api_key(self, api_key):
         """OpenAI API 키 설정"""
         self.api_key = api_key
@@ -64,7 +125,16 @@ class Worker(QThread):
         # 검색 API 인스턴스가 있으면 중지 신호 전달 (추가)
         if self.search_api:
             self.search_api.stop_search()
-        self.log_message.emit({"message": "작업이 중지되었습니다.", "color": "red"})
+        if self.board_crawler:
+            self.board_crawler.stop()
+        self.log_buffer.push({"message": "작업이 중지되었습니다.", "color": "red"})
+        self.log_buffer.flush()
+        
+    def _flush_signals(self):
+        """버퍼에 쌓인 로그/게시글/진행상황 시그널을 즉시 전송"""
+        self.post_buffer.flush()
+        self.log_buffer.flush()
+        self.progress.flush()
         
     def run(self):
         """작업 실행"""
@@ -73,46 +143,65 @@ class Worker(QThread):
             
             # 01. 로그인된 계정의 헤더 정보를 가져온다.
             if not self.headers:
-                self.log_message.emit({"message": "로그인된 계정 정보가 없습니다. 계정을 먼저 로그인해주세요.", "color": "red"})
+                self.log_buffer.push({"message": "로그인된 계정 정보가 없습니다. 계정을 먼저 로그인해주세요.", "color": "red"})
                 self.is_running = False
+                self._flush_signals()
                 self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
                 return
             else:
-                self.log_message.emit({"message": "로그인된 계정 정보가 확인되었습니다.", "color": "green"})
+                self.log_buffer.push({"message": "로그인된 계정 정보가 확인되었습니다.", "color": "green"})
                 
-            # 검색 키워드 확인
-            if not self.search_keyword:
-                self.log_message.emit({"message": "검색 키워드가 설정되지 않았습니다.", "color": "red"})
+            # 검색 키워드 확인 (게시판 직접 수집은 검색어 없이 선택한 카페의 게시판을 읽음)
+            board_mode = self.options.get("source", "search") == "boards"
+            if board_mode:
+                board_cafes = self.options.get("board_cafes", [])
+                if not board_cafes:
+                    self.log_buffer.push({"message": "게시판 직접 수집할 카페가 선택되지 않았습니다.", "color": "red"})
+                    self.is_running = False
+                    self._flush_signals()
+                    self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
+                    return
+                self.log_buffer.push({
+                    "message": f"게시판 직접 수집 카페: {', '.join(cafe.get('cafe_name', '') for cafe in board_cafes)}",
+                    "color": "blue"
+                })
+            elif not self.get_search_keywords():
+                self.log_buffer.push({"message": "검색 키워드가 설정되지 않았습니다.", "color": "red"})
                 self.is_running = False
+                self._flush_signals()
                 self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
                 return
             else:
-                self.log_message.emit({"message": f"검색 키워드: '{self.search_keyword}'", "color": "blue"})
+                self.log_buffer.push({"message": f"검색 키워드: {', '.join(self.get_search_keywords())}", "color": "blue"})
                 
             # API 키 확인
             if not self.api_key:
-                self.log_message.emit({"message": "OpenAI API 키가 설정되지 않았습니다.", "color": "red"})
+                self.log_buffer.push({"message": "OpenAI API 키가 설정되지 않았습니다.", "color": "red"})
                 self.is_running = False
+                self._flush_signals()
                 self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
                 return
                 
             # API 키 검증
-            self.log_message.emit({"message": "OpenAI API 키 검증 중...", "color": "blue"})
+            self.log_buffer.push({"message": "OpenAI API 키 검증 중...", "color": "blue"})
             ai_generator = AIGenerator(api_key=self.api_key)
+            self.ai_generator = ai_generator
             is_valid, message = ai_generator.validate_api_key()
             
             if not is_valid:
-                self.log_message.emit({"message": f"API 키 검증 실패: {message}", "color": "red"})
+                self.log_buffer.push({"message": f"API 키 검증 실패: {message}", "color": "red"})
                 self.is_running = False
+                self._flush_signals()
                 self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
                 return
             else:
-                self.log_message.emit({"message": f"API 키 검증 성공: {message}", "color": "green"})
+                self.log_buffer.push({"message": f"API 키 검증 성공: {message}", "color": "green"})
                 
-            self.log_message.emit({"message": "작업을 시작합니다.", "color": "green"})
+            self.log_buffer.push({"message": "작업을 시작합니다.", "color": "green"})
             
             # 02. 설정에 맞춰서 네이버 카페 검색을 한다. search.py의 search함수 사용
-            self.log_message.emit({"message": f"'{self.search_keyword}' 키워드로 네이버 카페 검색을 시작합니다.", "color": "blue"})
+            if not board_mode:
+                self.log_buffer.push({"message": f"'{', '.join(self.get_search_keywords())}' 키워드로 네이버 카페 검색을 시작합니다.", "color": "blue"})
             
             # 검색 옵션 설정
             max_items = self.options.get("max_items", 100)
@@ -120,73 +209,217 @@ class Worker(QThread):
             date_option = self.options.get("date_option", 2)  # 기본값: 1일
             sort = self.options.get("sort", "rel")  # 기본값: 관련도순
             page_delay = self.options.get("page_delay", 1)  # 기본값: 1초
+            trade_filter = {
+                "method": self.options.get("trade_method", "all"),
+                "status": self.options.get("trade_status", "all")
+            } if cafe_where == "articlec" else None  # 거래글 검색에서만 사용
             
             # 옵션 디버깅용 로그 출력
-            self.log_message.emit({
+            self.log_buffer.push({
                 "message": f"작업 설정: {self.options}", 
                 "color": "gray"
             })
             
             # NaverCafeSearchAPI 인스턴스 생성 및 저장
-            self.search_api = NaverCafeSearchAPI()
+            backend_name = self.options.get("search_backend", "html")
+            client_id = self.options.get("naver_client_id", "")
+            client_secret = self.options.get("naver_client_secret", "")
+            if backend_name == "openapi" and not (client_id and client_secret):
+                self.log_buffer.push({"message": "Open API 인증 정보가 없어 HTML 검색 방식을 사용합니다.", "color": "yellow"})
+                backend_name = "html"
+            backend = get_search_backend(backend_name, client_id, client_secret)
+            if backend_name == "openapi":
+                self.log_buffer.push({
+                    "message": f"Open API 검색: 오늘 남은 호출 {backend.quota.remaining}회 (기간/대상/거래 조건은 적용되지 않음)",
+                    "color": "blue"
+                })
+            self.search_api = NaverCafeSearchAPI(backend=backend)
+            
+            # 증분 수집: 이전 실행의 기준점(워터마크) 조회 (검색어별)
+            keywords = self.get_search_keywords()
+            watermark_store = None
+            watermark_keys = {}
+            watermarks = {}
+            if board_mode:
+                keywords = []  # 게시판 직접 수집은 게시판별 기준점(articleId)을 따로 관리
+            elif self.options.get("incremental") and sort == "date":
+                watermark_store = WatermarkStore()
+                for keyword in keywords:
+                    watermark_keys[keyword] = WatermarkStore.make_key(keyword, self.options)
+                    watermark = (watermark_store.get(watermark_keys[keyword])
+                                 or watermark_store.find_legacy(keyword, self.options))
+                    if watermark:
+                        watermarks[keyword] = watermark
+                        self.log_buffer.push({
+                            "message": f"증분 수집 '{keyword}': {watermark.get('post_time') or '알 수 없음'} 이후 게시글만 수집합니다.",
+                            "color": "blue"
+                        })
+                    else:
+                        self.log_buffer.push({
+                            "message": f"증분 수집 '{keyword}': 이전 기준점이 없어 전체 수집 후 기준점을 저장합니다.",
+                            "color": "blue"
+                        })
+            elif self.options.get("incremental"):
+                self.log_buffer.push({"message": "증분 수집은 최신순 정렬에서만 사용할 수 있어 전체 수집합니다.", "color": "yellow"})
             
             # 진행상황 초기화
-            self.progress_updated.emit({
+            self.progress.update({
                 "status": "검색 시작",
                 "current_page": 0,
                 "total_items": 0,
                 "progress": 0
-            })
+            }, force=True)
+            
+            # CafeAPI 인스턴스 생성 (헤더 전달)
+            self.cafe_api = CafeAPI(self.headers)
+            
+            # 게시글 내용 요청용 세션 풀 (전달받은 풀이 없으면 현재 계정 하나로 구성)
+            if self.session_pool is None:
+                self.session_pool = SessionPool({'default': self.headers})
+            
+            # AI 분석용 본문 압축기 (필터 키워드와 명령어 단어 주변 문장만 토큰 예산 안에서 사용)
+            token_budget = self.options.get("content_token_budget", 150)
+            if token_budget > 0:
+                self.compressor = PromptCompressor(self.options.get("filter_keywords", []),
+                                                   " ".join(self.get_ai_commands()), token_budget)
+            
+            # 목표 일치 개수 모드: 검색/본문 수집/AI 분석을 페이지 단위로 이어서 실행
+            target_matches = self.options.get("target_matches", 0)
+            if target_matches > 0 and board_mode:
+                self.log_buffer.push({"message": "목표 일치 개수 모드는 검색에서만 사용할 수 있어 게시판 전체를 수집합니다.", "color": "yellow"})
+            elif target_matches > 0:
+                self._flush_signals()
+                search_kwargs = {
+                    "cafe_where": cafe_where,
+                    "date_option": date_option,
+                    "sort": sort,
+                    "page_delay": page_delay,
+                    "trade_filter": trade_filter
+                }
+                searched_items, complete_keywords = self._run_until_target(keywords, search_kwargs, watermarks,
+                                                                           ai_generator, target_matches, max_items)
+                self.run_items = list({NaverCafeSearchAPI.item_key(item): item
+                                       for items in searched_items.values() for item in items}.values())
+                self._finish_run(watermark_store, watermark_keys, searched_items, complete_keywords)
+                return
             
             # 검색 실행 (콜백 함수 추가)
-            search_results = self.search_api.search(
-                query=self.search_keyword,
-                max_items=max_items,
-                cafe_where=cafe_where,
-                date_option=date_option,
-                sort=sort,
-                page_delay=page_delay,
-                progress_callback=self.update_search_progress  # 콜백 함수 추가
-            )
+            self._flush_signals()
+            board_store = None
+            board_watermarks = {}
+            shard_count = self.options.get("shards", 1)
+            if shard_count > 1 and date_option not in NaverCafeSearchAPI.SHARD_SPANS:
+                shard_count = 1
+            if shard_count > 1 and not self.search_api.backend.supports_period:
+                # 기간 조건이 없는 백엔드는 구간마다 같은 검색을 반복하므로 (Open API 호출 한도만 소모) 분할하지 않음
+                self.log_buffer.push({
+                    "message": f"{self.search_api.backend.label} 검색은 기간을 지원하지 않아 기간 분할 없이 검색합니다.",
+                    "color": "yellow"
+                })
+                shard_count = 1
+            if shard_count > 1 and watermark_store is None and not board_mode:
+                self.log_buffer.push({"message": f"기간을 {shard_count}개 구간으로 나누어 동시에 검색합니다.", "color": "blue"})
+            
+            if board_mode:
+                # 게시판 직접 수집: 카페별로 동시에 모든 게시판을 최신글부터 읽음
+                board_store, search_results = self._crawl_boards(board_cafes)
+                board_watermarks = search_results.get("watermarks", {})
+                per_query = {}
+            elif len(keywords) > 1:
+                # 여러 검색어: 동시에 검색하고 병합 (중복 게시글은 한 번만 처리)
+                self.log_buffer.push({"message": f"검색어 {len(keywords)}개를 동시에 검색합니다.", "color": "blue"})
+                search_results = self.search_api.search_many(
+                    queries=keywords,
+                    max_items=max_items,
+                    cafe_where=cafe_where,
+                    date_option=date_option,
+                    sort=sort,
+                    page_delay=page_delay,
+                    progress_callback=self.update_search_progress,
+                    watermarks=watermarks,
+                    shard_count=1 if watermark_store else shard_count,
+                    trade_filter=trade_filter
+                )
+                per_query = search_results.get("per_query", {})
+            elif shard_count > 1 and watermark_store is None:
+                search_results = self.search_api.search_sharded(
+                    query=keywords[0],
+                    max_items=max_items,
+                    cafe_where=cafe_where,
+                    date_option=date_option,
+                    sort=sort,
+                    page_delay=page_delay,
+                    progress_callback=self.update_search_progress,
+                    shard_count=shard_count,
+                    trade_filter=trade_filter
+                )
+                for shard in search_results.get("shards", []):
+                    self.log_buffer.push({
+                        "message": f"  {shard['from']} ~ {shard['to']}: {shard['count']}개",
+                        "color": "white"
+                    })
+                per_query = {keywords[0]: search_results}
+            else:
+                search_results = self.search_api.search(
+                    query=keywords[0],
+                    max_items=max_items,
+                    cafe_where=cafe_where,
+                    date_option=date_option,
+                    sort=sort,
+                    page_delay=page_delay,
+                    progress_callback=self.update_search_progress,  # 콜백 함수 추가
+                    watermark=watermarks.get(keywords[0]),
+                    trade_filter=trade_filter
+                )
+                per_query = {keywords[0]: search_results}
             
             # 03. 검색된 결과를 가져온다.
             if search_results["status"] != "success":
-                self.log_message.emit({"message": "검색 결과를 가져오는데 실패했습니다.", "color": "red"})
+                self.log_buffer.push({"message": "검색 결과를 가져오는데 실패했습니다.", "color": "red"})
                 self.is_running = False
+                self._flush_signals()
                 self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
                 return
                 
             total_count = search_results["total_count"]
-            self.log_message.emit({"message": f"총 {total_count}개의 게시글을 검색했습니다.", "color": "blue"})
-            
-            # CafeAPI 인스턴스 생성 (헤더 전달)
-            cafe_api = CafeAPI(self.headers)
-            
-            # 기존 수집된 제목 가져오기
-            existing_titles = []
-            existing_id_content_pairs = set()
-            try:
-                from PyQt5.QtWidgets import QTableWidgetItem
-                if hasattr(self, 'routine_tab') and hasattr(self.routine_tab, 'task_monitor'):
-                    for row in range(self.routine_tab.task_monitor.rowCount()):
-                        # 제목(내용) 가져오기
-                        content_item = self.routine_tab.task_monitor.item(row, 2)
-                        # 아이디 가져오기
-                        id_item = self.routine_tab.task_monitor.item(row, 1)
-                        
-                        if content_item and id_item:
-                            content_text = content_item.text()
-                            id_text = id_item.text()
-                            existing_titles.append(content_text)
-                            existing_id_content_pairs.add((id_text, content_text))
-            except Exception as e:
-                self.log_message.emit({"message": f"기존 게시글 확인 중 오류 발생: {str(e)}. 중복 체크를 건너뜁니다.", "color": "yellow"})
+            if board_mode:
+                self.log_buffer.push({"message": f"게시판에서 새 게시글 {total_count}개를 수집했습니다.", "color": "blue"})
+            elif len(keywords) > 1:
+                found_count = sum(len(result.get("items", [])) for result in per_query.values())
+                self.log_buffer.push({
+                    "message": f"총 {total_count}개의 게시글을 검색했습니다. (검색어별 합계 {found_count}개, 중복 {found_count - total_count}개 제외)",
+                    "color": "blue"
+                })
+                for keyword, result in per_query.items():
+                    self.log_buffer.push({"message": f"  '{keyword}': {len(result.get('items', []))}개", "color": "white"})
+            else:
+                self.log_buffer.push({"message": f"총 {total_count}개의 게시글을 검색했습니다.", "color": "blue"})
+            for keyword, result in per_query.items():
+                if result.get("reached_watermark"):
+                    self.log_buffer.push({
+                        "message": f"'{keyword}': 이전 수집 기준점에 도달하여 {result.get('pages', 1)}페이지에서 검색을 마쳤습니다.",
+                        "color": "blue"
+                    })
+                elif result.get("truncated"):
+                    self.log_buffer.push({
+                        "message": f"'{keyword}': 검색 결과를 더 요청할 수 없는 위치까지 읽어 수집을 멈췄습니다. (증분 수집 기준점은 옮기지 않음)",
+                        "color": "yellow"
+                    })
+            trade_filtered = search_results.get("trade_filtered", 0)
+            if trade_filtered:
+                self.log_buffer.push({
+                    "message": f"거래 조건에 맞지 않는 거래글 {trade_filtered}개를 제외했습니다.",
+                    "color": "gray"
+                })
+            # 워터마크 갱신용 검색어별 결과 (필터 적용 전)
+            searched_items = {keyword: list(result.get("items", [])) for keyword, result in per_query.items()}
+            self.run_items = list(search_results["items"])  # 재분석용 (아래 단계에서 목록이 바뀌기 전에 복사)
             
             # 04. 가져올 때 AI 분석 키워드가 있다면 분석 키워드로 필터해서 가져온다
-            ai_filter_command = self.options.get("ai_filter_command", "")
+            ai_filter_command = " | ".join(self.get_ai_commands())
             filter_keywords = self.options.get("filter_keywords", [])
             
-            self.log_message.emit({
+            self.log_buffer.push({
                 "message": f"총 검색된 게시글: {len(search_results['items'])}개, 필터 키워드: {filter_keywords if filter_keywords else '없음'}, AI 분석 필터: {ai_filter_command if ai_filter_command else '없음'}", 
                 "color": "blue"
             })
@@ -197,7 +430,7 @@ class Worker(QThread):
             filtered_by_keywords = []  # 키워드 필터링된 게시글 저장
             
             if filter_keywords:
-                self.log_message.emit({"message": f"필터 키워드: {', '.join(filter_keywords)}", "color": "blue"})
+                self.log_buffer.push({"message": f"필터 키워드: {', '.join(filter_keywords)}", "color": "blue"})
                 
                 for item in search_results["items"]:
                     title = item["title"].strip()
@@ -207,7 +440,7 @@ class Worker(QThread):
                     for keyword in filter_keywords:
                         keyword = keyword.strip()
                         if keyword in title or keyword in content:
-                            self.log_message.emit({
+                            self.log_buffer.push({
                                 "message": f"✅ 필터 키워드 '{keyword}' 발견: {title}", 
                                 "color": "green"
                             })
@@ -216,14 +449,14 @@ class Worker(QThread):
                             is_duplicate = False
                             
                             # 제목 중복 확인
-                            if title in self.collected_titles or title in existing_titles:
-                                self.log_message.emit({"message": f"⚠️ 중복 게시글(제목) 건너뜀: {title}", "color": "yellow"})
+                            if title in self.collected_titles or self.dedup_index.has_title(title):
+                                self.log_buffer.push({"message": f"⚠️ 중복 게시글(제목) 건너뜀: {title}", "color": "yellow"})
                                 is_duplicate = True
                             
                             # 아이디+내용 조합 중복 확인
                             id_content_pair = (item["cafe_id"], title)
-                            if id_content_pair in self.collected_ids_content_pairs or id_content_pair in existing_id_content_pairs:
-                                self.log_message.emit({"message": f"⚠️ 중복 게시글(아이디+내용) 건너뜀: {title}", "color": "yellow"})
+                            if id_content_pair in self.collected_ids_content_pairs or self.dedup_index.has_pair(*id_content_pair):
+                                self.log_buffer.push({"message": f"⚠️ 중복 게시글(아이디+내용) 건너뜀: {title}", "color": "yellow"})
                                 is_duplicate = True
                             
                             # 중복인 경우 다음 게시글로
@@ -235,19 +468,19 @@ class Worker(QThread):
                             
                             # 중복 확인을 위해 수집된 제목 및 아이디+내용 조합 저장
                             # 중복 확인을 위한 조합 저장은 AI 분석 키워드가 있는 경우에만 진행
-                            self.collected_titles.append(title)
+                            self.collected_titles.add(title)
                             self.collected_ids_content_pairs.add((item["cafe_id"], title))
                             
                             break  # 하나의 키워드라도 매칭되면 다음 게시글로
                 
-                self.log_message.emit({
+                self.log_buffer.push({
                     "message": f"필터 키워드로 {len(filtered_by_keywords)}개의 게시글이 1차 필터링되었습니다.", 
                     "color": "blue"
                 })
             else:
                 # 필터 키워드가 없는 경우 모든 게시글을 1차 필터 통과로 처리
                 filtered_by_keywords = search_results["items"]
-                self.log_message.emit({
+                self.log_buffer.push({
                     "message": "필터 키워드가 설정되지 않아 모든 게시글이 1차 필터를 통과했습니다.", 
                     "color": "blue"
                 })
@@ -256,160 +489,73 @@ class Worker(QThread):
             # 04-2. AI 필터 - AI 명령어가 있으면 2차 필터링 진행
             # ------------------------------------------------
             if ai_filter_command and filtered_by_keywords:  # 1차 필터링된 게시글이 있는 경우에만 AI 분석 진행
-                self.log_message.emit({"message": f"AI 분석 필터: '{ai_filter_command}'로 1차 필터링된 게시글을 분석합니다.", "color": "blue"})
+                self.log_buffer.push({"message": f"AI 분석 필터: '{ai_filter_command}'로 1차 필터링된 게시글을 분석합니다.", "color": "blue"})
+                if len(self.get_ai_commands()) > 1:
+                    self.log_buffer.push({
+                        "message": f"명령어 {len(self.get_ai_commands())}개를 한 번의 요청으로 분석하고 일치한 명령어를 태그로 표시합니다.",
+                        "color": "blue"
+                    })
                 
                 # 배치 처리를 위한 크기 설정
                 batch_size = 20  # 한 번에 처리할 게시글 수
                 total_items = len(filtered_by_keywords)
                 
-                self.log_message.emit({"message": f"총 {total_items}개 게시글에 대해 AI 배치 분석을 시작합니다.", "color": "blue"})
+                self.log_buffer.push({"message": f"총 {total_items}개 게시글에 대해 AI 배치 분석을 시작합니다.", "color": "blue"})
+                
+                # 스니펫 분류: 제목/미리보기로 확실한 게시글은 바로 처리하고 애매한 게시글만 본문 수집
+                triage_accepted = []
+                if self._use_triage():
+                    triage_accepted, filtered_by_keywords = self._triage(filtered_by_keywords, ai_generator)
+                    for item in triage_accepted:
+                        self.log_buffer.push({"message": f"✅ 일치 게시글 발견 (미리보기): {item['title']}", "color": "green"})
+                        self._emit_post(item)
+                    total_items = len(filtered_by_keywords)
                 
                 if total_items > 0:
-                    # 1단계: 게시글 내용 수집 단계
-                    self.log_message.emit({"message": "1단계: AI 분석을 위한 게시글 내용 수집 중...", "color": "blue"})
+                    # 1~2단계: 우선순위가 높은 게시글부터 본문을 미리 가져오면서 배치 단위로 AI 분석
+                    # (AI가 배치를 분석하는 동안 다음 배치의 본문을 세션 풀의 계정들로 계속 가져옴)
+                    self.log_buffer.push({
+                        "message": (f"1~2단계: 게시글 내용 수집과 AI 배치 분석을 함께 진행합니다. "
+                                    f"(계정 {len(self.session_pool)}개, 동시 요청 {self.session_pool.max_concurrency()}개, "
+                                    f"배치 크기: {batch_size}, AI 명령어='{ai_filter_command}')"),
+                        "color": "blue"
+                    })
                     
-                    # 진행상황 초기화 - 게시글 내용 수집 시작
-                    self.progress_updated.emit({
-                        "status": "AI 분석을 위한 게시글 내용 수집 중",
+                    # 진행상황 초기화 - 게시글 내용 수집 및 분석 시작
+                    self.progress.update({
+                        "status": "게시글 내용 수집 및 AI 분석 중",
                         "current_page": 0,
                         "total_items": 0,
                         "progress": 0
-                    })
+                    }, force=True)
                     
-                    # 분석용 게시글 준비
-                    posts_for_analysis = []
+                    self._flush_signals()
+                    posts_for_analysis, analysis_results = self._analyze_with_prefetch(
+                        filtered_by_keywords, ai_generator, batch_size, filter_keywords)
                     
-                    # 게시글 내용 수집 (1차 필터링된 게시글만)
-                    for idx, item in enumerate(filtered_by_keywords):
-                        if not self.is_running:
-                            break
-                        
-                        try:
-                            # 게시글 제목
-                            title = item["title"]
-                            
-                            # 진행상황 업데이트
-                            progress_pct = ((idx + 1) / total_items) * 40  # 내용 수집은 전체 진행의 40%
-                            self.progress_updated.emit({
-                                "status": "AI 분석을 위한 게시글 내용 수집 중",
-                                "current_page": 0,
-                                "total_items": idx + 1,
-                                "progress": int(progress_pct)
-                            })
-                            
-                            # 게시글 내용
-                            cafe_url_id = item["cafe_id"]
-                            article_id = item["article_id"]
-                            
-                            try:
-                                # URL에서 art 매개변수 추출
-                                url = item["url"]
-                                art_param = None
-                                if "art=" in url:
-                                    art_param = url.split("art=")[1].split("&")[0]
-                                
-                                # 카페 정보를 가져와서 실제 카페 ID 얻기
-                                cafe_info = cafe_api.get_cafe_info(cafe_url_id)
-                                real_cafe_id = cafe_info["id"]
-                                
-                                # 게시글 내용 가져오기 (art 매개변수 전달)
-                                content_html = cafe_api.get_board_content(real_cafe_id, article_id, art_param)
-                                content = cafe_api.get_parse_content_html(content_html) if content_html else item["content"]
-                            except (ConnectionResetError, ConnectionAbortedError, ConnectionRefusedError, ConnectionError) as e:
-                                self.log_message.emit({"message": f"네트워크 연결 오류 발생: {str(e)}. 재시도 중...", "color": "yellow"})
-                                # 잠시 대기 후 재시도
-                                time.sleep(5)  # 연결 오류 시 더 긴 대기 시간 (2초 → 5초)
-                                try:
-                                    # 재시도: 카페 정보
-                                    cafe_info = cafe_api.get_cafe_info(cafe_url_id)
-                                    real_cafe_id = cafe_info["id"]
-                                    
-                                    # 재시도: 게시글 내용 가져오기 (art 매개변수 전달)
-                                    content_html = cafe_api.get_board_content(real_cafe_id, article_id, art_param)
-                                    content = cafe_api.get_parse_content_html(content_html) if content_html else item["content"]
-                                    
-                                    self.log_message.emit({"message": "재시도 성공: 게시글 내용을 가져왔습니다.", "color": "green"})
-                                except Exception as retry_e:
-                                    self.log_message.emit({"message": f"재시도 실패 ({type(retry_e).__name__}): {str(retry_e)}. 기본 내용 사용", "color": "red"})
-                                    # 기본 내용 사용
-                                    content = item["content"]
-                            except Exception as e:
-                                error_type = type(e).__name__
-                                self.log_message.emit({"message": f"AI 분석용 게시글 내용 가져오기 실패 ({error_type}): {str(e)}. 기본 내용 사용", "color": "red"})
-                                # 기본 내용 사용
-                                content = item["content"]
-                            
-                            # 분석용 데이터 추가
-                            posts_for_analysis.append({
-                                'idx': idx,
-                                'item': item,
-                                'title': title,
-                                'content': content[:300] if len(content) > 300 else content,  # 내용을 300자로 제한
-                                'cafe_url_id': cafe_url_id
-                            })
-                            
-                            # 로그 메시지
-                            if (idx + 1) % 10 == 0 or idx + 1 == total_items:
-                                self.log_message.emit({
-                                    "message": f"AI 분석을 위한 게시글 내용 수집 중: {idx + 1}/{total_items}", 
-                                    "color": "blue"
-                                })
-                            
-                        except Exception as e:
-                            self.log_message.emit({"message": f"AI 분석을 위한 게시글 내용 수집 중 오류 발생: {str(e)}", "color": "red"})
-                            continue
+                    self._log_pool_metrics()
                     
-                    # 수집된 게시글이 있는 경우에만 배치 분석 수행
+                    # 분석된 게시글이 있는 경우에만 결과 처리
                     if posts_for_analysis and self.is_running:
-                        self.log_message.emit({
-                            "message": f"2단계: AI 배치 분석 시작 - 총 {len(posts_for_analysis)}개 게시글, 배치 크기: {batch_size}", 
-                            "color": "blue"
-                        })
-                        
-                        # 진행상황 업데이트 - AI 분석 시작 (40% 지점부터 시작)
-                        self.progress_updated.emit({
-                            "status": "AI 분석 중",
-                            "current_page": 0,
-                            "total_items": len(posts_for_analysis),
-                            "progress": 40
-                        })
-                        
-                        # 배치 분석용 데이터 준비 - 이미 짧게 자른 내용 사용
-                        batch_posts = [{'title': p['title'], 'content': p['content']} for p in posts_for_analysis]
-                        
                         # 디버깅용 로그
-                        self.log_message.emit({
-                            "message": f"AI 분석 시작: 배치 크기={batch_size}, 분석할 게시글 수={len(batch_posts)}, AI 명령어='{ai_filter_command}'", 
-                            "color": "blue"
-                        })
-                        
-                        # 배치 분석 수행
-                        analysis_results = ai_generator.analyze_posts_batch(
-                            batch_posts, 
-                            ai_filter_command, 
-                            batch_size,
-                            progress_callback=self.update_batch_progress
-                        )
-                        
-                        # 디버깅용 로그
-                        self.log_message.emit({
+                        self.log_buffer.push({
                             "message": f"AI 분석 결과 받음: 총 {len(analysis_results)}개 결과", 
                             "color": "blue"
                         })
                         
                         # 3단계: 분석 결과에 따라 게시글 수집
-                        self.log_message.emit({
+                        self.log_buffer.push({
                             "message": f"3단계: 분석 결과 처리 - AI 분석 완료, 결과 수집 중", 
                             "color": "blue"
                         })
                         
                         # 진행상황 업데이트 - 결과 처리 시작 (80% 지점부터 시작)
-                        self.progress_updated.emit({
+                        self.progress.update({
                             "status": "분석 결과 처리 중",
                             "current_page": 0,
                             "total_items": len(analysis_results),
                             "progress": 80
-                        })
+                        }, force=True)
                         
                         # 분석 결과에 따라 게시글 수집
                         filtered_items = []
@@ -423,7 +569,7 @@ class Worker(QThread):
                             
                             # 진행상황 업데이트
                             progress_pct = 80 + ((i + 1) / len(analysis_results)) * 20  # 결과 처리는 80-100%
-                            self.progress_updated.emit({
+                            self.progress.update({
                                 "status": "분석 결과 저장 중",
                                 "current_page": 0,
                                 "total_items": i + 1,
@@ -432,21 +578,22 @@ class Worker(QThread):
                             
                             # 분석 결과가 참인 경우만 수집
                             if is_relevant:
-                                self.log_message.emit({"message": f"✅ 일치 게시글 발견: {title}", "color": "green"})
+                                self.log_buffer.push({"message": f"✅ 일치 게시글 발견: {title}", "color": "green"})
                                 
                                 # 필터링된 게시글 목록에 추가
                                 filtered_items.append(post_data['item'])
                                 
                                 # 중복 확인을 위해 수집된 제목 및 아이디+내용 조합 저장
-                                self.collected_titles.append(title)
+                                self.collected_titles.add(title)
                                 self.collected_ids_content_pairs.add((post_data['cafe_url_id'], title))
                                 
                                 # 게시글 발견 시그널 발생
-                                self.post_found.emit({
+                                self.post_buffer.push({
                                     "no": self.post_count + 1,
                                     "id": post_data['cafe_url_id'],
                                     "content": title,
-                                    "url": post_data['item']["url"] if post_data['item']["url"].startswith(("http://", "https://")) else "https://" + post_data['item']["url"]
+                                    "url": post_data['item']["url"] if post_data['item']["url"].startswith(("http://", "https://")) else "https://" + post_data['item']["url"],
+                                    "tags": ", ".join(post_data['item'].get("ai_tags", []))  # 여러 명령어 분석 시 일치한 명령어
                                 })
                                 
                                 self.post_count += 1
@@ -454,38 +601,38 @@ class Worker(QThread):
                             else:
                                 # 일치하지 않는 경우는 간단히 로깅만
                                 if (i + 1) % 10 == 0 or i + 1 == len(analysis_results):
-                                    self.log_message.emit({
+                                    self.log_buffer.push({
                                         "message": f"AI 분석 결과 처리 중: {i + 1}/{len(analysis_results)}", 
                                         "color": "gray"
                                     })
                         
-                        # 필터링된 결과 업데이트
-                        search_results["items"] = filtered_items
-                        search_results["total_count"] = len(filtered_items)
+                        # 필터링된 결과 업데이트 (미리보기로 일치한 게시글 포함)
+                        search_results["items"] = triage_accepted + filtered_items
+                        search_results["total_count"] = len(search_results["items"])
                         
-                        self.log_message.emit({
-                            "message": f"AI 분석 완료: 총 {len(posts_for_analysis)}개 중 {matched_count}개의 게시글이 조건과 일치합니다.", 
+                        self.log_buffer.push({
+                            "message": f"AI 분석 완료: 본문 분석 {len(posts_for_analysis)}개 중 {matched_count}개, 미리보기 {len(triage_accepted)}개의 게시글이 조건과 일치합니다.", 
                             "color": "green"
                         })
                         
                         # 진행상황 업데이트 - 모든 과정 완료 (100%)
-                        self.progress_updated.emit({
+                        self.progress.update({
                             "status": "분석 완료",
                             "current_page": 0,
                             "total_items": matched_count,
                             "progress": 100
-                        })
+                        }, force=True)
             
             elif ai_filter_command and len(search_results["items"]) == 0:
                 # AI 명령어는 있지만 분석할 게시글이 없는 경우 (모두 키워드 필터로 처리됨)
-                self.log_message.emit({
+                self.log_buffer.push({
                     "message": "AI 분석 대상 게시글이 없습니다. 모든 게시글이 필터 키워드로 이미 처리되었습니다.",
                     "color": "yellow"
                 })
             
             elif not ai_filter_command:
                 # AI 필터 명령어가 없는 경우 - 1차 필터링된 게시글 직접 수집
-                self.log_message.emit({
+                self.log_buffer.push({
                     "message": "AI 분석 필터가 설정되지 않았습니다. 1차 필터링된 게시글을 직접 수집합니다.", 
                     "color": "yellow"
                 })
@@ -503,14 +650,14 @@ class Worker(QThread):
                         is_duplicate = False
                         
                         # 제목 중복 확인
-                        if title in self.collected_titles or title in existing_titles:
-                            self.log_message.emit({"message": f"⚠️ 중복 게시글(제목) 건너뜀: {title}", "color": "yellow"})
+                        if title in self.collected_titles or self.dedup_index.has_title(title):
+                            self.log_buffer.push({"message": f"⚠️ 중복 게시글(제목) 건너뜀: {title}", "color": "yellow"})
                             is_duplicate = True
                         
                         # 아이디+내용 조합 중복 확인
                         id_content_pair = (item["cafe_id"], title)
-                        if id_content_pair in self.collected_ids_content_pairs or id_content_pair in existing_id_content_pairs:
-                            self.log_message.emit({"message": f"⚠️ 중복 게시글(아이디+내용) 건너뜀: {title}", "color": "yellow"})
+                        if id_content_pair in self.collected_ids_content_pairs or self.dedup_index.has_pair(*id_content_pair):
+                            self.log_buffer.push({"message": f"⚠️ 중복 게시글(아이디+내용) 건너뜀: {title}", "color": "yellow"})
                             is_duplicate = True
                         
                         # 중복인 경우 다음 게시글로
@@ -518,7 +665,7 @@ class Worker(QThread):
                             continue
                             
                         # 게시글 발견 시그널 발생
-                        self.post_found.emit({
+                        self.post_buffer.push({
                             "no": self.post_count + 1,
                             "id": item["cafe_id"],
                             "content": title,
@@ -526,36 +673,517 @@ class Worker(QThread):
                         })
                         
                         # 중복 확인을 위해 수집된 제목 및 아이디+내용 조합 저장
-                        self.collected_titles.append(title)
+                        self.collected_titles.add(title)
                         self.collected_ids_content_pairs.add((item["cafe_id"], title))
                         
                         self.post_count += 1
                         
-                        # 작업 간 딜레이
-                        time.sleep(0.1)
-                        
                     except Exception as e:
-                        self.log_message.emit({"message": f"게시글 처리 중 오류 발생: {str(e)}", "color": "red"})
+                        self.log_buffer.push({"message": f"게시글 처리 중 오류 발생: {str(e)}", "color": "red"})
                         continue
             
             # 05. 수집된 정보를 모니터에 넣는다. (시그널로 전달)
-            self.log_message.emit({"message": f"작업이 완료되었습니다. 총 {self.post_count}개의 게시글이 수집되었습니다.", "color": "green"})
-            
-            # 작업 완료 시그널 발생
-            self.tasks_completed.emit(True)
+            complete_keywords = {keyword for keyword, result in per_query.items() if result.get("complete")}
+            self._finish_run(watermark_store, watermark_keys, searched_items, complete_keywords,
+                             board_store, board_watermarks)
             
         except Exception as e:
-            self.log_message.emit({"message": f"작업 실행 중 오류 발생: {str(e)}", "color": "red"})
-            self.log_message.emit({"message": traceback.format_exc(), "color": "red"})
+            self.log_buffer.push({"message": f"작업 실행 중 오류 발생: {str(e)}", "color": "red"})
+            self.log_buffer.push({"message": traceback.format_exc(), "color": "red"})
+            self._flush_signals()
             self.tasks_completed.emit(False)  # 작업 실패 시그널 발생
         finally:
             self.is_running = False
             # 진행상황 초기화
-            self.progress_updated.emit({
+            self.progress.update({
                 "status": "대기 중",
                 "current_page": 0,
                 "total_items": 0,
                 "progress": 0
+            }, force=True)
+            self._flush_signals()
+
+    def _finish_run(self, watermark_store, watermark_keys, searched_items, complete_keywords=(),
+                    board_store=None, board_watermarks=None):
+        """작업 완료 처리 (증분 수집 기준점 갱신 후 완료 시그널 발생)
+
+        Args:
+            complete_keywords (set): 이전 기준점에 도달했거나 검색 결과가 끝날 때까지 읽은 검색어.
+                목표 개수나 max_items 에서 멈춘 검색어는 기준점을 옮기면 사이의 게시글을 놓치므로 이전 기준점을 유지한다.
+                (기준점이 없던 검색어는 읽은 곳까지를 첫 기준점으로 저장)
+        """
+        self.log_buffer.push({"message": f"작업이 완료되었습니다. 총 {self.post_count}개의 게시글이 수집되었습니다.", "color": "green"})
+        
+        # AI 토큰 사용량 (프롬프트 캐시로 처리된 입력 토큰 포함)
+        if self.ai_generator and self.ai_generator.usage['requests']:
+            usage = self.ai_generator.usage_summary()
+            self.log_buffer.push({
+                "message": (f"AI 토큰 사용: 요청 {usage['requests']}건, 입력 {usage['prompt_tokens']:,} "
+                            f"(캐시 {usage['cached_tokens']:,}, {usage['cached_ratio'] * 100:.0f}%), 출력 {usage['completion_tokens']:,}"),
+                "color": "gray"
+            })
+        
+        # 증분 수집 기준점 갱신 (중지되지 않고 끝까지 처리한 경우에만)
+        if watermark_store and self.is_running:
+            for keyword, watermark_key in watermark_keys.items():
+                if keyword not in complete_keywords and (watermark_store.get(watermark_key)
+                                                        or watermark_store.find_legacy(keyword, self.options)):
+                    self.log_buffer.push({
+                        "message": f"증분 수집 '{keyword}': 이전 기준점까지 읽지 못해 기준점을 유지합니다. (다음 실행에서 다시 확인)",
+                        "color": "yellow"
+                    })
+                    continue
+                watermark_store.advance(watermark_key, searched_items.get(keyword, []),
+                                        lambda item: parse_post_date(item.get('post_date', ''))[0])
+        if board_store and self.is_running:
+            board_store.update(board_watermarks)
+        
+        # 재분석용 실행 결과 저장 (중지된 경우에도 가져온 만큼 저장)
+        if self.run_items and self.options.get("save_run", True):
+            self._save_run()
+        
+        # 작업 완료 시그널 발생
+        self._flush_signals()
+        self.tasks_completed.emit(True)
+
+    def _save_run(self):
+        """검색 결과와 가져온 본문을 RunStore 에 저장"""
+        run_id = RunStore.new_run_id()
+        meta = {
+            'keywords': self.get_search_keywords(),
+            'source': self.options.get("source", "search"),
+            'cafe_where': self.options.get("cafe_where", "articleg"),
+            'sort': self.options.get("sort", "rel"),
+            'date_option': self.options.get("date_option", 2),
+            'filter_keywords': self.options.get("filter_keywords", []),
+            'ai_filter_command': " | ".join(self.get_ai_commands()),
+        }
+        meta = RunStore().save(run_id, meta, self.run_items, dict(self.fetched_contents))
+        self.log_buffer.push({
+            "message": f"실행 결과를 저장했습니다: {run_id} (게시글 {meta['item_count']}개, 본문 {meta['content_count']}개)",
+            "color": "gray"
+        })
+
+    def _is_duplicate(self, item):
+        """이미 수집한 게시글인지 확인 (제목 또는 아이디+제목 조합)"""
+        title = item["title"].strip()
+        return (title in self.collected_titles or self.dedup_index.has_title(title)
+                or (item["cafe_id"], title) in self.collected_ids_content_pairs
+                or self.dedup_index.has_pair(item["cafe_id"], title))
+
+    def _emit_post(self, item):
+        """게시글 발견 시그널 발생 및 중복 체크용 정보 저장"""
+        title = item["title"]
+        self.post_buffer.push({
+            "no": self.post_count + 1,
+            "id": item["cafe_id"],
+            "content": title,
+            "url": item["url"] if item["url"].startswith(("http://", "https://")) else "https://" + item["url"],
+            "tags": ", ".join(item.get("ai_tags", []))
+        })
+        self.collected_titles.add(title)
+        self.collected_ids_content_pairs.add((item["cafe_id"], title))
+        self.post_count += 1
+
+    def _produce_pages(self, keywords, search_kwargs, watermarks, page_queue, stop_event):
+        """검색 페이지를 가져와 page_queue 에 넣는 생산자 (별도 스레드)
+
+        큐가 가득 차면 소비자가 분석하는 동안 기다리므로 미리 가져오는 페이지 수는 큐 크기로 제한된다.
+        검색어의 결과가 끝나거나 이전 기준점에 도달하면 (검색어, None), 모두 끝나면 None,
+        오류가 나면 (검색어, 예외)를 넣는다. 최대 시작 위치에 막힌 검색어는 'truncated' 페이지만 넣고
+        (검색어, None)은 넣지 않는다.
+        """
+        def put(entry):
+            while not stop_event.is_set():
+                try:
+                    page_queue.put(entry, timeout=0.2)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for keyword in keywords:
+                if stop_event.is_set():
+                    return
+                pages = self.search_api.iter_pages(keyword, watermark=watermarks.get(keyword), **search_kwargs)
+                truncated = False
+                try:
+                    for page in pages:
+                        truncated = truncated or page['truncated']
+                        if not put((keyword, page)):
+                            return
+                finally:
+                    pages.close()
+                if self.search_api.is_running and not truncated and not put((keyword, None)):
+                    return
+        except Exception as e:
+            put((keyword, e))
+        finally:
+            put(None)
+
+    def _use_triage(self):
+        """스니펫 분류 사용 여부 (명령어별 태그가 필요한 여러 명령어 분석에서는 사용하지 않음)"""
+        return self.options.get("snippet_triage", True) and len(self.get_ai_commands()) == 1
+
+    def _triage(self, items, ai_generator):
+        """제목/미리보기만으로 게시글을 1차 분류
+
+        Returns:
+            tuple: (미리보기만으로 일치한 게시글 목록, 본문 확인이 필요한 게시글 목록)
+        """
+        verdicts = ai_generator.triage_posts_batch(
+            [{'title': item["title"], 'content': item.get("content", "")} for item in items],
+            self.get_ai_commands()[0]
+        )
+        accepted = [item for item, verdict in zip(items, verdicts) if verdict == AIGenerator.TRIAGE_YES]
+        ambiguous = [item for item, verdict in zip(items, verdicts) if verdict == AIGenerator.TRIAGE_UNSURE]
+        self.log_buffer.push({
+            "message": (f"미리보기 분류: 일치 {len(accepted)}개, 불일치 {len(items) - len(accepted) - len(ambiguous)}개, "
+                        f"본문 확인 {len(ambiguous)}개 (본문 요청 {len(items) - len(ambiguous)}건 생략)"),
+            "color": "blue"
+        })
+        return accepted, ambiguous
+
+    def _analyze_batch(self, ai_generator, batch_posts, batch_size):
+        """게시글 배치 AI 분석
+
+        명령어가 여러 개면 한 번의 요청으로 명령어별 판정을 받고, 게시글의 ai_tags 에 일치한 명령어를 기록한다.
+
+        Returns:
+            list: 게시글별 일치한 명령어 목록 (빈 목록이면 불일치)
+        """
+        commands = self.get_ai_commands()
+        posts = [{'title': post['title'], 'content': post['content']} for post in batch_posts]
+        if len(commands) == 1:
+            results = ai_generator.analyze_posts_batch(posts, commands[0], batch_size, content_limit=None)
+            return [commands[:1] if is_relevant else [] for is_relevant in results]
+
+        vectors = ai_generator.analyze_posts_multi(posts, commands, batch_size, content_limit=None)
+        matched = [[command for command, verdict in zip(commands, vector) if verdict] for vector in vectors]
+        for post, tags in zip(batch_posts, matched):
+            post['item']['ai_tags'] = tags
+        return matched
+
+    def _classify(self, items, ai_generator):
+        """게시글 본문을 가져와 AI로 분석하고 조건에 맞는 게시글만 반환
+
+        스니펫 분류를 사용하면 미리보기만으로 일치한 게시글은 본문 없이 통과시키고 애매한 게시글만 본문을 가져온다.
+        """
+        accepted = []
+        if self._use_triage():
+            accepted, items = self._triage(items, ai_generator)
+        if not items:
+            return accepted
+        contents = self._fetch_contents(items)
+        analyzed = [(item, contents[idx]) for idx, item in enumerate(items) if idx in contents]
+        if not analyzed or not self.is_running:
+            return accepted
+        batch_posts = [{'item': item, 'title': item["title"], 'content': self._prompt_content(content)}
+                       for item, content in analyzed]
+        results = self._analyze_batch(ai_generator, batch_posts, batch_size=20)
+        return accepted + [item for (item, _), is_relevant in zip(analyzed, results) if is_relevant]
+
+    def _run_until_target(self, keywords, search_kwargs, watermarks, ai_generator, target_matches, max_items):
+        """목표 일치 개수 모드 실행
+
+        검색 페이지는 별도 스레드에서 미리 가져오고, 페이지마다 필터 키워드 → 본문 수집 → AI 분석을 거쳐
+        조건에 맞는 게시글을 바로 모니터에 보낸다. 목표 개수를 채우거나 검색 결과 원본이 max_items 를 넘으면
+        남은 페이지 요청과 대기 중인 본문 요청을 취소한다.
+
+        Returns:
+            tuple: ({검색어: 처리한 검색 결과 목록}, 이전 기준점에 도달했거나 결과가 끝날 때까지 모두 처리한 검색어 집합)
+        """
+        filter_keywords = [k.strip() for k in self.options.get("filter_keywords", []) if k.strip()]
+        ai_filter_command = " | ".join(self.get_ai_commands())
+        self.log_buffer.push({
+            "message": f"목표 일치 개수 모드: {target_matches}개를 찾을 때까지 검색합니다. (검색 결과 상한 {max_items}개)",
+            "color": "blue"
+        })
+
+        page_queue = queue.Queue(maxsize=2)  # 분석하는 동안 미리 가져올 검색 페이지 수
+        stop_event = threading.Event()
+        producer = threading.Thread(target=self._produce_pages,
+                                    args=(keywords, search_kwargs, watermarks, page_queue, stop_event),
+                                    daemon=True)
+        producer.start()
+
+        searched_items = {keyword: [] for keyword in keywords}
+        complete_keywords = set()
+        seen = set()  # 이번 실행에서 이미 분석한 게시글 (여러 검색어에 걸린 게시글은 한 번만 분석)
+        raw_count = 0
+        matched = 0
+        try:
+            while self.is_running and matched < target_matches:
+                entry = page_queue.get()
+                if entry is None:
+                    self.log_buffer.push({"message": "더 이상 검색 결과가 없습니다.", "color": "yellow"})
+                    break
+                keyword, page = entry
+                if page is None:
+                    # 이 검색어는 기준점 또는 마지막 결과까지 모두 처리함 (증분 수집 기준점을 옮겨도 됨)
+                    complete_keywords.add(keyword)
+                    continue
+                if isinstance(page, Exception):
+                    self.log_buffer.push({"message": f"'{keyword}' 검색 중 오류 발생: {str(page)}", "color": "red"})
+                    break
+                if page['truncated']:
+                    self.log_buffer.push({
+                        "message": f"'{keyword}': 검색 결과를 더 요청할 수 없는 위치까지 읽어 수집을 멈췄습니다. (증분 수집 기준점은 옮기지 않음)",
+                        "color": "yellow"
+                    })
+                    continue
+
+                raw_count += page['raw_count']
+                searched_items[keyword].extend(page['items'])
+
+                candidates = []
+                for item in page['items']:
+                    key = NaverCafeSearchAPI.item_key(item)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    text = item["title"] + " " + item["content"]
+                    if filter_keywords and not any(word in text for word in filter_keywords):
+                        continue
+                    if self._is_duplicate(item):
+                        continue
+                    candidates.append(item)
+
+                if candidates and ai_filter_command and self.is_running:
+                    candidates = self._classify(candidates, ai_generator)
+
+                for item in candidates[:target_matches - matched]:
+                    self.log_buffer.push({"message": f"✅ 일치 게시글 발견: {item['title']}", "color": "green"})
+                    self._emit_post(item)
+                    matched += 1
+
+                self.log_buffer.push({
+                    "message": f"'{keyword}' {page['page']}페이지: 일치 {matched}/{target_matches}개 (검색 결과 {raw_count}개 확인)",
+                    "color": "blue"
+                })
+                self.progress.update({
+                    "status": "목표 일치 개수 수집 중",
+                    "current_page": page['page'],
+                    "total_items": matched,
+                    "progress": int(matched / target_matches * 100)
+                })
+
+                if raw_count >= max_items and matched < target_matches:
+                    self.log_buffer.push({
+                        "message": f"검색 결과 상한({max_items}개)에 도달하여 목표 개수를 채우지 못하고 종료합니다.",
+                        "color": "yellow"
+                    })
+                    break
+        finally:
+            # 남은 페이지 요청 중단 (생산자 스레드는 현재 요청이 끝나면 종료)
+            stop_event.set()
+            self.search_api.stop_search()
+            producer.join(timeout=1)
+
+        if matched >= target_matches:
+            self.log_buffer.push({"message": f"목표 일치 개수 {target_matches}개를 채워 검색을 마칩니다.", "color": "green"})
+        return searched_items, complete_keywords
+
+    def _fetch_content(self, item):
+        """게시글 본문 텍스트 가져오기 (실패 시 검색 결과의 미리보기 내용 사용)"""
+        # URL에서 art 매개변수 추출
+        url = item["url"]
+        art_param = None
+        if "art=" in url:
+            art_param = url.split("art=")[1].split("&")[0]
+        # 게시판 직접 수집한 게시글은 숫자 카페 ID(club_id)로 요청
+        cafe_id = item.get("club_id") or item["cafe_id"]
+            
+        try:
+            content_html = self.session_pool.fetch_board_content(cafe_id, item["article_id"], art_param)
+        except (ConnectionResetError, ConnectionAbortedError, ConnectionRefusedError, ConnectionError) as e:
+            self.log_buffer.push({"message": f"네트워크 연결 오류 발생: {str(e)}. 재시도 중...", "color": "yellow"})
+            time.sleep(5)  # 연결 오류 시 잠시 대기 후 재시도
+            try:
+                content_html = self.session_pool.fetch_board_content(cafe_id, item["article_id"], art_param)
+                self.log_buffer.push({"message": "재시도 성공: 게시글 내용을 가져왔습니다.", "color": "green"})
+            except Exception as retry_e:
+                self.log_buffer.push({"message": f"재시도 실패 ({type(retry_e).__name__}): {str(retry_e)}. 기본 내용 사용", "color": "red"})
+                return item["content"]
+        except Exception as e:
+            self.log_buffer.push({"message": f"AI 분석용 게시글 내용 가져오기 실패 ({type(e).__name__}): {str(e)}. 기본 내용 사용", "color": "red"})
+            return item["content"]
+            
+        if not content_html:
+            return item["content"]
+        content = self.cafe_api.get_parse_content_html(content_html)
+        self.fetched_contents[RunStore.content_key(item)] = content  # 재분석용
+        return content
+
+    def _crawl_boards(self, cafes):
+        """선택한 카페들의 게시판 직접 수집
+
+        Returns:
+            tuple: (BoardWatermarkStore 또는 None (증분 수집을 쓰지 않는 경우), BoardCrawler.crawl 결과)
+        """
+        board_store = BoardWatermarkStore() if self.options.get("incremental") else None
+        watermarks = board_store.get_all() if board_store else {}
+        max_pages = self.options.get("board_max_pages", 10)
+        self.log_buffer.push({
+            "message": (f"카페 {len(cafes)}개의 게시판을 직접 수집합니다. "
+                        f"({'이전 기준점까지 새 글만, 기준점이 없는 게시판은 ' if board_store else ''}"
+                        f"게시판당 최대 {max_pages}페이지)"),
+            "color": "blue"
+        })
+        self._flush_signals()
+
+        self.board_crawler = BoardCrawler(self.headers)
+        results = self.board_crawler.crawl(
+            cafes, watermarks=watermarks, max_pages=max_pages,
+            progress_callback=lambda done, total_items, is_crawling: self.progress.update({
+                "status": "게시판 수집 중" if is_crawling else "게시판 수집 완료",
+                "current_page": done,
+                "total_items": total_items,
+                "progress": int(done / len(cafes) * 100)
+            }, force=not is_crawling)
+        )
+        for board in results.get("boards", []):
+            if board['count']:
+                self.log_buffer.push({
+                    "message": f"  {board['cafe_name']} > {board['board_name']}: {board['count']}개 ({board['pages']}페이지)",
+                    "color": "white"
+                })
+            if board['failed']:
+                self.log_buffer.push({
+                    "message": f"  {board['cafe_name']} > {board['board_name']}: {board['pages']}페이지 요청 실패 (기준점 유지)",
+                    "color": "yellow"
+                })
+            elif board_store and board['kept_watermark']:
+                self.log_buffer.push({
+                    "message": f"  {board['cafe_name']} > {board['board_name']}: 이전 기준점에 도달하기 전에 중지되어 기준점을 유지합니다.",
+                    "color": "yellow"
+                })
+        return board_store, results
+
+    def _prompt_content(self, content):
+        """AI 분석에 넣을 본문 (압축기를 쓰지 않으면 앞 300자)"""
+        if self.compressor is None:
+            return content[:300]
+        return self.compressor.compress(content)
+
+    def _content_priority(self, item, filter_keywords):
+        """본문 선행 수집 우선순위 (필터 키워드가 많이 일치하고 최근에 작성된 게시글일수록 먼저)"""
+        title = item["title"]
+        snippet = item.get("content", "")
+        score = sum(2 * title.count(keyword) + snippet.count(keyword) for keyword in filter_keywords if keyword)
+        posted = parse_post_date(item.get("post_date", ""))[0]
+        return (-score, -posted.timestamp() if posted else 0)
+
+    def _analyze_with_prefetch(self, items, ai_generator, batch_size, filter_keywords):
+        """게시글 본문을 미리 가져오면서 배치 단위로 AI 분석
+
+        우선순위 순으로 배치를 나누고, AI가 한 배치를 분석하는 동안 Prefetcher가 다음 배치 본문을 가져온다.
+        미리 가져오는 본문은 배치 2개 분량으로 제한한다.
+
+        Returns:
+            tuple: (분석한 게시글 목록 [{'item', 'title', 'content', 'cafe_url_id'}], 게시글별 일치한 명령어 목록)
+        """
+        filter_keywords = [keyword.strip() for keyword in filter_keywords]
+        order = sorted(range(len(items)), key=lambda idx: self._content_priority(items[idx], filter_keywords))
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+        posts_for_analysis = []
+        analysis_results = []
+
+        prefetcher = Prefetcher(self._fetch_content, max_workers=self.session_pool.max_concurrency(),
+                                lookahead=batch_size * 2)
+        try:
+            for rank, idx in enumerate(order):
+                prefetcher.submit(idx, items[idx], priority=rank)
+
+            for batch_index, batch in enumerate(batches, start=1):
+                if not self.is_running:
+                    break
+                batch_posts = []
+                for idx in batch:
+                    try:
+                        content = prefetcher.get(idx)
+                    except Exception as e:
+                        self.log_buffer.push({"message": f"AI 분석을 위한 게시글 내용 수집 중 오류 발생: {str(e)}", "color": "red"})
+                        continue
+                    batch_posts.append({
+                        'item': items[idx],
+                        'title': items[idx]["title"],
+                        'content': self._prompt_content(content),
+                        'cafe_url_id': items[idx]["cafe_id"]
+                    })
+                if not batch_posts or not self.is_running:
+                    continue
+
+                self.update_batch_progress(batch_index, len(batches), True)
+                results = self._analyze_batch(ai_generator, batch_posts, batch_size)
+                posts_for_analysis.extend(batch_posts)
+                analysis_results.extend(results)
+                self.update_batch_progress(batch_index, len(batches), False)
+                self.log_buffer.push({
+                    "message": f"AI 배치 분석 {batch_index}/{len(batches)} 완료 (게시글 {len(posts_for_analysis)}/{len(items)}개)",
+                    "color": "blue"
+                })
+        finally:
+            prefetcher.close()
+
+        stats = prefetcher.stats
+        self.log_buffer.push({
+            "message": f"본문 선행 수집: 미리 준비됨 {stats['ready']}개, 대기 {stats['waited']}개, 직접 요청 {stats['inline']}개",
+            "color": "gray"
+        })
+        return posts_for_analysis, analysis_results
+
+    def _fetch_contents(self, items):
+        """여러 게시글 본문을 세션 풀로 동시에 가져오기
+
+        Returns:
+            dict: {items의 인덱스: 본문 텍스트} (중지된 경우 일부만 포함)
+        """
+        contents = {}
+        total_items = len(items)
+        if total_items == 0:
+            return contents
+            
+        with ThreadPoolExecutor(max_workers=self.session_pool.max_concurrency()) as executor:
+            futures = {executor.submit(self._fetch_content, item): idx
+                       for idx, item in enumerate(items)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                try:
+                    contents[idx] = future.result()
+                except Exception as e:
+                    self.log_buffer.push({"message": f"AI 분석을 위한 게시글 내용 수집 중 오류 발생: {str(e)}", "color": "red"})
+                    
+                # 진행상황 업데이트 (내용 수집은 전체 진행의 40%)
+                self.progress.update({
+                    "status": "AI 분석을 위한 게시글 내용 수집 중",
+                    "current_page": 0,
+                    "total_items": done,
+                    "progress": int(done / total_items * 40)
+                })
+                if done % 10 == 0 or done == total_items:
+                    self.log_buffer.push({
+                        "message": f"AI 분석을 위한 게시글 내용 수집 중: {done}/{total_items}", 
+                        "color": "blue"
+                    })
+                    
+                if not self.is_running:
+                    # 아직 시작하지 않은 요청은 취소
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return contents
+
+    def _log_pool_metrics(self):
+        """세션 풀 계정별 처리량 로그"""
+        for metrics in self.session_pool.metrics():
+            state = "사용 중" if metrics['healthy'] else "제외됨"
+            self.log_buffer.push({
+                "message": (f"계정 {metrics['account_id']} ({state}): 요청 {metrics['requests']}건, "
+                            f"성공 {metrics['successes']}건, 실패 {metrics['failures']}건, "
+                            f"{metrics['throughput']}건/초, 평균 응답 {metrics['avg_latency']}초"),
+                "color": "gray" if metrics['healthy'] else "orange"
             })
 
     def update_search_progress(self, current_page, total_items, is_searching):
@@ -570,14 +1198,15 @@ class Worker(QThread):
             return
             
         status = "검색 중" if is_searching else "검색 완료"
-        progress = min(int((total_items / self.options.get("max_items", 100)) * 100), 100)
+        max_items = self.options.get("max_items", 100) * max(1, len(self.get_search_keywords()))  # 검색어별 수집 개수
+        progress = min(int((total_items / max_items) * 100), 100)
         
-        self.progress_updated.emit({
+        self.progress.update({
             "status": status,
             "current_page": current_page,
             "total_items": total_items,
             "progress": progress
-        })
+        }, force=not is_searching)
         
     def update_batch_progress(self, batch_index, batch_count, is_processing):
         """배치 분석 진행상황 업데이트 콜백
@@ -595,12 +1224,190 @@ class Worker(QThread):
         progress = 40 + batch_progress
         
         status_text = f"AI 분석 중 ({batch_index}/{batch_count} 배치)"
-        if not is_processing and batch_index == batch_count:
+        is_last = not is_processing and batch_index == batch_count
+        if is_last:
             status_text = "AI 분석 완료"
             
-        self.progress_updated.emit({
+        self.progress.update({
             "status": status_text,
             "current_page": batch_index,
             "total_items": batch_count,
             "progress": int(progress)
-        })
\ No newline at end of file
+        }, force=is_last)
+
+class ReanalysisWorker(Worker):
+    """저장된 실행 결과 재분석
+
+    RunStore 에 저장된 검색 결과와 본문으로 필터 키워드와 AI 분석만 다시 적용한다. 네이버에는 요청하지 않으므로
+    로그인 계정이 필요 없다. 같은 모델/지시문/명령어/내용의 판정은 VerdictCache 에서 가져오고, 나머지는 배치를 동시에 분석한다.
+    """
+
+    def __init__(self, run_id, api_key=None, options=None, dedup_index=None, run_store=None, verdict_cache=None,
+                 max_workers=4):
+        """
+        Args:
+            run_id (str): 재분석할 실행 ID
+            api_key (str): OpenAI API 키 (AI 분석 명령어가 있을 때만 필요)
+            options (dict): filter_keywords, ai_filter_command(s), content_token_budget 만 사용 (Worker 와 같은 의미)
+            dedup_index (DedupIndex): 이미 수집된 게시글 중복 체크 인덱스
+            run_store (RunStore, optional): 실행 결과 저장소
+            verdict_cache (VerdictCache, optional): AI 판정 캐시
+            max_workers (int): 동시에 보낼 AI 배치 요청 수
+        """
+        super().__init__(api_key=api_key, options=options, dedup_index=dedup_index)
+        self.run_id = run_id
+        self.run_store = run_store or RunStore()
+        self.verdict_cache = verdict_cache
+        self.max_workers = max_workers
+
+    def run(self):
+        """재분석 실행"""
+        try:
+            self.is_running = True
+            run = self.run_store.load(self.run_id)
+            if run is None:
+                self.log_buffer.push({"message": f"저장된 실행 결과를 찾을 수 없습니다: {self.run_id}", "color": "red"})
+                self._flush_signals()
+                self.tasks_completed.emit(False)
+                return
+
+            items = run.get('items', [])
+            contents = run.get('contents', {})
+            self.log_buffer.push({
+                "message": f"저장된 실행 {self.run_id} 재분석: 게시글 {len(items)}개 (본문 {len(contents)}개, 네이버 요청 없음)",
+                "color": "blue"
+            })
+
+            # 키워드 필터 (실행할 때와 같이 제목/미리보기 기준) 및 중복 제외
+            filter_keywords = [k.strip() for k in self.options.get("filter_keywords", []) if k.strip()]
+            candidates = []
+            for item in items:
+                text = item["title"] + " " + item.get("content", "")
+                if filter_keywords and not any(keyword in text for keyword in filter_keywords):
+                    continue
+                if self._is_duplicate(item):
+                    continue
+                candidates.append(item)
+            self.log_buffer.push({
+                "message": f"필터 키워드: {', '.join(filter_keywords) or '없음'} → 후보 {len(candidates)}개",
+                "color": "blue"
+            })
+
+            commands = self.get_ai_commands()
+            if commands and candidates:
+                candidates = self._reclassify(candidates, contents, commands)
+
+            if self.is_running:
+                for item in candidates:
+                    self._emit_post(item)
+            self._finish_reanalysis()
+
+        except Exception as e:
+            self.log_buffer.push({"message": f"재분석 중 오류 발생: {str(e)}", "color": "red"})
+            self.log_buffer.push({"message": traceback.format_exc(), "color": "red"})
+            self._flush_signals()
+            self.tasks_completed.emit(False)
+        finally:
+            self.is_running = False
+            self.progress.update({
+                "status": "대기 중",
+                "current_page": 0,
+                "total_items": 0,
+                "progress": 0
+            }, force=True)
+            self._flush_signals()
+
+    def _reclassify(self, items, contents, commands):
+        """캐시에 없는 판정만 AI 배치로 동시에 분석하고 일치한 게시글 반환"""
+        if not self.api_key:
+            raise ValueError("AI 분석 명령어가 있지만 OpenAI API 키가 설정되지 않았습니다.")
+        self.ai_generator = AIGenerator(api_key=self.api_key)
+        if self.verdict_cache is None:
+            self.verdict_cache = VerdictCache()
+        token_budget = self.options.get("content_token_budget", 150)
+        if token_budget > 0:
+            self.compressor = PromptCompressor(self.options.get("filter_keywords", []), " ".join(commands), token_budget)
+
+        # 모델이나 system 메시지(지시문, 단일/여러 명령어)가 바뀌면 이전 판정을 쓰지 않음
+        prompt_id = VerdictCache.prompt_id(AIGenerator.FILTER_MODEL, AIGenerator.batch_system_prompt(commands))
+        posts = []
+        verdicts = []  # 게시글별 {명령어: 판정}
+        pending = []   # 캐시에 없는 판정이 있는 게시글
+        for item in items:
+            content = contents.get(RunStore.content_key(item)) or item.get("content", "")
+            post = {'item': item, 'title': item["title"], 'content': self._prompt_content(content)}
+            keys = {command: VerdictCache.make_key(prompt_id, command, post['title'], post['content'])
+                    for command in commands}
+            cached = {command: self.verdict_cache.get(key) for command, key in keys.items()}
+            post['keys'] = keys
+            posts.append(post)
+            verdicts.append(cached)
+            if any(verdict is None for verdict in cached.values()):
+                pending.append(len(posts) - 1)
+        self.log_buffer.push({
+            "message": f"판정 캐시: {len(items) - len(pending)}개 게시글은 캐시로 처리, {len(pending)}개 게시글 AI 분석",
+            "color": "blue"
+        })
+
+        batch_size = 20
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._analyze_uncached, [posts[idx] for idx in batch], batch_size): batch
+                       for batch in batches}
+            for done, future in enumerate(as_completed(futures), start=1):
+                batch = futures[future]
+                try:
+                    results, failed = future.result()
+                except Exception as e:
+                    self.log_buffer.push({"message": f"AI 배치 분석 중 오류 발생: {str(e)}", "color": "red"})
+                    continue
+                if failed:
+                    self.log_buffer.push({"message": "AI 배치 분석 응답에 오류가 있어 이 배치의 판정은 캐시에 저장하지 않습니다.", "color": "yellow"})
+                for idx, matched in zip(batch, results):
+                    for command in commands:
+                        verdicts[idx][command] = command in matched
+                        if not failed:
+                            self.verdict_cache.put(posts[idx]['keys'][command], command in matched)
+                self.progress.update({
+                    "status": f"AI 재분석 중 ({done}/{len(batches)} 배치)",
+                    "current_page": done,
+                    "total_items": len(batches),
+                    "progress": int(done / len(batches) * 100)
+                })
+                if not self.is_running:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    break
+        self.verdict_cache.save()
+
+        matched_items = []
+        for post, verdict in zip(posts, verdicts):
+            tags = [command for command in commands if verdict.get(command)]
+            if len(commands) > 1:
+                post['item']['ai_tags'] = tags
+            if tags:
+                matched_items.append(post['item'])
+        return matched_items
+
+    def _analyze_uncached(self, batch_posts, batch_size):
+        """캐시에 없는 게시글 배치 분석 (스레드 풀에서 실행)
+
+        Returns:
+            tuple: (게시글별 일치한 명령어 목록, 응답 오류로 False 처리된 배치가 있었는지 여부)
+        """
+        self.ai_generator.pop_failures()
+        results = self._analyze_batch(self.ai_generator, batch_posts, batch_size)
+        return results, self.ai_generator.pop_failures() > 0
+
+    def _finish_reanalysis(self):
+        """재분석 완료 처리 (증분 수집 기준점과 실행 결과는 갱신하지 않음)"""
+        self.log_buffer.push({"message": f"재분석이 완료되었습니다. 총 {self.post_count}개의 게시글이 일치했습니다.", "color": "green"})
+        if self.ai_generator and self.ai_generator.usage['requests']:
+            usage = self.ai_generator.usage_summary()
+            self.log_buffer.push({
+                "message": (f"AI 토큰 사용: 요청 {usage['requests']}건, 입력 {usage['prompt_tokens']:,} "
+                            f"(캐시 {usage['cached_tokens']:,}, {usage['cached_ratio'] * 100:.0f}%), 출력 {usage['completion_tokens']:,}"),
+                "color": "gray"
+            })
+        self._flush_signals()
+        self.tasks_completed.emit(True)